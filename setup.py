@@ -48,10 +48,28 @@ setup(
             'pytest-mock>=3.7.0',
             'pytest-cov>=4.0.0',
             'responses>=0.20.0',
+            'aioresponses>=0.7.4',
+            'pyfakefs>=5.0.0',
+            'pytest-xdist>=3.0.0',
             'black>=22.0.0',
             'flake8>=4.0.0',
             'mypy>=0.950',
         ],
+        'numpy': [
+            'numpy>=1.20.0',
+        ],
+        'async': [
+            'aiohttp>=3.8.0',
+        ],
+        'http2': [
+            'httpx[http2]>=0.23.0',
+        ],
+        'speedups': [
+            'orjson>=3.6.0',
+            'pysimdjson>=5.0.0',
+            'msgspec>=0.18.0',
+            'brotli>=1.0.9',
+        ],
     },
     entry_points={
         'console_scripts': [
@@ -6,6 +6,7 @@ A comprehensive Python library for EVE Online ESI API integration.
 
 from .auth import EVEAuth, TokenManager
 from .esi_client import ESIClient
+from .cache import CacheBackend, MemoryCache, SqliteCache
 from .endpoint_manager import ESIEndpointManager
 from .endpoints import (
     CharacterEndpoint,
@@ -33,11 +34,18 @@ from .endpoints import (
 )
 
 __version__ = "1.0.0"
+__author__ = "EVE Online API Util Contributors"
+__email__ = "your-email@example.com"
+__description__ = "A comprehensive Python library for EVE Online ESI API integration"
 
 __all__ = [
     'EVEAuth',
     'TokenManager',
     'ESIClient',
+    'AsyncESIClient',
+    'CacheBackend',
+    'MemoryCache',
+    'SqliteCache',
     'ESIEndpointManager',
     'CharacterEndpoint',
     'WalletEndpoint',
@@ -63,22 +71,10 @@ __all__ = [
     'BookmarksEndpoint'
 ]
 
-from .auth import EVEAuth, TokenManager
-from .esi_client import ESIClient
-from .endpoints.character import CharacterEndpoint
-from .endpoints.wallet import WalletEndpoint
-from .endpoints.fleet import FleetEndpoint
-
-__version__ = "1.0.0"
-__author__ = "EVE Online API Util Contributors"
-__email__ = "your-email@example.com"
-__description__ = "A comprehensive Python library for EVE Online ESI API integration"
 
-__all__ = [
-    "EVEAuth",
-    "TokenManager", 
-    "ESIClient",
-    "CharacterEndpoint",
-    "WalletEndpoint",
-    "FleetEndpoint",
-]
+def __getattr__(name):
+    # Imported on first access so importing the package does not load aiohttp
+    if name == 'AsyncESIClient':
+        from .async_client import AsyncESIClient
+        return AsyncESIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
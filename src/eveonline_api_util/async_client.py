@@ -0,0 +1,371 @@
+"""
+Asynchronous ESI Client for EVE Online API Integration
+
+This module provides an aiohttp-based client with the same interface as
+ESIClient, except that request methods are coroutines. Endpoint classes
+accept either client: with an AsyncESIClient their methods return
+awaitables, so many calls can be fanned out with asyncio.gather.
+"""
+
+import asyncio
+import time
+import logging
+from array import array
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .auth import EVEAuth
+from .cache import CacheBackend
+from .esi_client import ESIClient, ESIException, _dumps
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncESIClient(ESIClient):
+    """
+    Asynchronous client for EVE Online ESI API.
+
+    Shares URL building, header preparation, caching and response handling
+    with ESIClient, and sends requests through a single lazily created
+    aiohttp.ClientSession that is reused for the lifetime of the client.
+    Token lookups, which may refresh over the network, run in the default
+    executor so they do not block the event loop.
+
+    Example:
+        async with AsyncESIClient() as client:
+            universe = UniverseEndpoint(client)
+            types = await asyncio.gather(*[universe.get_universe_type(t) for t in type_ids])
+    """
+
+    def __init__(self, auth: Optional[EVEAuth] = None, user_agent: Optional[str] = None,
+                 timeout: int = 30, max_retries: int = 3,
+                 cache: Union[CacheBackend, bool, None] = True, backoff_factor: float = 1.0,
+                 limit: int = 100, limit_per_host: int = 20,
+                 static_cache: Union[CacheBackend, bool, None] = None):
+        """
+        Initialize asynchronous ESI Client.
+
+        Args:
+            auth: EVEAuth instance for authentication
+            user_agent: Custom user agent string
+            timeout: Total request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            cache: Cache backend for unauthenticated GET responses; True uses
+                a bounded in-memory cache, None or False disables caching
+            backoff_factor: Base delay in seconds for retry backoff
+            limit: Maximum number of simultaneous connections
+            limit_per_host: Maximum number of simultaneous connections to ESI
+            static_cache: Persistent cache backend for static universe data;
+                True uses a SqliteCache at STATIC_CACHE_PATH
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncESIClient: pip install eveonline-api-util[async]")
+
+        super().__init__(auth, user_agent, timeout, max_retries, cache=cache,
+                         backoff_factor=backoff_factor, static_cache=static_cache)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._aiohttp_session = None
+
+    def _get_aiohttp_session(self) -> 'aiohttp.ClientSession':
+        """Create the shared aiohttp session on first use."""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300
+            )
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': self.user_agent}
+            )
+        return self._aiohttp_session
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        super().close()
+
+    async def __aenter__(self) -> 'AsyncESIClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _load_authorization(self, character_id: Optional[str]) -> None:
+        """
+        Populate the Authorization header cache off the event loop.
+        
+        EVEAuth.get_valid_token is synchronous and may refresh the token over
+        the network, so a stale entry is refreshed in the default executor;
+        _prepare_request then reads the cached value without blocking.
+        
+        Args:
+            character_id: Character ID for authenticated requests
+            
+        Raises:
+            ESIAuthenticationError: If no valid token is available
+        """
+        if not (character_id and self.auth):
+            return
+        cached = self._auth_headers.get(character_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._authorization, character_id)
+    
+    @staticmethod
+    def _encode_params(params: Union[Dict[str, Any], str]) -> Union[Dict[str, Any], str]:
+        """Convert boolean query values, which aiohttp rejects, to ESI's true/false."""
+        if isinstance(params, str):
+            return params
+        return {key: ('true' if value else 'false') if isinstance(value, bool) else value
+                for key, value in params.items()}
+
+    @staticmethod
+    def _to_response(resp: 'aiohttp.ClientResponse', body: bytes) -> requests.Response:
+        """
+        Wrap an aiohttp response in a requests.Response.
+
+        This lets the response handling, caching and retry helpers from
+        ESIClient be reused unchanged.
+
+        Args:
+            resp: aiohttp response
+            body: Response body
+
+        Returns:
+            Equivalent requests.Response object
+        """
+        response = requests.Response()
+        response.status_code = resp.status
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.url = str(resp.url)
+        response.encoding = resp.charset or 'utf-8'
+        response._content = body
+        return response
+
+    async def _send(self, method: str, url: str, headers: Dict[str, str],
+                    params: Union[Dict[str, Any], str], json_data: Optional[Any]) -> requests.Response:
+        """
+        Send a request, retrying throttled and failed responses with backoff.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            params: Query parameters or pre-encoded query string
+            json_data: JSON body
+
+        Returns:
+            Final response object
+
+        Raises:
+            ESIException: On timeout or connection failure
+        """
+        method = method.upper()
+        session = self._get_aiohttp_session()
+        params = self._encode_params(params)
+        body = None if json_data is None else _dumps(json_data)
+        logger.debug(f"Making async {method} request to {url}")
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                delay = self._error_budget_delay()
+                if delay:
+                    await asyncio.sleep(delay)
+
+                async with session.request(method, url, headers=headers, params=params,
+                                           data=body) as resp:
+                    response = self._to_response(resp, await resp.read())
+                self._record_error_limit(response)
+
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                    break
+
+                delay = self._retry_delay(response, attempt)
+                logger.warning(f"{method} {url} returned {response.status_code}, "
+                               f"retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+            return response
+
+        except asyncio.TimeoutError:
+            error_msg = f"Request timeout for {url}"
+            logger.error(error_msg)
+            raise ESIException(error_msg)
+
+        except aiohttp.ClientConnectionError:
+            error_msg = f"Connection error for {url}"
+            logger.error(error_msg)
+            raise ESIException(error_msg)
+
+        except aiohttp.ClientError as e:
+            error_msg = f"Request failed for {url}: {e}"
+            logger.error(error_msg)
+            raise ESIException(error_msg)
+
+    async def request(self, method: str, endpoint: str, character_id: Optional[str] = None,
+                      params: Optional[Union[Dict[str, Any], str]] = None,
+                      json_data: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None, version: str = 'latest') -> Any:
+        """
+        Make an authenticated request to the ESI API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters or pre-encoded query string
+            json_data: JSON data for POST/PUT requests
+            headers: Additional headers
+            version: API version
+
+        Returns:
+            Parsed response data
+
+        Raises:
+            ESIException: For various API errors
+        """
+        await self._load_authorization(character_id)
+        url, request_headers, params, cache_key, cached = self._prepare_request(
+            method, endpoint, character_id, params, headers, version
+        )
+        if cached is not None and cached[1] > time.time():
+            logger.debug(f"Cache hit for {url}")
+            return cached[0]
+
+        response = await self._send(method, url, request_headers, params, json_data)
+        return self._process_response(response, cache_key, cached, character_id)
+
+    async def get_id_array(self, endpoint: str, params: Optional[Union[Dict[str, Any], str]] = None,
+                           headers: Optional[Dict[str, str]] = None, version: str = 'latest') -> array:
+        """
+        Fetch an endpoint returning a list of IDs as a packed int64 array.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters or pre-encoded query string
+            headers: Additional headers
+            version: API version
+
+        Returns:
+            array('q') of IDs
+
+        Raises:
+            ESIException: For various API errors
+        """
+        url, request_headers, params, _, _ = self._prepare_request(
+            'GET', endpoint, None, params, headers, version, use_cache=False
+        )
+        response = await self._send('GET', url, request_headers, params, None)
+        if response.status_code != 200:
+            self._handle_response(response)
+            return array('q')
+        return self._parse_id_array(response.content)
+
+    async def _get_page(self, endpoint: str, character_id: Optional[str], params: Dict[str, Any],
+                        headers: Optional[Dict[str, str]], version: str, page: int) -> Tuple[Any, int]:
+        """
+        Fetch a single page of a paginated endpoint.
+
+        Args:
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters (without page)
+            headers: Additional headers
+            version: API version
+            page: Page number
+
+        Returns:
+            Tuple of (parsed page data, total number of pages)
+        """
+        await self._load_authorization(character_id)
+        url, request_headers, page_params, _, _ = self._prepare_request(
+            'GET', endpoint, character_id, dict(params, page=page), headers, version, use_cache=False
+        )
+        response = await self._send('GET', url, request_headers, page_params, None)
+        data = self._handle_response(response, character_id)
+        return data, int(response.headers.get('X-Pages', 1))
+
+    async def get_paged(self, endpoint: str, character_id: Optional[str] = None,
+                        params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                        version: str = 'latest', max_workers: int = 8) -> List[Any]:
+        """
+        Fetch every page of a paginated endpoint.
+
+        Requests page 1, reads the total page count from the X-Pages header
+        and gathers the remaining pages concurrently.
+
+        Args:
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters (any 'page' entry is ignored)
+            headers: Additional headers
+            version: API version
+            max_workers: Unused; concurrency is bounded by the connector limits
+
+        Returns:
+            Concatenated list of items from all pages, in page order
+        """
+        params = {k: v for k, v in (params or {}).items() if k != 'page'}
+        first, pages = await self._get_page(endpoint, character_id, params, headers, version, 1)
+        results = list(first or [])
+
+        remaining = await asyncio.gather(*[
+            self._get_page(endpoint, character_id, params, headers, version, page)
+            for page in range(2, pages + 1)
+        ])
+        for data, _ in remaining:
+            results.extend(data or [])
+
+        return results
+    
+    async def get_universe_types(self, type_ids: list, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Get information about universe types.
+        
+        Lists longer than NAMES_BATCH_SIZE are split into batches that are
+        gathered concurrently.
+        
+        Args:
+            type_ids: List of type IDs
+            max_workers: Unused; concurrency is bounded by the connector limits
+            
+        Returns:
+            Type information, in batch order
+        """
+        results = await asyncio.gather(*[
+            self.post('/universe/names/', json_data=batch) for batch in self._names_batches(type_ids)
+        ])
+        return [item for result in results for item in result or []]
+    
+    async def iter_universe_types(self, type_ids: list) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily yield information about universe types.
+        
+        Batches are posted one at a time as the iterator is consumed, so
+        only a single NAMES_BATCH_SIZE response is held in memory.
+        
+        Args:
+            type_ids: List of type IDs
+            
+        Yields:
+            Type information, in batch order
+        """
+        for batch in self._names_batches(type_ids):
+            for item in await self.post('/universe/names/', json_data=batch) or []:
+                yield item
@@ -8,15 +8,37 @@ token refresh, and secure token storage for EVE Online ESI API access.
 import json
 import os
 import time
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from urllib.parse import parse_qs, urlparse
 import logging
 
 from requests_oauthlib import OAuth2Session
 import requests
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
+if msgspec is not None:
+    _DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+    
+    def _decode(data: bytes) -> Any:
+        return msgspec.json.decode(data)
+    
+    def _encode(obj: Any) -> bytes:
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2)
+else:  # pragma: no cover - exercised without msgspec installed
+    _DECODE_ERRORS = (ValueError,)
+    
+    def _decode(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 
 class TokenManager:
     """
@@ -42,13 +64,17 @@ class TokenManager:
     def _load_tokens(self) -> None:
         """Load tokens from file storage."""
         try:
-            with open(self.token_file, 'r') as f:
-                self._tokens = json.load(f)
+            with open(self.token_file, 'rb') as f:
+                self._tokens = _decode(f.read())
             logger.info(f"Loaded tokens from {self.token_file}")
-        except (json.JSONDecodeError, IOError) as e:
+        except _DECODE_ERRORS + (IOError,) as e:
             logger.warning(f"Failed to load tokens: {e}")
             self._tokens = {}
     
+    def _serialize(self) -> bytes:
+        """Return the stored tokens encoded as they are written to the token file."""
+        return _encode(self._tokens)
+    
     def _save_tokens(self) -> None:
         """Save tokens to file storage."""
         if not self.token_file:
@@ -56,8 +82,8 @@ class TokenManager:
             
         try:
             os.makedirs(os.path.dirname(self.token_file), exist_ok=True)
-            with open(self.token_file, 'w') as f:
-                json.dump(self._tokens, f, indent=2)
+            with open(self.token_file, 'wb') as f:
+                f.write(self._serialize())
             logger.info(f"Saved tokens to {self.token_file}")
         except IOError as e:
             logger.error(f"Failed to save tokens: {e}")
@@ -104,21 +130,40 @@ class TokenManager:
             return True
         return False
     
-    def is_token_expired(self, token: Dict[str, Any], buffer_seconds: int = 300) -> bool:
+    def is_token_expired(self, token: Dict[str, Any], buffer_seconds: int = 300,
+                         now: Optional[float] = None) -> bool:
         """
         Check if a token is expired or will expire soon.
         
         Args:
             token: Token dictionary
             buffer_seconds: Consider token expired if it expires within this buffer
+            now: Current Unix time; read from the clock if omitted
             
         Returns:
             True if token is expired or will expire soon
         """
         if 'expires_at' not in token:
             return True
+        
+        if now is None:
+            now = time.time()
+        return now + buffer_seconds >= token['expires_at']
+    
+    def expired_mask(self, character_ids: List[str], buffer_seconds: int = 300) -> List[bool]:
+        """
+        Check several stored tokens for expiry against a single clock reading.
+        
+        Args:
+            character_ids: Character IDs with stored tokens
+            buffer_seconds: Consider token expired if it expires within this buffer
             
-        return time.time() + buffer_seconds >= token['expires_at']
+        Returns:
+            List of expiry flags in the same order as character_ids
+        """
+        now = time.time()
+        return [self.is_token_expired(self._tokens[character_id], buffer_seconds, now)
+                for character_id in character_ids]
     
     def list_characters(self) -> list:
         """
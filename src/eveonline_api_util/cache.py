@@ -0,0 +1,158 @@
+"""
+Response cache backends for the EVE Online ESI API client
+
+This module provides pluggable cache backends used by ESIClient to store
+parsed responses together with their expiry time and ETag. The in-memory
+backend serves a single process, while the SQLite backend can be shared
+between processes (cron jobs, workers) on the same machine.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (data, expires_at, etag) - expires_at is a Unix timestamp
+CacheEntry = Tuple[Any, float, Optional[str]]
+
+
+def _shallow_copy(data: Any) -> Any:
+    """Copy a top-level list or dict so callers cannot resize the cached one."""
+    return data.copy() if isinstance(data, (list, dict)) else data
+
+
+class CacheBackend(Protocol):
+    """Interface implemented by ESIClient cache backends."""
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached (data, expires_at, etag) entry for key, if any."""
+        ...
+
+    def set(self, key: str, data: Any, expires_at: float, etag: Optional[str] = None) -> None:
+        """Store data for key along with its expiry timestamp and ETag."""
+        ...
+
+
+class MemoryCache:
+    """
+    In-process LRU cache backend.
+
+    Expired entries are still returned so that their ETag can be used to
+    revalidate them; the least recently used entry is evicted once maxsize
+    is reached. Lists and dicts are shallow-copied on the way in and out,
+    so callers may add, remove or reorder items; the records inside them
+    are shared and must not be mutated.
+    """
+
+    DEFAULT_MAXSIZE = 4096
+
+    def __init__(self, maxsize: Optional[int] = DEFAULT_MAXSIZE):
+        """
+        Initialize an empty in-memory cache.
+
+        Args:
+            maxsize: Maximum number of entries, or None for no limit
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return _shallow_copy(entry[0]), entry[1], entry[2]
+
+    def set(self, key: str, data: Any, expires_at: float, etag: Optional[str] = None) -> None:
+        """Store an entry for key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (_shallow_copy(data), expires_at, etag)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCache:
+    """
+    SQLite-backed cache backend shared across processes.
+
+    Uses WAL journaling so concurrent readers in other processes are not
+    blocked by a writer. Data is stored as JSON text.
+    """
+
+    DEFAULT_PATH = '.esi_cache.sqlite3'
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize SQLite cache.
+
+        Args:
+            path: Database file path. Defaults to '.esi_cache.sqlite3' in the
+                current working directory.
+        """
+        self.path = path or self.DEFAULT_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS esi_cache ('
+                'key TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL, etag TEXT)'
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for key, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, expires_at, etag FROM esi_cache WHERE key = ?', (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0]), row[1], row[2]
+        except ValueError as e:
+            logger.warning(f"Discarding corrupt cache entry for {key}: {e}")
+            return None
+
+    def set(self, key: str, data: Any, expires_at: float, etag: Optional[str] = None) -> None:
+        """Store an entry for key."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO esi_cache (key, data, expires_at, etag) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(data), expires_at, etag)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute('DELETE FROM esi_cache')
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -6,10 +6,12 @@ including authentication, token management, and endpoint access.
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
 import logging
+import threading
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -18,7 +20,6 @@ from .auth import EVEAuth, TokenManager
 from .esi_client import ESIClient, ESIException
 from .endpoints.character import CharacterEndpoint
 from .endpoints.wallet import WalletEndpoint
-from .endpoints.fleet import FleetEndpoint
 
 
 def setup_logging(level: str = 'INFO') -> None:
@@ -29,9 +30,37 @@ def setup_logging(level: str = 'INFO') -> None:
     )
 
 
+_dotenv_lock = threading.Lock()
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file on the first call only."""
+    global _dotenv_loaded
+    with _dotenv_lock:
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+
+
+def reset_dotenv_cache() -> None:
+    """Make the next configuration load read the .env file and environment again."""
+    global _dotenv_loaded
+    with _dotenv_lock:
+        _dotenv_loaded = False
+    load_config.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load configuration from environment variables."""
-    load_dotenv()
+    """
+    Load configuration from environment variables.
+    
+    The result is parsed once per process; call reset_dotenv_cache()
+    after changing the environment or .env file to reload it. The
+    returned dict is shared and must not be mutated.
+    """
+    _load_dotenv_once()
     
     config = {
         'client_id': os.getenv('EVE_CLIENT_ID'),
@@ -93,10 +122,9 @@ def cmd_list_tokens(args) -> None:
         return
     
     print("Stored character tokens:")
-    for char_id in characters:
+    for char_id, expired in zip(characters, token_manager.expired_mask(characters)):
         token = token_manager.get_token(char_id)
         char_name = token.get('CharacterName', 'Unknown')
-        expired = token_manager.is_token_expired(token)
         status = "EXPIRED" if expired else "VALID"
         print(f"  - {char_name} (ID: {char_id}) - {status}")
 
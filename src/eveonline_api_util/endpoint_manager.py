@@ -5,11 +5,12 @@ This module provides a convenient way to access all ESI endpoints
 through a single interface.
 """
 
-from typing import Optional
+from typing import Optional, Union
 import logging
 
 from .auth import EVEAuth, TokenManager
 from .esi_client import ESIClient
+from .cache import CacheBackend
 from .endpoints import (
     CharacterEndpoint,
     WalletEndpoint,
@@ -47,7 +48,8 @@ class ESIEndpointManager:
     """
     
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
-                 user_agent: Optional[str] = None, token_file: Optional[str] = None):
+                 user_agent: Optional[str] = None, token_file: Optional[str] = None,
+                 cache: Union[CacheBackend, bool, None] = True):
         """
         Initialize the endpoint manager.
         
@@ -57,10 +59,12 @@ class ESIEndpointManager:
             redirect_uri: OAuth2 redirect URI
             user_agent: Custom user agent string
             token_file: Optional file path for token storage
+            cache: Cache backend shared with the ESI client; True uses a
+                bounded in-memory cache, None or False disables caching
         """
         self.token_manager = TokenManager(token_file)
         self.authenticator = EVEAuth(client_id, client_secret, redirect_uri, [], self.token_manager)
-        self.client = ESIClient(self.authenticator, user_agent)
+        self.client = ESIClient(self.authenticator, user_agent, cache=cache)
         
         # Initialize all endpoints
         self.character = CharacterEndpoint(self.client)
@@ -86,7 +90,7 @@ class ESIEndpointManager:
         self.calendar = CalendarEndpoint(self.client)
         self.bookmarks = BookmarksEndpoint(self.client)
         
-        logger.info("Initialized ESIEndpointManager with all endpoints")
+        logger.debug("Initialized ESIEndpointManager with all endpoints")
     
     def authenticate(self, scopes: list) -> str:
         """
@@ -29,7 +29,7 @@ class AllianceEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized AllianceEndpoint")
+        logger.debug("Initialized AllianceEndpoint")
     
     def get_alliances(self) -> List[int]:
         """
@@ -29,7 +29,7 @@ class AssetsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized AssetsEndpoint")
+        logger.debug("Initialized AssetsEndpoint")
     
     def get_character_assets(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
         """
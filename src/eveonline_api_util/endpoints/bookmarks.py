@@ -29,7 +29,7 @@ class BookmarksEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized BookmarksEndpoint")
+        logger.debug("Initialized BookmarksEndpoint")
     
     def get_character_bookmarks(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
         """
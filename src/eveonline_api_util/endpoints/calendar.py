@@ -29,7 +29,7 @@ class CalendarEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized CalendarEndpoint")
+        logger.debug("Initialized CalendarEndpoint")
     
     def get_character_calendar(self, character_id: str, from_event: Optional[int] = None) -> List[Dict[str, Any]]:
         """
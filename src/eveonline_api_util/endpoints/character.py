@@ -29,7 +29,7 @@ class CharacterEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized CharacterEndpoint")
+        logger.debug("Initialized CharacterEndpoint")
     
     def get_character_public_info(self, character_id: int) -> Dict[str, Any]:
         """
@@ -29,7 +29,7 @@ class ContractsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized ContractsEndpoint")
+        logger.debug("Initialized ContractsEndpoint")
     
     def get_character_contracts(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
         """
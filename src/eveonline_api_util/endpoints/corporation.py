@@ -29,7 +29,7 @@ class CorporationEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized CorporationEndpoint")
+        logger.debug("Initialized CorporationEndpoint")
     
     def get_corporation_info(self, corporation_id: int) -> Dict[str, Any]:
         """
@@ -29,7 +29,7 @@ class DogmaEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized DogmaEndpoint")
+        logger.debug("Initialized DogmaEndpoint")
     
     def get_dogma_attributes(self) -> List[int]:
         """
@@ -28,7 +28,7 @@ class FittingsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized FittingsEndpoint")
+        logger.debug("Initialized FittingsEndpoint")
     
     def get_character_fittings(self, character_id: str) -> List[Dict[str, Any]]:
         """
@@ -29,7 +29,7 @@ class FleetEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized FleetEndpoint")
+        logger.debug("Initialized FleetEndpoint")
     
     def get_character_fleet_info(self, character_id: str) -> Dict[str, Any]:
         """
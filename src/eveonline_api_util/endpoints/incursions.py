@@ -27,7 +27,7 @@ class IncursionsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized IncursionsEndpoint")
+        logger.debug("Initialized IncursionsEndpoint")
     
     def get_incursions(self) -> List[Dict[str, Any]]:
         """
@@ -12,6 +12,12 @@ from ..esi_client import ESIClient
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded query strings for the include_completed flag
+_INCLUDE_COMPLETED_QUERY = {
+    False: 'include_completed=false',
+    True: 'include_completed=true',
+}
+
 
 class IndustryEndpoint:
     """
@@ -29,7 +35,7 @@ class IndustryEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized IndustryEndpoint")
+        logger.debug("Initialized IndustryEndpoint")
     
     def get_character_industry_jobs(self, character_id: str, include_completed: bool = False) -> List[Dict[str, Any]]:
         """
@@ -43,7 +49,7 @@ class IndustryEndpoint:
             List of character's industry jobs
         """
         endpoint = f'/characters/{character_id}/industry/jobs/'
-        params = {'include_completed': include_completed}
+        params = _INCLUDE_COMPLETED_QUERY[bool(include_completed)]
         return self.client.get(endpoint, character_id=character_id, params=params)
     
     def get_character_mining(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
@@ -76,7 +82,7 @@ class IndustryEndpoint:
             List of corporation's industry jobs
         """
         endpoint = f'/corporations/{corporation_id}/industry/jobs/'
-        params = {'include_completed': include_completed, 'page': page}
+        params = f'{_INCLUDE_COMPLETED_QUERY[bool(include_completed)]}&page={int(page)}'
         return self.client.get(endpoint, character_id=character_id, params=params)
     
     def get_corporation_mining_extractions(self, corporation_id: int, character_id: str,
@@ -7,7 +7,7 @@ This module provides access to insurance-related endpoints.
 from typing import Dict, Any, Optional, List
 import logging
 
-from ..esi_client import ESIClient
+from ..esi_client import ESIClient, language_headers
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class InsuranceEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized InsuranceEndpoint")
+        logger.debug("Initialized InsuranceEndpoint")
     
     def get_insurance_prices(self, accept_language: str = 'en') -> List[Dict[str, Any]]:
         """
@@ -39,5 +39,5 @@ class InsuranceEndpoint:
         Returns:
             List of insurance prices for ship types
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get('/insurance/prices/', headers=headers)
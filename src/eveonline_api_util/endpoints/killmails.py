@@ -29,7 +29,7 @@ class KillmailsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized KillmailsEndpoint")
+        logger.debug("Initialized KillmailsEndpoint")
     
     def get_character_killmails_recent(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -29,7 +29,7 @@ class LocationsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized LocationsEndpoint")
+        logger.debug("Initialized LocationsEndpoint")
     
     def get_character_location(self, character_id: str) -> Dict[str, Any]:
         """
@@ -29,7 +29,7 @@ class MailEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized MailEndpoint")
+        logger.debug("Initialized MailEndpoint")
     
     def get_character_mail(self, character_id: str, labels: Optional[List[int]] = None,
                           last_mail_id: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -45,11 +45,12 @@ class MailEndpoint:
             List of character's mail
         """
         endpoint = f'/characters/{character_id}/mail/'
-        params = {}
+        query = []
         if labels:
-            params['labels'] = ','.join(map(str, labels))
+            query.append('labels=' + '%2C'.join(str(int(label)) for label in labels))
         if last_mail_id:
-            params['last_mail_id'] = last_mail_id
+            query.append(f'last_mail_id={int(last_mail_id)}')
+        params = '&'.join(query)
         return self.client.get(endpoint, character_id=character_id, params=params)
     
     def get_character_mail_labels(self, character_id: str) -> Dict[str, Any]:
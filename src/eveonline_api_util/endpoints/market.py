@@ -6,12 +6,94 @@ market orders, prices, history, and structure markets.
 """
 
 from typing import Dict, Any, Optional, List
+from urllib.parse import urlencode
 import logging
 
-from ..esi_client import ESIClient
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..esi_client import ESIClient, _then
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded query strings for the common order types
+_ORDER_TYPE_QUERY = {order_type: f'order_type={order_type}' for order_type in ('all', 'buy', 'sell')}
+
+# Structured dtypes for the NumPy variants of the market endpoints
+MARKET_HISTORY_DTYPE = [
+    ('date', 'U10'),
+    ('highest', 'f8'),
+    ('lowest', 'f8'),
+    ('average', 'f8'),
+    ('volume', 'i8'),
+    ('order_count', 'i4'),
+]
+
+MARKET_ORDER_DTYPE = [
+    ('order_id', 'i8'),
+    ('type_id', 'i4'),
+    ('location_id', 'i8'),
+    ('system_id', 'i4'),
+    ('is_buy_order', '?'),
+    ('price', 'f8'),
+    ('volume_remain', 'i8'),
+    ('volume_total', 'i8'),
+    ('min_volume', 'i8'),
+    ('duration', 'i4'),
+    ('issued', 'U20'),
+    ('range', 'U12'),
+]
+
+CHARACTER_ORDER_HISTORY_DTYPE = [
+    ('order_id', 'i8'),
+    ('type_id', 'i4'),
+    ('region_id', 'i4'),
+    ('location_id', 'i8'),
+    ('is_buy_order', '?'),
+    ('is_corporation', '?'),
+    ('price', 'f8'),
+    ('escrow', 'f8'),
+    ('volume_remain', 'i8'),
+    ('volume_total', 'i8'),
+    ('min_volume', 'i8'),
+    ('duration', 'i4'),
+    ('issued', 'U20'),
+    ('range', 'U12'),
+    ('state', 'U10'),
+]
+
+# Values used for fields ESI omits from a record
+_FIELD_DEFAULTS = {'?': False, 'f': 0.0, 'i': 0, 'U': ''}
+
+
+def records_to_array(records: Any, dtype: List[tuple]) -> 'np.ndarray':
+    """
+    Convert a list of ESI records into a NumPy structured array.
+    
+    Awaitable results (from AsyncESIClient) are wrapped so the array is
+    built once the response arrives.
+    
+    Args:
+        records: List of dictionaries as returned by ESI, or an awaitable of one
+        dtype: Structured dtype description as a list of (name, format) tuples
+        
+    Returns:
+        Structured array with one row per record (or an awaitable resolving to it)
+        
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for array results: pip install eveonline-api-util[numpy]")
+    
+    fields = [(name, _FIELD_DEFAULTS[fmt[0]]) for name, fmt in dtype]
+    return _then(records, lambda records: np.array(
+        [tuple(record.get(name, default) for name, default in fields) for record in records or ()],
+        dtype=dtype
+    ))
+
 
 class MarketEndpoint:
     """
@@ -29,7 +111,7 @@ class MarketEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized MarketEndpoint")
+        logger.debug("Initialized MarketEndpoint")
     
     def get_character_orders(self, character_id: str) -> List[Dict[str, Any]]:
         """
@@ -59,6 +141,20 @@ class MarketEndpoint:
         params = {'page': page}
         return self.client.get(endpoint, character_id=character_id, params=params)
     
+    def get_character_orders_history_np(self, character_id: str, page: int = 1) -> 'np.ndarray':
+        """
+        Get character's market order history as a NumPy structured array.
+        
+        Args:
+            character_id: Character ID as string
+            page: Page number for pagination
+            
+        Returns:
+            Structured array using CHARACTER_ORDER_HISTORY_DTYPE
+        """
+        return records_to_array(self.get_character_orders_history(character_id, page),
+                                CHARACTER_ORDER_HISTORY_DTYPE)
+    
     def get_corporation_orders(self, corporation_id: int, character_id: str,
                              page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -153,11 +249,29 @@ class MarketEndpoint:
         Returns:
             List of market orders
         """
-        params = {'order_type': order_type, 'page': page}
+        base_query = _ORDER_TYPE_QUERY.get(order_type) or urlencode({'order_type': order_type})
+        params = f'{base_query}&page={int(page)}'
         if type_id:
-            params['type_id'] = type_id
+            params = f'{params}&type_id={int(type_id)}'
         return self.client.get(f'/markets/{region_id}/orders/', params=params)
     
+    def get_market_orders_np(self, region_id: int, order_type: str = 'all',
+                             page: int = 1, type_id: Optional[int] = None) -> 'np.ndarray':
+        """
+        Get market orders for a region as a NumPy structured array.
+        
+        Args:
+            region_id: Region ID
+            order_type: Order type ('all', 'buy', 'sell')
+            page: Page number for pagination
+            type_id: Type ID to filter by (optional)
+            
+        Returns:
+            Structured array using MARKET_ORDER_DTYPE
+        """
+        return records_to_array(self.get_market_orders(region_id, order_type, page, type_id),
+                                MARKET_ORDER_DTYPE)
+    
     def get_market_history(self, region_id: int, type_id: int) -> List[Dict[str, Any]]:
         """
         Get market history for a type in a region.
@@ -171,6 +285,22 @@ class MarketEndpoint:
         """
         return self.client.get(f'/markets/{region_id}/history/', params={'type_id': type_id})
     
+    def get_market_history_np(self, region_id: int, type_id: int) -> 'np.ndarray':
+        """
+        Get market history for a type in a region as a NumPy structured array.
+        
+        Aggregations such as ``arr['volume'].sum()`` run vectorized instead
+        of looping over the list of dictionaries.
+        
+        Args:
+            region_id: Region ID
+            type_id: Type ID
+            
+        Returns:
+            Structured array using MARKET_HISTORY_DTYPE
+        """
+        return records_to_array(self.get_market_history(region_id, type_id), MARKET_HISTORY_DTYPE)
+    
     def get_structure_orders(self, structure_id: int, character_id: str,
                            page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -29,7 +29,7 @@ class SkillsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized SkillsEndpoint")
+        logger.debug("Initialized SkillsEndpoint")
     
     def get_character_attributes(self, character_id: str) -> Dict[str, Any]:
         """
@@ -29,7 +29,7 @@ class SovereigntyEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized SovereigntyEndpoint")
+        logger.debug("Initialized SovereigntyEndpoint")
     
     def get_sovereignty_campaigns(self) -> List[Dict[str, Any]]:
         """
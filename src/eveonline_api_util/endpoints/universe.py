@@ -5,13 +5,137 @@ This module provides access to universe-related endpoints including
 systems, regions, stations, structures, and various game data.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Set, Union
+from array import array
+import asyncio
+import functools
 import logging
 
-from ..esi_client import ESIClient
+from ..esi_client import ESIClient, _gather, _is_async, _then, intern_fields, language_headers
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of IDs accepted by POST /universe/names/
+NAMES_BATCH_SIZE = ESIClient.NAMES_BATCH_SIZE
+
+# Repeated string fields interned in /universe/names/ results
+_NAME_FIELDS = ('category',)
+
+
+def _index_by_id(results: Iterable[Optional[List[Dict[str, Any]]]]) -> Dict[int, Dict[str, Any]]:
+    """Map each entry of a sequence of /universe/names/ results to its ID."""
+    return {entry['id']: entry for result in results for entry in result or []}
+
+
+class BulkResolver:
+    """
+    DataLoader-style batcher for ID to name resolution.
+    
+    Calls to load() made within a short window are coalesced into a single
+    POST /universe/names/ request (up to NAMES_BATCH_SIZE IDs each) and the
+    results fanned back out to the individual callers. Resolved entries are
+    memoized for the lifetime of the resolver.
+    """
+    
+    def __init__(self, endpoint: 'UniverseEndpoint', accept_language: str = 'en',
+                 delay: float = 0.005, batch_size: int = NAMES_BATCH_SIZE):
+        """
+        Initialize bulk resolver.
+        
+        Args:
+            endpoint: UniverseEndpoint used to issue the bulk requests
+            accept_language: Language for results
+            delay: Seconds to wait for more IDs before flushing a batch
+            batch_size: Maximum number of IDs per request
+        """
+        self.endpoint = endpoint
+        self.accept_language = accept_language
+        self.delay = delay
+        self.batch_size = batch_size
+        self._resolved: Dict[int, Dict[str, Any]] = {}
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to running flushes; the event loop only keeps weak ones
+        self._flush_tasks: Set[asyncio.Task] = set()
+    
+    async def load(self, id_: int) -> Dict[str, Any]:
+        """
+        Resolve a single ID, batching it with other concurrent loads.
+        
+        Args:
+            id_: ID to resolve
+            
+        Returns:
+            Resolved entry with 'id', 'name' and 'category'
+            
+        Raises:
+            KeyError: If ESI did not return the ID
+        """
+        if id_ in self._resolved:
+            return self._resolved[id_]
+        
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(id_)
+        if future is None:
+            future = loop.create_future()
+            self._pending[id_] = future
+            if len(self._pending) >= self.batch_size:
+                self._dispatch()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.delay, self._dispatch)
+        
+        return await future
+    
+    async def load_many(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Resolve several IDs, preserving their order.
+        
+        Args:
+            ids: IDs to resolve
+            
+        Returns:
+            List of resolved entries
+        """
+        return list(await asyncio.gather(*(self.load(id_) for id_ in ids)))
+    
+    def _dispatch(self) -> None:
+        """Hand the pending batch off to a flush task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, batch: Dict[int, asyncio.Future]) -> None:
+        """Resolve a batch with one request and complete its futures."""
+        try:
+            completed = _then(self.endpoint.post_universe_names(list(batch), self.accept_language),
+                              functools.partial(self._complete, batch))
+            # None when the endpoint answered synchronously and the batch is already complete
+            if completed is not None:
+                await completed
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+    
+    def _complete(self, batch: Dict[int, asyncio.Future], result: Optional[List[Dict[str, Any]]]) -> None:
+        """Memoize a batch's resolved entries and complete its futures."""
+        for entry in result or []:
+            self._resolved[entry['id']] = entry
+        
+        for id_, future in batch.items():
+            if future.done():
+                continue
+            if id_ in self._resolved:
+                future.set_result(self._resolved[id_])
+            else:
+                future.set_exception(KeyError(id_))
+
 
 class UniverseEndpoint:
     """
@@ -29,7 +153,7 @@ class UniverseEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized UniverseEndpoint")
+        logger.debug("Initialized UniverseEndpoint")
     
     def get_universe_ancestries(self, accept_language: str = 'en') -> List[Dict[str, Any]]:
         """
@@ -41,7 +165,7 @@ class UniverseEndpoint:
         Returns:
             List of ancestries
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get('/universe/ancestries/', headers=headers)
     
     def get_universe_bloodlines(self, accept_language: str = 'en') -> List[Dict[str, Any]]:
@@ -54,7 +178,7 @@ class UniverseEndpoint:
         Returns:
             List of bloodlines
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get('/universe/bloodlines/', headers=headers)
     
     def get_universe_categories(self) -> List[int]:
@@ -77,16 +201,21 @@ class UniverseEndpoint:
         Returns:
             Category information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/categories/{category_id}/', headers=headers)
     
-    def get_universe_constellations(self) -> List[int]:
+    def get_universe_constellations(self, as_array: bool = False) -> Union[List[int], array]:
         """
         Get constellations.
         
+        Args:
+            as_array: Return a packed array('q') instead of a list
+            
         Returns:
             List of constellation IDs
         """
+        if as_array:
+            return self.client.get_id_array('/universe/constellations/')
         return self.client.get('/universe/constellations/')
     
     def get_universe_constellation(self, constellation_id: int, accept_language: str = 'en') -> Dict[str, Any]:
@@ -100,7 +229,7 @@ class UniverseEndpoint:
         Returns:
             Constellation information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/constellations/{constellation_id}/', headers=headers)
     
     def get_universe_factions(self, accept_language: str = 'en') -> List[Dict[str, Any]]:
@@ -113,7 +242,7 @@ class UniverseEndpoint:
         Returns:
             List of factions
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get('/universe/factions/', headers=headers)
     
     def get_universe_graphics(self) -> List[int]:
@@ -137,16 +266,19 @@ class UniverseEndpoint:
         """
         return self.client.get(f'/universe/graphics/{graphic_id}/')
     
-    def get_universe_groups(self, page: int = 1) -> List[int]:
+    def get_universe_groups(self, page: int = 1, fetch_all: bool = False) -> List[int]:
         """
         Get item groups.
         
         Args:
             page: Page number for pagination
+            fetch_all: Fetch every page concurrently and return all entries
             
         Returns:
             List of group IDs
         """
+        if fetch_all:
+            return self.client.get_paged('/universe/groups/')
         params = {'page': page}
         return self.client.get('/universe/groups/', params=params)
     
@@ -161,7 +293,7 @@ class UniverseEndpoint:
         Returns:
             Group information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/groups/{group_id}/', headers=headers)
     
     def get_universe_moons(self, moon_id: int) -> Dict[str, Any]:
@@ -198,16 +330,21 @@ class UniverseEndpoint:
         Returns:
             List of races
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get('/universe/races/', headers=headers)
     
-    def get_universe_regions(self) -> List[int]:
+    def get_universe_regions(self, as_array: bool = False) -> Union[List[int], array]:
         """
         Get regions.
         
+        Args:
+            as_array: Return a packed array('q') instead of a list
+            
         Returns:
             List of region IDs
         """
+        if as_array:
+            return self.client.get_id_array('/universe/regions/')
         return self.client.get('/universe/regions/')
     
     def get_universe_region(self, region_id: int, accept_language: str = 'en') -> Dict[str, Any]:
@@ -221,7 +358,7 @@ class UniverseEndpoint:
         Returns:
             Region information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/regions/{region_id}/', headers=headers)
     
     def get_universe_stargates(self, stargate_id: int) -> Dict[str, Any]:
@@ -276,13 +413,18 @@ class UniverseEndpoint:
             return self.client.get(endpoint, character_id=character_id)
         return self.client.get(endpoint)
     
-    def get_universe_systems(self) -> List[int]:
+    def get_universe_systems(self, as_array: bool = False) -> Union[List[int], array]:
         """
         Get systems.
         
+        Args:
+            as_array: Return a packed array('q') instead of a list
+            
         Returns:
             List of system IDs
         """
+        if as_array:
+            return self.client.get_id_array('/universe/systems/')
         return self.client.get('/universe/systems/')
     
     def get_universe_system(self, system_id: int, accept_language: str = 'en') -> Dict[str, Any]:
@@ -296,19 +438,22 @@ class UniverseEndpoint:
         Returns:
             System information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/systems/{system_id}/', headers=headers)
     
-    def get_universe_types(self, page: int = 1) -> List[int]:
+    def get_universe_types(self, page: int = 1, fetch_all: bool = False) -> List[int]:
         """
         Get types.
         
         Args:
             page: Page number for pagination
+            fetch_all: Fetch every page concurrently and return all entries
             
         Returns:
             List of type IDs
         """
+        if fetch_all:
+            return self.client.get_paged('/universe/types/')
         params = {'page': page}
         return self.client.get('/universe/types/', params=params)
     
@@ -323,7 +468,7 @@ class UniverseEndpoint:
         Returns:
             Type information
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.get(f'/universe/types/{type_id}/', headers=headers)
     
     def post_universe_ids(self, names: List[str], accept_language: str = 'en') -> Dict[str, Any]:
@@ -337,7 +482,7 @@ class UniverseEndpoint:
         Returns:
             Dictionary with resolved IDs
         """
-        headers = {'Accept-Language': accept_language}
+        headers = language_headers(accept_language)
         return self.client.post('/universe/ids/', json_data=names, headers=headers)
     
     def post_universe_names(self, ids: List[int], accept_language: str = 'en') -> List[Dict[str, Any]]:
@@ -351,5 +496,47 @@ class UniverseEndpoint:
         Returns:
             List with resolved names
         """
-        headers = {'Accept-Language': accept_language}
-        return self.client.post('/universe/names/', json_data=ids, headers=headers)
+        headers = language_headers(accept_language)
+        return intern_fields(self.client.post('/universe/names/', json_data=ids, headers=headers),
+                             _NAME_FIELDS)
+    
+    def resolve_many(self, ids: Iterable[int], accept_language: str = 'en') -> Dict[int, Dict[str, Any]]:
+        """
+        Resolve any number of IDs to names with as few requests as possible.
+        
+        IDs are de-duplicated and sent in chunks of NAMES_BATCH_SIZE, one
+        POST /universe/names/ per chunk.
+        
+        Args:
+            ids: IDs to resolve
+            accept_language: Language for results
+            
+        Returns:
+            Dictionary mapping each resolved ID to its entry (an awaitable
+            resolving to it with AsyncESIClient, whose chunks are gathered
+            concurrently)
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [unique_ids[start:start + NAMES_BATCH_SIZE]
+                  for start in range(0, len(unique_ids), NAMES_BATCH_SIZE)]
+        
+        results = [self.post_universe_names(chunk, accept_language) for chunk in chunks]
+        if _is_async(self.client):
+            results = _gather(results)
+        return _then(results, _index_by_id)
+    
+    def bulk_resolver(self, accept_language: str = 'en', delay: float = 0.005) -> BulkResolver:
+        """
+        Create a batcher that coalesces concurrent ID lookups.
+        
+        Intended for use with AsyncESIClient, e.g.
+        ``await asyncio.gather(*[resolver.load(i) for i in ids])``.
+        
+        Args:
+            accept_language: Language for results
+            delay: Seconds to wait for more IDs before sending a batch
+            
+        Returns:
+            BulkResolver bound to this endpoint
+        """
+        return BulkResolver(self, accept_language, delay)
@@ -5,13 +5,25 @@ This module provides access to wallet-related endpoints including
 character and corporation wallet information, transactions, and journal entries.
 """
 
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Optional, List
 import logging
 
-from ..esi_client import ESIClient
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..esi_client import ESIClient, _gather, _is_async, _then, intern_fields
 
 logger = logging.getLogger(__name__)
 
+# Repeated string fields interned in wallet journal results
+_JOURNAL_FIELDS = ('ref_type', 'context_id_type')
+
+# Corporation wallet divisions
+CORPORATION_DIVISIONS = range(1, 8)
+
 
 class WalletEndpoint:
     """
@@ -29,7 +41,7 @@ class WalletEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized WalletEndpoint")
+        logger.debug("Initialized WalletEndpoint")
     
     def get_character_wallet_balance(self, character_id: str) -> float:
         """
@@ -44,20 +56,26 @@ class WalletEndpoint:
         endpoint = f'/characters/{character_id}/wallet/'
         return self.client.get(endpoint, character_id=character_id)
     
-    def get_character_wallet_journal(self, character_id: str, page: int = 1) -> List[Dict[str, Any]]:
+    def get_character_wallet_journal(self, character_id: str, page: int = 1,
+                                     fetch_all: bool = False) -> List[Dict[str, Any]]:
         """
         Get character's wallet journal (requires authentication).
         
         Args:
             character_id: Character ID as string
             page: Page number for pagination
+            fetch_all: Fetch every page concurrently and return all entries
             
         Returns:
             List of wallet journal entries
         """
         endpoint = f'/characters/{character_id}/wallet/journal/'
+        if fetch_all:
+            return intern_fields(self.client.get_paged(endpoint, character_id=character_id),
+                                 _JOURNAL_FIELDS)
         params = {'page': page}
-        return self.client.get(endpoint, character_id=character_id, params=params)
+        return intern_fields(self.client.get(endpoint, character_id=character_id, params=params),
+                             _JOURNAL_FIELDS)
     
     def get_character_wallet_transactions(self, character_id: str, from_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -92,7 +110,8 @@ class WalletEndpoint:
         return self.client.get(endpoint, character_id=character_id)
     
     def get_corporation_wallet_journal(self, corporation_id: int, division: int,
-                                     character_id: str, page: int = 1) -> List[Dict[str, Any]]:
+                                     character_id: str, page: int = 1,
+                                     fetch_all: bool = False) -> List[Dict[str, Any]]:
         """
         Get corporation wallet journal (requires authentication and roles).
         
@@ -101,13 +120,50 @@ class WalletEndpoint:
             division: Wallet division (1-7)
             character_id: Character ID as string (must have corp roles)
             page: Page number for pagination
+            fetch_all: Fetch every page concurrently and return all entries
             
         Returns:
             List of corporation wallet journal entries
         """
         endpoint = f'/corporations/{corporation_id}/wallets/{division}/journal/'
+        if fetch_all:
+            return intern_fields(self.client.get_paged(endpoint, character_id=character_id),
+                                 _JOURNAL_FIELDS)
         params = {'page': page}
-        return self.client.get(endpoint, character_id=character_id, params=params)
+        return intern_fields(self.client.get(endpoint, character_id=character_id, params=params),
+                             _JOURNAL_FIELDS)
+    
+    def fetch_all_corporation_wallets(self, corporation_id: int, character_id: str,
+                                      divisions: Iterable[int] = CORPORATION_DIVISIONS
+                                      ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch every journal page of every corporation wallet division concurrently.
+        
+        Divisions are fetched in parallel (threads for ESIClient, gathered
+        coroutines for AsyncESIClient, in which case an awaitable is
+        returned), and each division fetches its pages in parallel via
+        get_paged.
+        
+        Args:
+            corporation_id: Corporation ID
+            character_id: Character ID as string (must have corp roles)
+            divisions: Wallet divisions to fetch (default 1-7)
+            
+        Returns:
+            Dictionary mapping division to its full wallet journal
+        """
+        divisions = list(divisions)
+        
+        def fetch(division: int) -> List[Dict[str, Any]]:
+            return self.get_corporation_wallet_journal(corporation_id, division, character_id,
+                                                       fetch_all=True)
+        
+        if _is_async(self.client):
+            journals = _gather([fetch(division) for division in divisions])
+        else:
+            with ThreadPoolExecutor(max_workers=max(len(divisions), 1)) as executor:
+                journals = list(executor.map(fetch, divisions))
+        return _then(journals, lambda journals: dict(zip(divisions, journals)))
     
     def get_corporation_wallet_transactions(self, corporation_id: int, division: int,
                                           character_id: str, from_id: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -129,3 +185,55 @@ class WalletEndpoint:
             params['from_id'] = from_id
             
         return self.client.get(endpoint, character_id=character_id, params=params)
+    
+    @staticmethod
+    def journal_to_frame(entries: List[Dict[str, Any]]) -> Dict[str, 'np.ndarray']:
+        """
+        Convert wallet journal entries into columnar NumPy arrays.
+        
+        ref_type strings are interned to integer codes so entries can be
+        grouped and aggregated with vectorized operations.
+        
+        Args:
+            entries: Wallet journal entries as returned by ESI
+            
+        Returns:
+            Dictionary with 'id' (int64), 'amount' and 'balance' (float64),
+            'ref_type_code' (int32) columns and 'ref_types', the ref_type
+            string for each code
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for array results: pip install eveonline-api-util[numpy]")
+        
+        entries = entries or []
+        n = len(entries)
+        codes: Dict[str, int] = {}
+        ref_type_code = np.fromiter(
+            (codes.setdefault(entry.get('ref_type', ''), len(codes)) for entry in entries),
+            dtype=np.int32, count=n
+        )
+        return {
+            'id': np.fromiter((entry['id'] for entry in entries), dtype=np.int64, count=n),
+            'amount': np.fromiter((entry.get('amount', 0.0) for entry in entries), dtype=np.float64, count=n),
+            'balance': np.fromiter((entry.get('balance', 0.0) for entry in entries), dtype=np.float64, count=n),
+            'ref_type_code': ref_type_code,
+            'ref_types': np.array(list(codes), dtype=str),
+        }
+    
+    @staticmethod
+    def sum_by_ref_type(amount: 'np.ndarray', ref_type_code: 'np.ndarray', n_types: int) -> 'np.ndarray':
+        """
+        Total journal amounts per ref_type code.
+        
+        Args:
+            amount: Amount column from journal_to_frame
+            ref_type_code: ref_type_code column from journal_to_frame
+            n_types: Number of ref_type codes (len of 'ref_types')
+            
+        Returns:
+            float64 array of totals indexed by ref_type code
+        """
+        return np.bincount(ref_type_code, weights=amount, minlength=n_types)
@@ -29,7 +29,7 @@ class WarsEndpoint:
             client: ESIClient instance
         """
         self.client = client
-        logger.info("Initialized WarsEndpoint")
+        logger.debug("Initialized WarsEndpoint")
     
     def get_wars(self, max_war_id: Optional[int] = None) -> List[int]:
         """
@@ -58,16 +58,19 @@ class WarsEndpoint:
         """
         return self.client.get(f'/wars/{war_id}/')
     
-    def get_war_killmails(self, war_id: int, page: int = 1) -> List[Dict[str, Any]]:
+    def get_war_killmails(self, war_id: int, page: int = 1, fetch_all: bool = False) -> List[Dict[str, Any]]:
         """
         Get killmails for a war.
         
         Args:
             war_id: War ID
             page: Page number for pagination
+            fetch_all: Fetch every page concurrently and return all entries
             
         Returns:
             List of war killmails
         """
+        if fetch_all:
+            return self.client.get_paged(f'/wars/{war_id}/killmails/')
         params = {'page': page}
         return self.client.get(f'/wars/{war_id}/killmails/', params=params)
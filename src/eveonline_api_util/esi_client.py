@@ -6,19 +6,144 @@ requests to the EVE Online ESI API with automatic error handling,
 rate limiting, and response parsing.
 """
 
+import asyncio
+import os
+import re
+import sys
 import time
+import inspect
+import random
+from array import array
 import logging
-from typing import Dict, Any, Optional, Union
-from urllib.parse import urljoin
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# urllib3, httpx and aiohttp all decode Brotli once either binding is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, br'
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip'
+
+# Transport exceptions mapped to ESIException in ESIClient._send; the httpx
+# transport extends them per client so httpx is only imported when selected
+_TIMEOUT_ERRORS: Tuple[type, ...] = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS: Tuple[type, ...] = (requests.exceptions.ConnectionError,)
+_REQUEST_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException,)
+
 from .auth import EVEAuth
+from .cache import CacheBackend, MemoryCache, SqliteCache
 
 logger = logging.getLogger(__name__)
 
+# Shared, read-only Accept-Language header dicts keyed by language
+_LANG_HEADERS: Dict[str, Dict[str, str]] = {}
+
+
+def language_headers(language: str) -> Dict[str, str]:
+    """
+    Return the Accept-Language header dict for a language.
+    
+    The dict is shared between calls and must not be mutated.
+    
+    Args:
+        language: Language code (e.g. 'en', 'de')
+        
+    Returns:
+        Header dictionary containing Accept-Language
+    """
+    headers = _LANG_HEADERS.get(language)
+    if headers is None:
+        headers = _LANG_HEADERS.setdefault(language, {'Accept-Language': language})
+    return headers
+
+
+def _is_async(client: Any) -> bool:
+    """Return whether a client's request methods are coroutines (AsyncESIClient)."""
+    return inspect.iscoroutinefunction(getattr(client, 'request', None))
+
+
+async def _gather(awaitables: List[Any]) -> List[Any]:
+    """Await several results concurrently, in order."""
+    return list(await asyncio.gather(*awaitables))
+
+
+def _then(result: Any, fn: Callable[[Any], Any]) -> Any:
+    """
+    Apply fn to a request result.
+    
+    Endpoint methods are shared by ESIClient and AsyncESIClient, so a
+    result may be an awaitable; fn is then applied once it resolves and
+    the caller receives an awaitable of fn's return value.
+    
+    Args:
+        result: Request result, or an awaitable of one
+        fn: Function applied to the resolved result
+        
+    Returns:
+        fn(result), or an awaitable resolving to it
+    """
+    if inspect.isawaitable(result):
+        async def _chain() -> Any:
+            return fn(await result)
+        return _chain()
+    return fn(result)
+
+
+def intern_fields(records: Any, fields: Tuple[str, ...]) -> Any:
+    """
+    Intern repeated string fields of a list of records in place.
+    
+    Fields such as ref_type or category take a handful of distinct values
+    across thousands of records; interning makes them share one string
+    object each. Awaitable results (from AsyncESIClient) are wrapped so the
+    fields are interned once the response arrives.
+    
+    Args:
+        records: List of dictionaries as returned by ESI, or an awaitable of one
+        fields: Names of the string fields to intern
+        
+    Returns:
+        The same records (or an awaitable resolving to them)
+    """
+    return _then(records, lambda records: _intern_records(records, fields))
+
+
+def _intern_records(records: Any, fields: Tuple[str, ...]) -> Any:
+    """Intern string fields of already resolved records; see intern_fields."""
+    if not isinstance(records, list):
+        return records
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if type(value) is str:
+                record[field] = sys.intern(value)
+    return records
+
 
 class ESIException(Exception):
     """Base exception for ESI API errors."""
@@ -31,8 +156,16 @@ class ESIAuthenticationError(ESIException):
 
 
 class ESIRateLimitError(ESIException):
-    """Raised when rate limit is exceeded."""
-    pass
+    """
+    Raised when rate limit is exceeded.
+    
+    Attributes:
+        retry_after: Seconds ESI asked the client to wait, if it said
+    """
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class ESIServerError(ESIException):
@@ -50,10 +183,37 @@ class ESIClient:
     
     BASE_URL = 'https://esi.evetech.net'
     DEFAULT_DATASOURCE = 'tranquility'
+    DATASOURCE_QUERY = f'datasource={DEFAULT_DATASOURCE}'
     DEFAULT_USER_AGENT = 'EVE-Online-API-Util/1.0.0'
+    DEFAULT_HEADERS = {
+        'Accept': 'application/json',
+        'Content-Type': 'application/json'
+    }
+    
+    # Status codes retried with jittered exponential backoff (error limit, rate limit, VIP mode)
+    RETRY_STATUS_CODES = frozenset({420, 429, 500, 502, 503, 504})
+    MAX_BACKOFF = 60.0
+    # Hold requests back until the error window resets once fewer errors remain
+    ERROR_LIMIT_FLOOR = 20
+    # Seconds an Authorization header is reused before asking EVEAuth again;
+    # kept well below TokenManager's 300s refresh buffer
+    TOKEN_CACHE_TTL = 60.0
+    # Maximum number of IDs ESI accepts in one POST /universe/names/ request
+    NAMES_BATCH_SIZE = 1000
+    
+    # Static universe data that only changes with game patches; routed to static_cache
+    STATIC_ENDPOINTS = re.compile(
+        r'/universe/(categories|groups|types|regions|constellations|systems|'
+        r'races|bloodlines|ancestries|factions)/'
+    )
+    STATIC_CACHE_PATH = os.path.join('~', '.cache', 'eveonline_api_util', 'static.sqlite3')
     
     def __init__(self, auth: Optional[EVEAuth] = None, user_agent: Optional[str] = None,
-                 timeout: int = 30, max_retries: int = 3):
+                 timeout: int = 30, max_retries: int = 3,
+                 cache: Union[CacheBackend, bool, None] = True, backoff_factor: float = 1.0,
+                 pool_connections: int = 32, pool_maxsize: int = 64,
+                 transport: str = 'requests',
+                 static_cache: Union[CacheBackend, bool, None] = None):
         """
         Initialize ESI Client.
         
@@ -62,47 +222,158 @@ class ESIClient:
             user_agent: Custom user agent string
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            cache: Cache backend for unauthenticated GET responses (e.g.
+                MemoryCache or SqliteCache). True uses a bounded in-memory
+                LRU cache; None or False disables caching.
+            backoff_factor: Base delay in seconds for retry backoff
+            pool_connections: Number of connection pools to cache
+            pool_maxsize: Maximum number of connections kept alive per pool, sized
+                so concurrent callers reuse TLS connections instead of reconnecting
+            transport: 'requests' (HTTP/1.1) or 'httpx' (HTTP/2, multiplexes
+                concurrent requests over a single connection)
+            static_cache: Persistent cache backend for static universe data
+                (STATIC_ENDPOINTS), so later runs skip the download. True uses
+                a SqliteCache at STATIC_CACHE_PATH; None disables it.
+            
+        Raises:
+            ValueError: If transport is not supported
+            ImportError: If the httpx transport is requested but not installed
         """
+        if transport not in ('requests', 'httpx'):
+            raise ValueError(f"Unsupported transport: {transport}")
         self.auth = auth
         self.timeout = timeout
-        self.session = requests.Session()
+        if cache is True:
+            cache = MemoryCache()
+        self.cache = None if cache is False else cache
+        # Backends created here are closed by close(); caller-supplied ones are not
+        self._owns_static_cache = static_cache is True
+        if static_cache is True:
+            static_cache = SqliteCache(os.path.expanduser(self.STATIC_CACHE_PATH))
+        self.static_cache = None if static_cache is False else static_cache
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._auth_headers: Dict[str, Tuple[str, float]] = {}
+        # Last seen error budget, shared by every thread/task using this client
+        self._error_remaining: Optional[int] = None
+        self._error_reset_at = 0.0
+        # In-flight GETs keyed by (character_id, cache key); concurrent
+        # identical requests wait on the first one instead of resending it
+        self._inflight: Dict[Tuple[Optional[str], str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._version_prefixes: Dict[str, str] = {'latest': f'{self.BASE_URL}/latest'}
+        self.user_agent = user_agent or self.DEFAULT_USER_AGENT
+        # Complete per-request headers, also installed as the requests session
+        # defaults. Frozen so the unauthenticated path can hand out the same
+        # mapping every time
+        self._base_headers = MappingProxyType({
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            **self.DEFAULT_HEADERS
+        })
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        
+        self.transport = transport
+        self._httpx_client = None
+        self._timeout_errors = _TIMEOUT_ERRORS
+        self._connection_errors = _CONNECTION_ERRORS
+        self._request_errors = _REQUEST_ERRORS
+        if transport == 'httpx':
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("httpx is required for the HTTP/2 transport: "
+                                  "pip install eveonline-api-util[http2]") from None
+            self._timeout_errors += (httpx.TimeoutException,)
+            self._connection_errors += (httpx.TransportError,)
+            self._request_errors += (httpx.HTTPError,)
+            limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+            self._httpx_client = httpx.Client(
+                transport=httpx.HTTPTransport(http2=True, retries=max_retries, limits=limits),
+                timeout=timeout,
+                # HTTP/2 forbids connection-specific headers such as Connection: keep-alive
+                headers={'User-Agent': self.user_agent, 'Accept-Encoding': ACCEPT_ENCODING}
+            )
         
-        # Set user agent
-        user_agent = user_agent or self.DEFAULT_USER_AGENT
-        self.session.headers.update({'User-Agent': user_agent})
+        # Status code -> response handler; other 5xx codes use _server_error
+        self._status_handlers: Dict[int, Callable[[requests.Response], Any]] = {
+            200: self._ok,
+            204: self._no_content,
+            304: self._not_modified,
+            400: self._bad_request,
+            401: self._unauthorized,
+            403: self._forbidden,
+            404: self._not_found,
+            420: self._error_limited,
+            429: self._rate_limited,
+        }
         
-        # Configure retry strategy
+        logger.debug("Initialized ESI Client")
+    
+    @property
+    def session(self) -> requests.Session:
+        """requests session, created on first use so constructing a client stays cheap."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+    
+    def _build_session(self) -> requests.Session:
+        """
+        Create the pooled requests session.
+        
+        Returns:
+            Session with keep-alive headers and a retrying HTTPS adapter
+        """
+        session = requests.Session()
+        # Unauthenticated requests send headers=None and use these as-is,
+        # skipping requests' per-call merge of session and request headers
+        session.headers = CaseInsensitiveDict(self._base_headers)
+        
+        # Configure retry strategy for connection errors; status codes are
+        # retried in request() so Retry-After and the ESI error limit are honored
         retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=None,
+            respect_retry_after_header=False,
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        logger.info("Initialized ESI Client")
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False
+        )
+        session.mount("https://", adapter)
+        return session
     
     def _build_url(self, endpoint: str, version: str = 'latest') -> str:
         """
         Build full URL for ESI endpoint.
         
         Args:
-            endpoint: API endpoint path
+            endpoint: ESI-relative endpoint path (e.g. '/status/'), not a full URL
             version: API version (default: 'latest')
             
         Returns:
             Full URL string
         """
+        prefix = self._version_prefixes.get(version)
+        if prefix is None:
+            prefix = self._version_prefixes.setdefault(version, f'{self.BASE_URL}/{version}')
+        
         if not endpoint.startswith('/'):
-            endpoint = '/' + endpoint
-            
-        return urljoin(self.BASE_URL, f'/{version}{endpoint}')
+            return prefix + '/' + endpoint
+        return prefix + endpoint
     
     def _prepare_headers(self, character_id: Optional[str] = None, 
-                        additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+                        additional_headers: Optional[Dict[str, str]] = None) -> Mapping[str, str]:
         """
         Prepare request headers including authentication.
         
@@ -111,31 +382,62 @@ class ESIClient:
             additional_headers: Additional headers to include
             
         Returns:
-            Dictionary of headers
+            Dictionary of headers; the shared read-only base headers when
+            there is nothing to add
         """
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
+        if not additional_headers and not (character_id and self.auth):
+            return self._base_headers
+        
+        headers = dict(self._base_headers)
         
         if character_id and self.auth:
-            access_token = self.auth.get_valid_token(character_id)
-            if access_token:
-                headers['Authorization'] = f'Bearer {access_token}'
-            else:
-                raise ESIAuthenticationError(f"No valid token for character {character_id}")
+            headers['Authorization'] = self._authorization(character_id)
         
         if additional_headers:
             headers.update(additional_headers)
             
         return headers
     
-    def _handle_response(self, response: requests.Response) -> Any:
+    def _authorization(self, character_id: str) -> str:
+        """
+        Get the Authorization header value for a character.
+        
+        The value is reused for TOKEN_CACHE_TTL seconds so loops over many
+        authenticated calls do not look up (and check the expiry of) the
+        stored token on every request.
+        
+        Args:
+            character_id: Character ID
+            
+        Returns:
+            Bearer authorization header value
+            
+        Raises:
+            ESIAuthenticationError: If no valid token is available
+        """
+        cached = self._auth_headers.get(character_id)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        access_token = self.auth.get_valid_token(character_id)
+        if not access_token:
+            self._auth_headers.pop(character_id, None)
+            raise ESIAuthenticationError(f"No valid token for character {character_id}")
+        
+        authorization = f'Bearer {access_token}'
+        self._auth_headers[character_id] = (authorization, now + self.TOKEN_CACHE_TTL)
+        return authorization
+    
+    def _handle_response(self, response: requests.Response,
+                         character_id: Optional[str] = None) -> Any:
         """
         Handle API response and parse JSON.
         
         Args:
             response: Requests response object
+            character_id: Character the request was authenticated as; its
+                cached Authorization header is dropped if ESI rejects it
             
         Returns:
             Parsed JSON data
@@ -144,67 +446,392 @@ class ESIClient:
             ESIException: For various API errors
         """
         # Log rate limit headers
-        if 'X-ESI-Error-Limit-Remain' in response.headers:
+        if logger.isEnabledFor(logging.DEBUG) and 'X-ESI-Error-Limit-Remain' in response.headers:
             remaining = response.headers.get('X-ESI-Error-Limit-Remain')
             reset_time = response.headers.get('X-ESI-Error-Limit-Reset')
             logger.debug(f"ESI Error limit remaining: {remaining}, resets at: {reset_time}")
         
-        # Handle different status codes
-        if response.status_code == 200:
+        if response.status_code == 401 and character_id is not None:
+            # The token was rejected or revoked; look it up again next time
+            self._auth_headers.pop(character_id, None)
+        
+        handler = self._status_handlers.get(response.status_code)
+        if handler is None:
+            handler = self._server_error if response.status_code >= 500 else self._unexpected
+        return handler(response)
+    
+    def _ok(self, response: requests.Response) -> Any:
+        """Parse a 200 response body, falling back to text for non-JSON bodies."""
+        # Parse the raw bytes; response.text would decode the whole body first
+        content = response.content
+        try:
+            return _loads(content) if content else None
+        except ValueError:
+            return response.text
+    
+    def _no_content(self, response: requests.Response) -> None:
+        """Handle a 204 response."""
+        return None
+    
+    def _not_modified(self, response: requests.Response) -> None:
+        """Handle a 304 response."""
+        logger.debug("Data not modified (304)")
+        return None
+    
+    def _bad_request(self, response: requests.Response) -> Any:
+        """Raise for a 400 response."""
+        error_msg = f"Bad request: {response.text}"
+        logger.error(error_msg)
+        raise ESIException(error_msg)
+    
+    def _unauthorized(self, response: requests.Response) -> Any:
+        """Raise for a 401 response."""
+        error_msg = "Authentication failed"
+        logger.error(error_msg)
+        raise ESIAuthenticationError(error_msg)
+    
+    def _forbidden(self, response: requests.Response) -> Any:
+        """Raise for a 403 response."""
+        error_msg = f"Forbidden: {response.text}"
+        logger.error(error_msg)
+        raise ESIException(error_msg)
+    
+    def _not_found(self, response: requests.Response) -> Any:
+        """Raise for a 404 response."""
+        error_msg = f"Not found: {response.url}"
+        logger.warning(error_msg)
+        raise ESIException(error_msg)
+    
+    def _error_limited(self, response: requests.Response) -> Any:
+        """Raise for a 420 response."""
+        error_msg = "Error limit exceeded"
+        logger.error(error_msg)
+        raise ESIRateLimitError(error_msg, retry_after=self._retry_after(response))
+    
+    def _rate_limited(self, response: requests.Response) -> Any:
+        """Raise for a 429 response."""
+        error_msg = "Rate limit exceeded"
+        logger.error(error_msg)
+        raise ESIRateLimitError(error_msg, retry_after=self._retry_after(response))
+    
+    def _server_error(self, response: requests.Response) -> Any:
+        """Raise for a 5xx response."""
+        error_msg = f"Server error ({response.status_code}): {response.text}"
+        logger.error(error_msg)
+        raise ESIServerError(error_msg)
+    
+    def _unexpected(self, response: requests.Response) -> Any:
+        """Raise for any other status code."""
+        error_msg = f"Unexpected status code {response.status_code}: {response.text}"
+        logger.error(error_msg)
+        raise ESIException(error_msg)
+    
+    @staticmethod
+    def _cache_key(url: str, params: Union[Dict[str, Any], str],
+                   headers: Optional[Dict[str, str]]) -> str:
+        """
+        Build the cache key for a GET request.
+        
+        Args:
+            url: Full request URL
+            params: Query parameters or pre-encoded query string
+            headers: Caller-supplied headers (Accept-Language varies the response)
+            
+        Returns:
+            Cache key string
+        """
+        query = params if isinstance(params, str) else urlencode(sorted(params.items()))
+        key = f'{url}?{query}'
+        language = (headers or {}).get('Accept-Language')
+        if language:
+            key = f'{key}|{language}'
+        return key
+    
+    @staticmethod
+    def _cache_expiry(response: requests.Response) -> float:
+        """
+        Determine when a response expires from its caching headers.
+        
+        Args:
+            response: Requests response object
+            
+        Returns:
+            Expiry as a Unix timestamp (now if the response is not cacheable)
+        """
+        now = time.time()
+        cache_control = response.headers.get('Cache-Control', '')
+        for directive in cache_control.split(','):
+            name, _, value = directive.strip().partition('=')
+            if name.lower() == 'max-age' and value.isdigit():
+                return now + int(value)
+        
+        expires = response.headers.get('Expires')
+        if expires:
             try:
-                return response.json() if response.content else None
-            except ValueError:
-                return response.text
-                
-        elif response.status_code == 204:
-            return None
+                return parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring unparsable Expires header: {expires}")
+        
+        return now
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+        
+        Honors Retry-After (and X-ESI-Error-Limit-Reset for 420) when present,
+        otherwise uses exponential backoff; either way the wait is capped at
+        MAX_BACKOFF. Random jitter is always added so concurrent clients do
+        not retry in lockstep.
+        
+        Args:
+            response: Response that triggered the retry
+            attempt: Zero-based retry attempt number
             
-        elif response.status_code == 304:
-            logger.debug("Data not modified (304)")
+        Returns:
+            Delay in seconds
+        """
+        delay = self._retry_after(response)
+        if delay is None:
+            delay = self.backoff_factor * 2 ** attempt
+        
+        return min(self.MAX_BACKOFF, max(0.0, delay)) + random.random() * self.backoff_factor
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Read the server-requested wait from a throttled response.
+        
+        Uses Retry-After, in either its seconds or HTTP-date form, falling
+        back to X-ESI-Error-Limit-Reset for 420.
+        
+        Args:
+            response: Throttled response
+            
+        Returns:
+            Seconds to wait, or None if the response does not say
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None and response.status_code == 420:
+            retry_after = response.headers.get('X-ESI-Error-Limit-Reset')
+        if retry_after is None:
             return None
+        
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring unparsable Retry-After header: {retry_after}")
+            return None
+    
+    def _record_error_limit(self, response: requests.Response) -> None:
+        """
+        Record the ESI error budget from a response.
+        
+        The response itself is returned to its caller without delay; the
+        recorded budget gates the next send in _error_budget_delay.
+        
+        Args:
+            response: Response carrying X-ESI-Error-Limit-* headers
+        """
+        remaining = response.headers.get('X-ESI-Error-Limit-Remain')
+        reset = response.headers.get('X-ESI-Error-Limit-Reset')
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining, reset = int(remaining), int(reset)
+        except ValueError:
+            return
+        
+        self._error_remaining = remaining
+        self._error_reset_at = time.monotonic() + reset
+        
+        if remaining < self.ERROR_LIMIT_FLOOR:
+            logger.warning(f"ESI error limit nearly exhausted ({remaining} left), "
+                           f"holding requests for {reset}s")
+    
+    def _error_budget_delay(self) -> float:
+        """
+        Determine how long to hold a request back before sending it.
+        
+        Once any response reports the error budget below ERROR_LIMIT_FLOOR,
+        every concurrent caller waits for the window to reset instead of
+        spending the remaining errors and triggering a 420.
+        
+        Returns:
+            Seconds to wait before sending, or 0
+        """
+        if self._error_remaining is None or self._error_remaining >= self.ERROR_LIMIT_FLOOR:
+            return 0
+        return max(0.0, self._error_reset_at - time.monotonic())
+    
+    def _send(self, method: str, url: str, headers: Dict[str, str],
+              params: Union[Dict[str, Any], str], json_data: Optional[Any]) -> requests.Response:
+        """
+        Send a request, retrying throttled and failed responses with backoff.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            params: Query parameters or pre-encoded query string
+            json_data: JSON body
             
-        elif response.status_code == 400:
-            error_msg = f"Bad request: {response.text}"
-            logger.error(error_msg)
-            raise ESIException(error_msg)
+        Returns:
+            Final response object
             
-        elif response.status_code == 401:
-            error_msg = "Authentication failed"
-            logger.error(error_msg)
-            raise ESIAuthenticationError(error_msg)
+        Raises:
+            ESIException: On timeout or connection failure
+        """
+        method = method.upper()
+        logger.debug(f"Making {method} request to {url}")
+        # Serialize once up front; Content-Type is already in the base headers
+        body = None if json_data is None else _dumps(json_data)
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                delay = self._error_budget_delay()
+                if delay:
+                    time.sleep(delay)
+                
+                if self._httpx_client is not None:
+                    response = self._httpx_client.request(
+                        method, url, headers=headers, params=params, content=body
+                    )
+                else:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        headers=None if headers is self._base_headers else headers,
+                        params=params,
+                        data=body,
+                        timeout=self.timeout
+                    )
+                self._record_error_limit(response)
+                
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                    break
+                
+                delay = self._retry_delay(response, attempt)
+                logger.warning(f"{method} {url} returned {response.status_code}, "
+                               f"retrying in {delay:.1f}s")
+                time.sleep(delay)
             
-        elif response.status_code == 403:
-            error_msg = f"Forbidden: {response.text}"
+            return response
+            
+        except self._timeout_errors:
+            error_msg = f"Request timeout for {url}"
             logger.error(error_msg)
             raise ESIException(error_msg)
             
-        elif response.status_code == 404:
-            error_msg = f"Not found: {response.url}"
-            logger.warning(error_msg)
+        except self._connection_errors:
+            error_msg = f"Connection error for {url}"
+            logger.error(error_msg)
             raise ESIException(error_msg)
             
-        elif response.status_code == 420:
-            error_msg = "Error limit exceeded"
+        except self._request_errors as e:
+            error_msg = f"Request failed for {url}: {e}"
             logger.error(error_msg)
-            raise ESIRateLimitError(error_msg)
+            raise ESIException(error_msg)
+    
+    def _prepare_request(self, method: str, endpoint: str, character_id: Optional[str],
+                         params: Optional[Union[Dict[str, Any], str]],
+                         headers: Optional[Dict[str, str]], version: str,
+                         use_cache: bool = True) -> tuple:
+        """
+        Build URL, headers, parameters and cache state for a request.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters or pre-encoded query string
+            headers: Additional headers
+            version: API version
+            use_cache: Whether the response cache may be consulted
             
-        elif response.status_code == 429:
-            error_msg = "Rate limit exceeded"
-            logger.error(error_msg)
-            raise ESIRateLimitError(error_msg)
+        Returns:
+            Tuple of (url, headers, params, cache_key, cached_entry). cache_key
+            is None when the request is not cacheable.
+        """
+        url = self._build_url(endpoint, version)
+        request_headers = self._prepare_headers(character_id, headers)
+        
+        # Add default parameters
+        if params is None:
+            params = {}
+        if isinstance(params, str):
+            params = f'{self.DATASOURCE_QUERY}&{params}' if params else self.DATASOURCE_QUERY
+        else:
+            params.setdefault('datasource', self.DEFAULT_DATASOURCE)
+        
+        # Serve unauthenticated GETs from the cache while fresh, revalidate via ETag otherwise
+        cache_key = None
+        cached = None
+        backend = self._cache_for(url) if use_cache else None
+        if backend is not None and method.upper() == 'GET' and character_id is None:
+            cache_key = self._cache_key(url, params, headers)
+            cached = backend.get(cache_key)
+            if cached is not None and cached[2]:
+                request_headers = {**request_headers, 'If-None-Match': cached[2]}
+        
+        return url, request_headers, params, cache_key, cached
+    
+    def _cache_for(self, url: str) -> Optional[CacheBackend]:
+        """
+        Select the cache backend for a URL or cache key.
+        
+        Args:
+            url: Request URL or cache key derived from it
             
-        elif response.status_code >= 500:
-            error_msg = f"Server error ({response.status_code}): {response.text}"
-            logger.error(error_msg)
-            raise ESIServerError(error_msg)
+        Returns:
+            static_cache for static universe endpoints when configured,
+            otherwise the response cache
+        """
+        if self.static_cache is not None and self.STATIC_ENDPOINTS.search(url):
+            return self.static_cache
+        return self.cache
+    
+    def _process_response(self, response: requests.Response, cache_key: Optional[str],
+                          cached: Optional[tuple], character_id: Optional[str] = None) -> Any:
+        """
+        Parse a response and update the cache for cacheable requests.
+        
+        Args:
+            response: Requests response object
+            cache_key: Cache key from _prepare_request, or None
+            cached: Previously cached entry for cache_key, if any
+            character_id: Character the request was authenticated as
             
-        else:
-            error_msg = f"Unexpected status code {response.status_code}: {response.text}"
-            logger.error(error_msg)
-            raise ESIException(error_msg)
+        Returns:
+            Parsed response data
+        """
+        if cache_key is None:
+            return self._handle_response(response, character_id)
+        
+        backend = self._cache_for(cache_key)
+        if response.status_code == 304 and cached is not None:
+            data = cached[0]
+            backend.set(cache_key, data, self._cache_expiry(response),
+                        response.headers.get('ETag', cached[2]))
+            return data
+        
+        data = self._handle_response(response)
+        if response.status_code == 200:
+            expires_at = self._cache_expiry(response)
+            etag = response.headers.get('ETag')
+            # Only keep responses that can be served fresh or revalidated later
+            if etag or expires_at > time.time():
+                backend.set(cache_key, data, expires_at, etag)
+        return data
     
     def request(self, method: str, endpoint: str, character_id: Optional[str] = None,
-                params: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None,
+                params: Optional[Union[Dict[str, Any], str]] = None,
+                json_data: Optional[Dict[str, Any]] = None,
                 headers: Optional[Dict[str, str]] = None, version: str = 'latest') -> Any:
         """
         Make an authenticated request to the ESI API.
@@ -213,56 +840,199 @@ class ESIClient:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
             character_id: Character ID for authenticated requests
-            params: Query parameters
+            params: Query parameters, or a pre-encoded query string that is
+                sent verbatim (useful for paginated loops that reuse a base query)
             json_data: JSON data for POST/PUT requests
             headers: Additional headers
             version: API version
             
         Returns:
-            Parsed response data
+            Parsed response data. Concurrent identical GETs share one
+            response object, which must not be mutated.
             
         Raises:
             ESIException: For various API errors
         """
-        url = self._build_url(endpoint, version)
-        request_headers = self._prepare_headers(character_id, headers)
+        url, request_headers, params, cache_key, cached = self._prepare_request(
+            method, endpoint, character_id, params, headers, version
+        )
+        if cached is not None and cached[1] > time.time():
+            logger.debug(f"Cache hit for {url}")
+            return cached[0]
         
-        # Add default parameters
-        if params is None:
-            params = {}
-        params.setdefault('datasource', self.DEFAULT_DATASOURCE)
+        def fetch() -> Any:
+            response = self._send(method, url, request_headers, params, json_data)
+            return self._process_response(response, cache_key, cached, character_id)
         
-        logger.debug(f"Making {method} request to {url}")
+        if method.upper() != 'GET':
+            return fetch()
+        key = (character_id, cache_key or self._cache_key(url, params, headers))
+        return self._single_flight(key, fetch)
+    
+    def _single_flight(self, key: Tuple[Optional[str], str], fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch once for all concurrent callers sharing key.
+        
+        The first caller performs the request; callers arriving while it is
+        in flight block on its Future and receive the same result or exception.
+        
+        Args:
+            key: (character_id, cache key) identifying the request
+            fetch: Performs the request and returns the parsed data
+            
+        Returns:
+            Parsed response data
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
         
         try:
-            response = self.session.request(
-                method=method.upper(),
-                url=url,
-                headers=request_headers,
-                params=params,
-                json=json_data,
-                timeout=self.timeout
-            )
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _get_page(self, endpoint: str, character_id: Optional[str], params: Dict[str, Any],
+                  headers: Optional[Dict[str, str]], version: str, page: int) -> Tuple[Any, int]:
+        """
+        Fetch a single page of a paginated endpoint.
+        
+        Pages bypass the response cache because the page count is only
+        available from the X-Pages response header.
+        
+        Args:
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters (without page)
+            headers: Additional headers
+            version: API version
+            page: Page number
             
-            return self._handle_response(response)
+        Returns:
+            Tuple of (parsed page data, total number of pages)
+        """
+        url, request_headers, page_params, _, _ = self._prepare_request(
+            'GET', endpoint, character_id, dict(params, page=page), headers, version, use_cache=False
+        )
+        response = self._send('GET', url, request_headers, page_params, None)
+        data = self._handle_response(response, character_id)
+        return data, int(response.headers.get('X-Pages', 1))
+    
+    def get_paged(self, endpoint: str, character_id: Optional[str] = None,
+                  params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                  version: str = 'latest', max_workers: int = 8) -> List[Any]:
+        """
+        Fetch every page of a paginated endpoint.
+        
+        Requests page 1, reads the total page count from the X-Pages header
+        and fetches the remaining pages concurrently over the shared
+        connection pool.
+        
+        Args:
+            endpoint: API endpoint path
+            character_id: Character ID for authenticated requests
+            params: Query parameters (any 'page' entry is ignored)
+            headers: Additional headers
+            version: API version
+            max_workers: Maximum number of pages fetched in parallel
             
-        except requests.exceptions.Timeout:
-            error_msg = f"Request timeout for {url}"
-            logger.error(error_msg)
-            raise ESIException(error_msg)
+        Returns:
+            Concatenated list of items from all pages, in page order
+        """
+        params = {k: v for k, v in (params or {}).items() if k != 'page'}
+        first, pages = self._get_page(endpoint, character_id, params, headers, version, 1)
+        results = list(first or [])
+        
+        if pages > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, pages - 1)) as executor:
+                remaining = executor.map(
+                    lambda page: self._get_page(endpoint, character_id, params, headers, version, page)[0],
+                    range(2, pages + 1)
+                )
+                for data in remaining:
+                    results.extend(data or [])
+        
+        return results
+    
+    @staticmethod
+    def _parse_id_array(body: bytes) -> array:
+        """
+        Parse a JSON array of integers into a packed int64 array.
+        
+        With pysimdjson installed the numbers are copied straight from the
+        parsed document into the array without creating Python int objects.
+        
+        Args:
+            body: Raw JSON response body
             
-        except requests.exceptions.ConnectionError:
-            error_msg = f"Connection error for {url}"
-            logger.error(error_msg)
-            raise ESIException(error_msg)
+        Returns:
+            array('q') of the parsed integers
+        """
+        ids = array('q')
+        if not body:
+            return ids
+        try:
+            import simdjson
+        except ImportError:  # pragma: no cover - optional dependency
+            ids.extend(_loads(body))
+        else:
+            ids.frombytes(simdjson.Parser().parse(body).as_buffer(of_type='i'))
+        return ids
+    
+    def get_id_array(self, endpoint: str, params: Optional[Union[Dict[str, Any], str]] = None,
+                     headers: Optional[Dict[str, str]] = None, version: str = 'latest') -> array:
+        """
+        Fetch an endpoint returning a list of IDs as a packed int64 array.
+        
+        Stores 8 bytes per ID instead of a Python int object, which matters
+        for long listings such as /universe/systems/. The response cache is
+        bypassed since it stores parsed Python objects.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters or pre-encoded query string
+            headers: Additional headers
+            version: API version
             
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request failed for {url}: {e}"
-            logger.error(error_msg)
-            raise ESIException(error_msg)
+        Returns:
+            array('q') of IDs
+            
+        Raises:
+            ESIException: For various API errors
+        """
+        url, request_headers, params, _, _ = self._prepare_request(
+            'GET', endpoint, None, params, headers, version, use_cache=False
+        )
+        response = self._send('GET', url, request_headers, params, None)
+        if response.status_code != 200:
+            self._handle_response(response)
+            return array('q')
+        return self._parse_id_array(response.content)
+    
+    def close(self) -> None:
+        """Close the HTTP session and connections, and any cache database the client opened."""
+        if self._session is not None:
+            self._session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+        if self._owns_static_cache:
+            self.static_cache.close()
+            self._owns_static_cache = False
     
     def get(self, endpoint: str, character_id: Optional[str] = None, 
-            params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+            params: Optional[Union[Dict[str, Any], str]] = None, **kwargs) -> Any:
         """Make a GET request."""
         return self.request('GET', endpoint, character_id, params, **kwargs)
     
@@ -289,14 +1059,48 @@ class ESIClient:
         """
         return self.get('/status/')
     
-    def get_universe_types(self, type_ids: list) -> Dict[str, Any]:
+    def _names_batches(self, type_ids: list) -> List[list]:
+        """Split IDs into /universe/names/ request bodies of at most NAMES_BATCH_SIZE."""
+        type_ids = list(type_ids)
+        return [type_ids[i:i + self.NAMES_BATCH_SIZE]
+                for i in range(0, len(type_ids), self.NAMES_BATCH_SIZE)] or [type_ids]
+    
+    def get_universe_types(self, type_ids: list, max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Get information about universe types.
         
+        Lists longer than NAMES_BATCH_SIZE are split into batches that are
+        posted concurrently over the shared connection pool.
+        
         Args:
             type_ids: List of type IDs
+            max_workers: Maximum number of batches posted in parallel
             
         Returns:
-            Type information
+            Type information, in batch order
+        """
+        batches = self._names_batches(type_ids)
+        if len(batches) == 1:
+            return self.post('/universe/names/', json_data=batches[0]) or []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            results = executor.map(
+                lambda batch: self.post('/universe/names/', json_data=batch), batches
+            )
+            return [item for result in results for item in result or []]
+    
+    def iter_universe_types(self, type_ids: list) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield information about universe types.
+        
+        Batches are posted one at a time as the iterator is consumed, so
+        only a single NAMES_BATCH_SIZE response is held in memory.
+        
+        Args:
+            type_ids: List of type IDs
+            
+        Yields:
+            Type information, in batch order
         """
-        return self.post('/universe/names/', json_data=type_ids)
+        for batch in self._names_batches(type_ids):
+            yield from self.post('/universe/names/', json_data=batch) or []
@@ -0,0 +1,202 @@
+"""
+Tests for asynchronous ESI Client functionality
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+aioresponses = pytest.importorskip('aioresponses').aioresponses
+
+from eveonline_api_util.async_client import AsyncESIClient
+from eveonline_api_util.auth import EVEAuth
+from eveonline_api_util.cache import MemoryCache
+from eveonline_api_util.endpoints.universe import UniverseEndpoint
+from eveonline_api_util.esi_client import ESIException, ESIServerError
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+class TestAsyncESIClient:
+    """Test AsyncESIClient functionality."""
+    
+    def test_get(self):
+        """Test GET request returns parsed JSON."""
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    mocked.get('https://esi.evetech.net/latest/status/?datasource=tranquility',
+                               payload={'players': 12345})
+                    return await client.get_server_status()
+        
+        assert run(scenario()) == {'players': 12345}
+    
+    def test_request_with_auth(self):
+        """Test authenticated request sends the bearer token."""
+        mock_auth = Mock(spec=EVEAuth)
+        mock_auth.get_valid_token.return_value = 'test_token'
+        
+        async def scenario():
+            async with AsyncESIClient(auth=mock_auth) as client:
+                with aioresponses() as mocked:
+                    url = 'https://esi.evetech.net/latest/characters/12345/wallet/?datasource=tranquility'
+                    mocked.get(url, payload=100.5)
+                    result = await client.get('/characters/12345/wallet/', character_id='12345')
+                    request = next(iter(mocked.requests.values()))[0]
+                    return result, request.kwargs['headers']
+        
+        result, headers = run(scenario())
+        assert result == 100.5
+        assert headers['Authorization'] == 'Bearer test_token'
+    
+    def test_token_lookup_runs_off_event_loop(self):
+        """Test the blocking token lookup runs in an executor thread and is cached."""
+        lookup_threads = []
+        mock_auth = Mock(spec=EVEAuth)
+        mock_auth.get_valid_token.side_effect = lambda character_id: (
+            lookup_threads.append(threading.get_ident()) or 'test_token'
+        )
+        
+        async def scenario():
+            async with AsyncESIClient(auth=mock_auth) as client:
+                with aioresponses() as mocked:
+                    url = 'https://esi.evetech.net/latest/characters/12345/wallet/?datasource=tranquility'
+                    mocked.get(url, payload=100.5, repeat=True)
+                    await client.get('/characters/12345/wallet/', character_id='12345')
+                    await client.get('/characters/12345/wallet/', character_id='12345')
+        
+        run(scenario())
+        assert len(lookup_threads) == 1
+        assert lookup_threads[0] != threading.get_ident()
+    
+    def test_boolean_params_encoded(self):
+        """Test boolean parameters are sent as ESI's lowercase strings."""
+        assert AsyncESIClient._encode_params({'include_completed': True, 'page': 1}) == {
+            'include_completed': 'true', 'page': 1
+        }
+    
+    def test_endpoint_gather(self):
+        """Test endpoint methods return awaitables usable with asyncio.gather."""
+        async def scenario():
+            async with AsyncESIClient() as client:
+                universe = UniverseEndpoint(client)
+                with aioresponses() as mocked:
+                    for type_id in (34, 35):
+                        mocked.get(f'https://esi.evetech.net/latest/universe/types/{type_id}/?datasource=tranquility',
+                                   payload={'type_id': type_id})
+                    return await asyncio.gather(*[universe.get_universe_type(t) for t in (34, 35)])
+        
+        assert run(scenario()) == [{'type_id': 34}, {'type_id': 35}]
+    
+    @patch('eveonline_api_util.async_client.asyncio.sleep', new_callable=AsyncMock)
+    def test_retry_then_success(self, mock_sleep):
+        """Test throttled responses are retried."""
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    url = 'https://esi.evetech.net/latest/test/?datasource=tranquility'
+                    mocked.get(url, status=503)
+                    mocked.get(url, payload=[1, 2])
+                    return await client.get('/test/')
+        
+        assert run(scenario()) == [1, 2]
+        assert mock_sleep.call_count == 1
+    
+    def test_server_error_raised(self):
+        """Test server errors raise once retries are exhausted."""
+        async def scenario():
+            async with AsyncESIClient(max_retries=0) as client:
+                with aioresponses() as mocked:
+                    mocked.get('https://esi.evetech.net/latest/test/?datasource=tranquility',
+                               status=500, body='ISE')
+                    await client.get('/test/')
+        
+        with pytest.raises(ESIServerError):
+            run(scenario())
+    
+    def test_connection_error(self):
+        """Test connection errors are wrapped in ESIException."""
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    mocked.get('https://esi.evetech.net/latest/test/?datasource=tranquility',
+                               exception=aiohttp.ClientConnectionError())
+                    await client.get('/test/')
+        
+        with pytest.raises(ESIException, match='Connection error'):
+            run(scenario())
+    
+    def test_cache_hit(self):
+        """Test fresh cache entries are served without a request."""
+        async def scenario():
+            async with AsyncESIClient(cache=MemoryCache()) as client:
+                with aioresponses() as mocked:
+                    mocked.get('https://esi.evetech.net/latest/markets/prices/?datasource=tranquility',
+                               payload=[{'type_id': 34}], headers={'Cache-Control': 'max-age=300'})
+                    first = await client.get('/markets/prices/')
+                    second = await client.get('/markets/prices/')
+                    return first, second, sum(len(calls) for calls in mocked.requests.values())
+        
+        first, second, calls = run(scenario())
+        assert first == second == [{'type_id': 34}]
+        assert calls == 1
+    
+    def test_get_paged(self):
+        """Test get_paged gathers the remaining pages after reading X-Pages."""
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    for page in (1, 2):
+                        mocked.get(f'https://esi.evetech.net/latest/wars/1/killmails/'
+                                   f'?datasource=tranquility&page={page}',
+                                   payload=[{'killmail_id': page}], headers={'X-Pages': '2'})
+                    return await client.get_paged('/wars/1/killmails/')
+        
+        assert run(scenario()) == [{'killmail_id': 1}, {'killmail_id': 2}]
+    
+    def test_get_universe_types_batches(self):
+        """Test long ID lists are gathered as NAMES_BATCH_SIZE requests."""
+        from aioresponses import CallbackResult
+        sizes = []
+        
+        def names(url, data=None, **kwargs):
+            ids = json.loads(data)
+            sizes.append(len(ids))
+            return CallbackResult(payload=[{'id': i} for i in ids])
+        
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    mocked.post('https://esi.evetech.net/latest/universe/names/?datasource=tranquility',
+                                callback=names, repeat=True)
+                    return await client.get_universe_types(list(range(2500)))
+        
+        assert [r['id'] for r in run(scenario())] == list(range(2500))
+        assert sorted(sizes) == [500, 1000, 1000]
+    
+    def test_iter_universe_types(self):
+        """Test batches are posted in order as the async iterator is consumed."""
+        from aioresponses import CallbackResult
+        sizes = []
+        
+        def names(url, data=None, **kwargs):
+            ids = json.loads(data)
+            sizes.append(len(ids))
+            return CallbackResult(payload=[{'id': i} for i in ids])
+        
+        async def scenario():
+            async with AsyncESIClient() as client:
+                with aioresponses() as mocked:
+                    mocked.post('https://esi.evetech.net/latest/universe/names/?datasource=tranquility',
+                                callback=names, repeat=True)
+                    return [r['id'] async for r in client.iter_universe_types(list(range(2500)))]
+        
+        assert run(scenario()) == list(range(2500))
+        assert sizes == [1000, 1000, 500]
@@ -2,10 +2,10 @@
 Tests for authentication and token management functionality
 """
 
+import copy
 import json
-import os
-import tempfile
 import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
@@ -13,6 +13,9 @@ import requests
 
 from eveonline_api_util.auth import TokenManager, EVEAuth
 
+# Token file path on the in-memory filesystem provided by pyfakefs' fs fixture
+TOKEN_FILE = '/fake/tokens.json'
+
 
 class TestTokenManager:
     """Test TokenManager functionality."""
@@ -23,16 +26,13 @@ class TestTokenManager:
         assert manager.token_file is None
         assert manager._tokens == {}
     
-    def test_init_with_nonexistent_file(self):
+    def test_init_with_nonexistent_file(self, fs):
         """Test TokenManager initialization with nonexistent file."""
-        with tempfile.NamedTemporaryFile(delete=True) as tmp:
-            tmp_path = tmp.name
-        
-        manager = TokenManager(tmp_path)
-        assert manager.token_file == tmp_path
+        manager = TokenManager(TOKEN_FILE)
+        assert manager.token_file == TOKEN_FILE
         assert manager._tokens == {}
     
-    def test_init_with_existing_file(self):
+    def test_init_with_existing_file(self, fs):
         """Test TokenManager initialization with existing token file."""
         test_tokens = {
             '12345': {
@@ -41,45 +41,38 @@ class TestTokenManager:
                 'CharacterName': 'Test Character'
             }
         }
+        fs.create_file(TOKEN_FILE, contents=json.dumps(test_tokens))
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
-            json.dump(test_tokens, tmp)
-            tmp_path = tmp.name
+        manager = TokenManager(TOKEN_FILE)
+        assert manager._tokens == test_tokens
+    
+    def test_init_with_corrupt_file(self, fs):
+        """Test an unreadable token file is ignored."""
+        fs.create_file(TOKEN_FILE, contents='{not json')
         
-        try:
-            manager = TokenManager(tmp_path)
-            assert manager._tokens == test_tokens
-        finally:
-            os.unlink(tmp_path)
+        manager = TokenManager(TOKEN_FILE)
+        assert manager._tokens == {}
     
-    def test_store_token(self):
+    def test_store_token(self, fs):
         """Test storing a token."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
+        manager = TokenManager(TOKEN_FILE)
+        token = {
+            'access_token': 'test_token',
+            'refresh_token': 'test_refresh',
+            'CharacterName': 'Test Character'
+        }
         
-        try:
-            manager = TokenManager(tmp_path)
-            token = {
-                'access_token': 'test_token',
-                'refresh_token': 'test_refresh',
-                'CharacterName': 'Test Character'
-            }
-            
-            manager.store_token('12345', token)
-            
-            # Check token was stored in memory
-            stored_token = manager.get_token('12345')
-            assert stored_token['access_token'] == 'test_token'
-            assert 'stored_at' in stored_token
-            
-            # Check token was saved to file
-            with open(tmp_path, 'r') as f:
-                file_tokens = json.load(f)
-            assert '12345' in file_tokens
-            assert file_tokens['12345']['access_token'] == 'test_token'
-            
-        finally:
-            os.unlink(tmp_path)
+        manager.store_token('12345', token)
+        
+        # Check token was stored in memory
+        stored_token = manager.get_token('12345')
+        assert stored_token['access_token'] == 'test_token'
+        assert 'stored_at' in stored_token
+        
+        # Check the persisted form contains the token
+        file_tokens = json.loads(manager._serialize())
+        assert '12345' in file_tokens
+        assert file_tokens['12345']['access_token'] == 'test_token'
     
     def test_get_token(self):
         """Test retrieving a token."""
@@ -93,44 +86,48 @@ class TestTokenManager:
         # Test non-existent token
         assert manager.get_token('99999') is None
     
-    def test_remove_token(self):
+    def test_remove_token(self, fs):
         """Test removing a token."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            manager = TokenManager(tmp_path)
-            manager._tokens['12345'] = {'access_token': 'test_token'}
-            
-            # Remove existing token
-            assert manager.remove_token('12345') is True
-            assert manager.get_token('12345') is None
-            
-            # Try to remove non-existent token
-            assert manager.remove_token('99999') is False
-            
-        finally:
-            os.unlink(tmp_path)
+        manager = TokenManager(TOKEN_FILE)
+        manager._tokens['12345'] = {'access_token': 'test_token'}
+        
+        # Remove existing token
+        assert manager.remove_token('12345') is True
+        assert manager.get_token('12345') is None
+        
+        # Try to remove non-existent token
+        assert manager.remove_token('99999') is False
     
-    def test_is_token_expired(self):
+    @pytest.mark.parametrize("expires_in,expected", [
+        pytest.param(None, True, id='no_expiry'),
+        pytest.param(-100, True, id='expired'),
+        pytest.param(1000, False, id='valid'),
+        pytest.param(200, True, id='within_buffer'),
+    ])
+    def test_is_token_expired(self, expires_in, expected):
         """Test token expiration checking."""
-        manager = TokenManager()
-        
-        # Token without expires_at
-        token_no_expiry = {'access_token': 'test'}
-        assert manager.is_token_expired(token_no_expiry) is True
+        now = 1700000000.0
+        token = {'access_token': 'test'}
+        if expires_in is not None:
+            token['expires_at'] = now + expires_in
         
-        # Expired token
-        expired_token = {'expires_at': time.time() - 100}
-        assert manager.is_token_expired(expired_token) is True
+        assert TokenManager().is_token_expired(token, buffer_seconds=300, now=now) is expected
+    
+    def test_expired_mask(self):
+        """Test batch expiry checks use one clock reading."""
+        manager = TokenManager()
+        now = time.time()
+        manager._tokens = {
+            '12345': {'expires_at': now + 1000},
+            '67890': {'expires_at': now - 100},
+            '11111': {'access_token': 'test'}
+        }
         
-        # Valid token
-        valid_token = {'expires_at': time.time() + 1000}
-        assert manager.is_token_expired(valid_token) is False
+        with patch('eveonline_api_util.auth.time.time', return_value=now) as mock_time:
+            mask = manager.expired_mask(['12345', '67890', '11111'])
         
-        # Token expiring soon (within buffer)
-        soon_token = {'expires_at': time.time() + 200}
-        assert manager.is_token_expired(soon_token, buffer_seconds=300) is True
+        assert mask == [False, True, True]
+        mock_time.assert_called_once()
     
     def test_list_characters(self):
         """Test listing characters with tokens."""
@@ -144,68 +141,103 @@ class TestTokenManager:
         assert set(characters) == {'12345', '67890'}
 
 
+# Return values configured on OAuth2Session mocks, by scenario
+_OAUTH_TEMPLATES = {
+    'auth_url': {
+        'authorization_url': ('http://auth_url', 'state123'),
+    },
+    'fetch': {
+        'fetch_token': {
+            'access_token': 'test_access_token',
+            'refresh_token': 'test_refresh_token',
+            'expires_at': time.time() + 3600
+        },
+    },
+    'refresh': {
+        'refresh_token': {
+            'access_token': 'new_token',
+            'refresh_token': 'new_refresh_token',
+            'expires_at': time.time() + 3600
+        },
+    },
+}
+
+
+def _make_oauth_mock(kind: str) -> Mock:
+    """Build an OAuth2Session mock preconfigured from _OAUTH_TEMPLATES."""
+    session = Mock()
+    for method, value in _OAUTH_TEMPLATES[kind].items():
+        # Copy so code that updates the returned token cannot leak into other tests
+        getattr(session, method).return_value = copy.deepcopy(value)
+    return session
+
+
+@pytest.fixture(scope='class')
+def shared_eve_auth_env():
+    """EVEAuth and TokenManager built once per test class."""
+    env = SimpleNamespace(
+        client_id='test_client_id',
+        client_secret='test_client_secret',
+        redirect_uri='http://localhost:8000/callback',
+        scopes=['esi-wallet.read_character_wallet.v1'],
+        token_manager=TokenManager()
+    )
+    env.auth = EVEAuth(
+        client_id=env.client_id,
+        client_secret=env.client_secret,
+        redirect_uri=env.redirect_uri,
+        scopes=env.scopes,
+        token_manager=env.token_manager
+    )
+    return env
+
+
+@pytest.fixture
+def eve_auth_env(shared_eve_auth_env):
+    """Shared EVEAuth environment with its stored tokens reset for each test."""
+    shared_eve_auth_env.token_manager._tokens.clear()
+    return shared_eve_auth_env
+
+
 class TestEVEAuth:
     """Test EVEAuth functionality."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        self.client_id = 'test_client_id'
-        self.client_secret = 'test_client_secret'
-        self.redirect_uri = 'http://localhost:8000/callback'
-        self.scopes = ['esi-wallet.read_character_wallet.v1']
-        
-        self.token_manager = TokenManager()
-        self.auth = EVEAuth(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            redirect_uri=self.redirect_uri,
-            scopes=self.scopes,
-            token_manager=self.token_manager
-        )
-    
-    def test_init(self):
+    def test_init(self, eve_auth_env):
         """Test EVEAuth initialization."""
-        assert self.auth.client_id == self.client_id
-        assert self.auth.client_secret == self.client_secret
-        assert self.auth.redirect_uri == self.redirect_uri
-        assert self.auth.scopes == self.scopes
-        assert self.auth.token_manager == self.token_manager
+        assert eve_auth_env.auth.client_id == eve_auth_env.client_id
+        assert eve_auth_env.auth.client_secret == eve_auth_env.client_secret
+        assert eve_auth_env.auth.redirect_uri == eve_auth_env.redirect_uri
+        assert eve_auth_env.auth.scopes == eve_auth_env.scopes
+        assert eve_auth_env.auth.token_manager == eve_auth_env.token_manager
     
     @patch('eveonline_api_util.auth.OAuth2Session')
-    def test_get_authorization_url(self, mock_oauth_session):
+    def test_get_authorization_url(self, mock_oauth_session, eve_auth_env):
         """Test authorization URL generation."""
-        mock_session = Mock()
-        mock_session.authorization_url.return_value = ('http://auth_url', 'state123')
+        mock_session = _make_oauth_mock('auth_url')
         mock_oauth_session.return_value = mock_session
         
-        auth_url, state = self.auth.get_authorization_url('test_state')
+        auth_url, state = eve_auth_env.auth.get_authorization_url('test_state')
         
         assert auth_url == 'http://auth_url'
         assert state == 'state123'
         
         mock_oauth_session.assert_called_once_with(
-            client_id=self.client_id,
-            redirect_uri=self.redirect_uri,
-            scope=self.scopes,
+            client_id=eve_auth_env.client_id,
+            redirect_uri=eve_auth_env.redirect_uri,
+            scope=eve_auth_env.scopes,
             state='test_state'
         )
     
     @patch('eveonline_api_util.auth.requests.get')
     @patch('eveonline_api_util.auth.OAuth2Session')
-    def test_handle_callback(self, mock_oauth_session, mock_requests_get):
+    def test_handle_callback(self, mock_oauth_session, mock_requests_get, eve_auth_env):
         """Test handling OAuth2 callback."""
         # Mock OAuth2Session
-        mock_session = Mock()
-        mock_token = {
-            'access_token': 'test_access_token',
-            'refresh_token': 'test_refresh_token',
-            'expires_at': time.time() + 3600
-        }
-        mock_session.fetch_token.return_value = mock_token
+        mock_session = _make_oauth_mock('fetch')
         mock_oauth_session.return_value = mock_session
         
         # Mock verify response
-        mock_verify_response = Mock()
+        mock_verify_response = Mock(spec=requests.Response)
         mock_verify_response.json.return_value = {
             'CharacterID': 12345,
             'CharacterName': 'Test Character',
@@ -215,18 +247,18 @@ class TestEVEAuth:
         mock_requests_get.return_value = mock_verify_response
         
         callback_url = 'http://localhost:8000/callback?code=test_code&state=test_state'
-        result = self.auth.handle_callback(callback_url, 'test_state')
+        result = eve_auth_env.auth.handle_callback(callback_url, 'test_state')
         
         # Verify token was fetched
         mock_session.fetch_token.assert_called_once_with(
-            self.auth.TOKEN_URL,
+            eve_auth_env.auth.TOKEN_URL,
             authorization_response=callback_url,
-            client_secret=self.client_secret
+            client_secret=eve_auth_env.client_secret
         )
         
         # Verify token was verified
         mock_requests_get.assert_called_once_with(
-            self.auth.VERIFY_URL,
+            eve_auth_env.auth.VERIFY_URL,
             headers={'Authorization': 'Bearer test_access_token'}
         )
         
@@ -236,9 +268,9 @@ class TestEVEAuth:
         assert result['access_token'] == 'test_access_token'
     
     @patch('eveonline_api_util.auth.requests.get')
-    def test_verify_token(self, mock_requests_get):
+    def test_verify_token(self, mock_requests_get, eve_auth_env):
         """Test token verification."""
-        mock_response = Mock()
+        mock_response = Mock(spec=requests.Response)
         mock_response.json.return_value = {
             'CharacterID': 12345,
             'CharacterName': 'Test Character'
@@ -246,16 +278,16 @@ class TestEVEAuth:
         mock_response.raise_for_status.return_value = None
         mock_requests_get.return_value = mock_response
         
-        result = self.auth._verify_token('test_token')
+        result = eve_auth_env.auth._verify_token('test_token')
         
         mock_requests_get.assert_called_once_with(
-            self.auth.VERIFY_URL,
+            eve_auth_env.auth.VERIFY_URL,
             headers={'Authorization': 'Bearer test_token'}
         )
         assert result['CharacterID'] == 12345
     
     @patch('eveonline_api_util.auth.OAuth2Session')
-    def test_refresh_token_success(self, mock_oauth_session):
+    def test_refresh_token_success(self, mock_oauth_session, eve_auth_env):
         """Test successful token refresh."""
         # Setup existing token
         old_token = {
@@ -264,26 +296,20 @@ class TestEVEAuth:
             'CharacterID': 12345,
             'CharacterName': 'Test Character'
         }
-        self.token_manager.store_token('12345', old_token)
+        eve_auth_env.token_manager.store_token('12345', old_token)
         
         # Mock OAuth2Session
-        mock_session = Mock()
-        new_token = {
-            'access_token': 'new_token',
-            'refresh_token': 'new_refresh_token',
-            'expires_at': time.time() + 3600
-        }
-        mock_session.refresh_token.return_value = new_token
+        mock_session = _make_oauth_mock('refresh')
         mock_oauth_session.return_value = mock_session
         
-        result = self.auth.refresh_token('12345')
+        result = eve_auth_env.auth.refresh_token('12345')
         
         # Verify refresh was called
         mock_session.refresh_token.assert_called_once_with(
-            self.auth.TOKEN_URL,
+            eve_auth_env.auth.TOKEN_URL,
             refresh_token='refresh_token',
-            client_id=self.client_id,
-            client_secret=self.client_secret
+            client_id=eve_auth_env.client_id,
+            client_secret=eve_auth_env.client_secret
         )
         
         # Verify result preserves character info
@@ -291,31 +317,31 @@ class TestEVEAuth:
         assert result['CharacterID'] == 12345
         assert result['CharacterName'] == 'Test Character'
     
-    def test_refresh_token_no_token(self):
+    def test_refresh_token_no_token(self, eve_auth_env):
         """Test refresh with no stored token."""
-        result = self.auth.refresh_token('99999')
+        result = eve_auth_env.auth.refresh_token('99999')
         assert result is None
     
-    def test_get_valid_token_valid(self):
+    def test_get_valid_token_valid(self, eve_auth_env):
         """Test getting valid token when token is not expired."""
         token = {
             'access_token': 'valid_token',
             'expires_at': time.time() + 1000
         }
-        self.token_manager.store_token('12345', token)
+        eve_auth_env.token_manager.store_token('12345', token)
         
-        result = self.auth.get_valid_token('12345')
+        result = eve_auth_env.auth.get_valid_token('12345')
         assert result == 'valid_token'
     
     @patch.object(EVEAuth, 'refresh_token')
-    def test_get_valid_token_expired(self, mock_refresh):
+    def test_get_valid_token_expired(self, mock_refresh, eve_auth_env):
         """Test getting valid token when token is expired."""
         # Store expired token
         expired_token = {
             'access_token': 'expired_token',
             'expires_at': time.time() - 100
         }
-        self.token_manager.store_token('12345', expired_token)
+        eve_auth_env.token_manager.store_token('12345', expired_token)
         
         # Mock successful refresh
         refreshed_token = {
@@ -324,25 +350,25 @@ class TestEVEAuth:
         }
         mock_refresh.return_value = refreshed_token
         
-        result = self.auth.get_valid_token('12345')
+        result = eve_auth_env.auth.get_valid_token('12345')
         
         mock_refresh.assert_called_once_with('12345')
         assert result == 'refreshed_token'
     
-    def test_get_valid_token_no_token(self):
+    def test_get_valid_token_no_token(self, eve_auth_env):
         """Test getting valid token when no token exists."""
-        result = self.auth.get_valid_token('99999')
+        result = eve_auth_env.auth.get_valid_token('99999')
         assert result is None
     
-    def test_revoke_token(self):
+    def test_revoke_token(self, eve_auth_env):
         """Test token revocation."""
         token = {'access_token': 'test_token'}
-        self.token_manager.store_token('12345', token)
+        eve_auth_env.token_manager.store_token('12345', token)
         
-        result = self.auth.revoke_token('12345')
+        result = eve_auth_env.auth.revoke_token('12345')
         assert result is True
-        assert self.token_manager.get_token('12345') is None
+        assert eve_auth_env.token_manager.get_token('12345') is None
         
         # Test revoking non-existent token
-        result = self.auth.revoke_token('99999')
+        result = eve_auth_env.auth.revoke_token('99999')
         assert result is False
@@ -0,0 +1,85 @@
+"""
+Tests for response cache backends
+"""
+
+import time
+
+from eveonline_api_util.cache import MemoryCache, SqliteCache
+
+
+class TestMemoryCache:
+    """Test MemoryCache functionality."""
+    
+    def test_get_missing(self):
+        """Test missing keys return None."""
+        assert MemoryCache().get('missing') is None
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving an entry."""
+        cache = MemoryCache()
+        expires_at = time.time() + 60
+        cache.set('key', {'a': 1}, expires_at, '"etag"')
+        
+        assert cache.get('key') == ({'a': 1}, expires_at, '"etag"')
+    
+    def test_get_returns_copies(self):
+        """Test callers cannot change the cached list through stored or returned objects."""
+        cache = MemoryCache()
+        records = [{'id': 1}]
+        cache.set('key', records, 0.0)
+        records.append({'id': 2})
+        cache.get('key')[0].append({'id': 3})
+        
+        assert cache.get('key')[0] == [{'id': 1}]
+        assert cache.get('key')[0][0] is records[0]
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = MemoryCache(maxsize=2)
+        cache.set('a', 1, 0.0)
+        cache.set('b', 2, 0.0)
+        cache.get('a')
+        cache.set('c', 3, 0.0)
+        
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert cache.get('a') == (1, 0.0, None)
+    
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = MemoryCache()
+        cache.set('key', [1, 2], time.time())
+        cache.clear()
+        
+        assert cache.get('key') is None
+
+
+class TestSqliteCache:
+    """Test SqliteCache functionality."""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test storing and retrieving an entry."""
+        cache = SqliteCache(str(tmp_path / 'cache.sqlite3'))
+        cache.set('key', [{'id': 1}], 123.0, '"etag"')
+        
+        assert cache.get('key') == ([{'id': 1}], 123.0, '"etag"')
+        assert cache.get('missing') is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries are visible to other connections."""
+        path = str(tmp_path / 'nested' / 'cache.sqlite3')
+        SqliteCache(path).set('key', {'a': 1}, 456.0)
+        
+        assert SqliteCache(path).get('key') == ({'a': 1}, 456.0, None)
+    
+    def test_overwrite_and_clear(self, tmp_path):
+        """Test overwriting and clearing entries."""
+        cache = SqliteCache(str(tmp_path / 'cache.sqlite3'))
+        cache.set('key', 1, 1.0)
+        cache.set('key', 2, 2.0, '"v2"')
+        
+        assert cache.get('key') == (2, 2.0, '"v2"')
+        
+        cache.clear()
+        assert cache.get('key') is None
+        cache.close()
@@ -2,20 +2,70 @@
 Tests for CLI functionality
 """
 
+import argparse
 import json
 import os
-import tempfile
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 import sys
+from contextlib import ExitStack
+from types import SimpleNamespace
 
 import pytest
 
 from eveonline_api_util.cli import (
     setup_logging, load_config, cmd_auth, cmd_list_tokens,
     cmd_revoke_token, cmd_character_info, cmd_wallet_balance,
-    cmd_server_status, main
+    cmd_server_status, main, reset_dotenv_cache
 )
+from eveonline_api_util.auth import EVEAuth, TokenManager
+from eveonline_api_util.endpoints.character import CharacterEndpoint
+from eveonline_api_util.endpoints.wallet import WalletEndpoint
+from eveonline_api_util.esi_client import ESIClient
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Make each test parse the (patched) environment and .env file afresh."""
+    reset_dotenv_cache()
+    yield
+    reset_dotenv_cache()
+
+
+EVE_ENV = {
+    'EVE_CLIENT_ID': 'test_client_id',
+    'EVE_CLIENT_SECRET': 'test_client_secret',
+    'EVE_REDIRECT_URI': 'http://localhost:8000/callback',
+    'EVE_SCOPES': 'scope1,scope2',
+    'EVE_TOKEN_FILE': 'test_tokens.json'
+}
+
+
+@pytest.fixture(scope="class")
+def eve_env():
+    """Set the EVE_* configuration variables once for the requesting class."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in EVE_ENV.items():
+            mp.setenv(name, value)
+        yield EVE_ENV
+
+
+@pytest.fixture
+def cli_mocks():
+    """Patch the CLI's collaborators and console I/O in one ExitStack."""
+    targets = {
+        'load_config': 'eveonline_api_util.cli.load_config',
+        'token_manager': 'eveonline_api_util.cli.TokenManager',
+        'eve_auth': 'eveonline_api_util.cli.EVEAuth',
+        'esi_client': 'eveonline_api_util.cli.ESIClient',
+        'character_endpoint': 'eveonline_api_util.cli.CharacterEndpoint',
+        'wallet_endpoint': 'eveonline_api_util.cli.WalletEndpoint',
+        'input': 'builtins.input',
+        'print': 'builtins.print',
+    }
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{name: stack.enter_context(patch(target))
+                                 for name, target in targets.items()})
 
 
 class TestCLI:
@@ -27,15 +77,8 @@ class TestCLI:
         # Just verify it doesn't raise an exception
         assert True
     
-    @patch.dict(os.environ, {
-        'EVE_CLIENT_ID': 'test_client_id',
-        'EVE_CLIENT_SECRET': 'test_client_secret',
-        'EVE_REDIRECT_URI': 'http://localhost:8000/callback',
-        'EVE_SCOPES': 'scope1,scope2',
-        'EVE_TOKEN_FILE': 'test_tokens.json'
-    })
     @patch('eveonline_api_util.cli.load_dotenv')
-    def test_load_config_success(self, mock_load_dotenv):
+    def test_load_config_success(self, mock_load_dotenv, eve_env):
         """Test successful config loading."""
         config = load_config()
         
@@ -45,6 +88,24 @@ class TestCLI:
         assert config['scopes'] == ['scope1', 'scope2']
         assert config['token_file'] == 'test_tokens.json'
     
+    @patch('eveonline_api_util.cli.load_dotenv')
+    def test_load_config_parsed_once(self, mock_load_dotenv, eve_env):
+        """Test repeated calls reuse the parsed configuration."""
+        assert load_config() is load_config()
+        mock_load_dotenv.assert_called_once()
+    
+    @patch('eveonline_api_util.cli.load_dotenv')
+    def test_load_dotenv_once_across_cache_clear(self, mock_load_dotenv, eve_env):
+        """Test the .env file is only read again after reset_dotenv_cache."""
+        load_config()
+        load_config.cache_clear()
+        load_config()
+        mock_load_dotenv.assert_called_once()
+        
+        reset_dotenv_cache()
+        load_config()
+        assert mock_load_dotenv.call_count == 2
+    
     @patch.dict(os.environ, {}, clear=True)
     @patch('eveonline_api_util.cli.load_dotenv')
     def test_load_config_missing_credentials(self, mock_load_dotenv):
@@ -52,12 +113,7 @@ class TestCLI:
         with pytest.raises(SystemExit):
             load_config()
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.EVEAuth')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.input', return_value='http://localhost:8000/callback?code=test&state=test')
-    @patch('builtins.print')
-    def test_cmd_auth_success(self, mock_print, mock_input, mock_token_manager, mock_eve_auth, mock_load_config):
+    def test_cmd_auth_success(self, cli_mocks):
         """Test successful authentication command."""
         # Setup mocks
         mock_config = {
@@ -67,117 +123,96 @@ class TestCLI:
             'scopes': ['scope1'],
             'token_file': 'tokens.json'
         }
-        mock_load_config.return_value = mock_config
+        cli_mocks.load_config.return_value = mock_config
+        cli_mocks.input.return_value = 'http://localhost:8000/callback?code=test&state=test'
         
-        mock_auth_instance = Mock()
+        mock_auth_instance = Mock(spec_set=EVEAuth)
         mock_auth_instance.get_authorization_url.return_value = ('http://auth_url', 'state123')
         mock_auth_instance.handle_callback.return_value = {
             'CharacterName': 'Test Character',
             'CharacterID': 12345
         }
-        mock_eve_auth.return_value = mock_auth_instance
+        cli_mocks.eve_auth.return_value = mock_auth_instance
         
         # Run command
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         cmd_auth(args)
         
         # Verify auth flow
         mock_auth_instance.get_authorization_url.assert_called_once()
         mock_auth_instance.handle_callback.assert_called_once()
         
-        # Check print calls for success message
-        print_calls = [call[0][0] for call in mock_print.call_args_list if call[0]]
-        success_messages = [msg for msg in print_calls if 'Successfully authenticated' in msg]
-        assert len(success_messages) > 0
+        cli_mocks.print.assert_any_call("Successfully authenticated character: Test Character (ID: 12345)")
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.print')
-    def test_cmd_list_tokens_empty(self, mock_print, mock_token_manager, mock_load_config):
+    def test_cmd_list_tokens_empty(self, cli_mocks):
         """Test listing tokens when none exist."""
-        mock_load_config.return_value = {'token_file': 'tokens.json'}
+        cli_mocks.load_config.return_value = {'token_file': 'tokens.json'}
         
-        mock_manager_instance = Mock()
+        mock_manager_instance = Mock(spec_set=TokenManager)
         mock_manager_instance.list_characters.return_value = []
-        mock_token_manager.return_value = mock_manager_instance
+        cli_mocks.token_manager.return_value = mock_manager_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         cmd_list_tokens(args)
         
-        mock_print.assert_called_with("No stored tokens found.")
+        cli_mocks.print.assert_called_with("No stored tokens found.")
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.print')
-    def test_cmd_list_tokens_with_data(self, mock_print, mock_token_manager, mock_load_config):
+    def test_cmd_list_tokens_with_data(self, cli_mocks):
         """Test listing tokens with stored data."""
-        mock_load_config.return_value = {'token_file': 'tokens.json'}
+        cli_mocks.load_config.return_value = {'token_file': 'tokens.json'}
         
-        mock_manager_instance = Mock()
+        mock_manager_instance = Mock(spec_set=TokenManager)
         mock_manager_instance.list_characters.return_value = ['12345', '67890']
         mock_manager_instance.get_token.side_effect = [
             {'CharacterName': 'Character 1', 'expires_at': 9999999999},
             {'CharacterName': 'Character 2', 'expires_at': 1000000000}
         ]
-        mock_manager_instance.is_token_expired.side_effect = [False, True]
-        mock_token_manager.return_value = mock_manager_instance
+        mock_manager_instance.expired_mask.return_value = [False, True]
+        cli_mocks.token_manager.return_value = mock_manager_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         cmd_list_tokens(args)
         
-        # Check that character info was printed
-        print_calls = [call[0][0] for call in mock_print.call_args_list if call[0]]
-        character_lines = [msg for msg in print_calls if 'Character' in msg and 'ID:' in msg]
-        assert len(character_lines) == 2
+        cli_mocks.print.assert_any_call("  - Character 1 (ID: 12345) - VALID")
+        cli_mocks.print.assert_any_call("  - Character 2 (ID: 67890) - EXPIRED")
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.EVEAuth')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.print')
-    def test_cmd_revoke_token_success(self, mock_print, mock_token_manager, mock_eve_auth, mock_load_config):
+    def test_cmd_revoke_token_success(self, cli_mocks):
         """Test successful token revocation."""
-        mock_load_config.return_value = {
+        cli_mocks.load_config.return_value = {
             'client_id': 'test_client_id',
             'client_secret': 'test_client_secret',
             'redirect_uri': 'http://localhost:8000/callback',
             'token_file': 'tokens.json'
         }
         
-        mock_auth_instance = Mock()
+        mock_auth_instance = Mock(spec_set=EVEAuth)
         mock_auth_instance.revoke_token.return_value = True
-        mock_eve_auth.return_value = mock_auth_instance
+        cli_mocks.eve_auth.return_value = mock_auth_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         args.character_id = '12345'
         cmd_revoke_token(args)
         
         mock_auth_instance.revoke_token.assert_called_once_with('12345')
-        mock_print.assert_called_with("Successfully revoked token for character 12345")
+        cli_mocks.print.assert_called_with("Successfully revoked token for character 12345")
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.ESIClient')
-    @patch('eveonline_api_util.cli.CharacterEndpoint')
-    @patch('eveonline_api_util.cli.EVEAuth')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.print')
-    def test_cmd_character_info_public(self, mock_print, mock_token_manager, mock_eve_auth, 
-                                      mock_char_endpoint, mock_esi_client, mock_load_config):
+    def test_cmd_character_info_public(self, cli_mocks):
         """Test getting public character information."""
-        mock_load_config.return_value = {
+        cli_mocks.load_config.return_value = {
             'client_id': 'test_client_id',
             'client_secret': 'test_client_secret',
             'redirect_uri': 'http://localhost:8000/callback',
             'token_file': 'tokens.json'
         }
         
-        mock_endpoint_instance = Mock()
+        mock_endpoint_instance = Mock(spec_set=CharacterEndpoint)
         mock_endpoint_instance.get_character_public_info.return_value = {
             'name': 'Test Character',
             'corporation_id': 12345
         }
-        mock_char_endpoint.return_value = mock_endpoint_instance
+        cli_mocks.character_endpoint.return_value = mock_endpoint_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         args.character_id = '12345'
         args.public = True
         
@@ -185,46 +220,37 @@ class TestCLI:
         
         mock_endpoint_instance.get_character_public_info.assert_called_once_with(12345)
     
-    @patch('eveonline_api_util.cli.load_config')
-    @patch('eveonline_api_util.cli.ESIClient')
-    @patch('eveonline_api_util.cli.WalletEndpoint')
-    @patch('eveonline_api_util.cli.EVEAuth')
-    @patch('eveonline_api_util.cli.TokenManager')
-    @patch('builtins.print')
-    def test_cmd_wallet_balance(self, mock_print, mock_token_manager, mock_eve_auth,
-                               mock_wallet_endpoint, mock_esi_client, mock_load_config):
+    def test_cmd_wallet_balance(self, cli_mocks):
         """Test getting wallet balance."""
-        mock_load_config.return_value = {
+        cli_mocks.load_config.return_value = {
             'client_id': 'test_client_id',
             'client_secret': 'test_client_secret',
             'redirect_uri': 'http://localhost:8000/callback',
             'token_file': 'tokens.json'
         }
         
-        mock_endpoint_instance = Mock()
+        mock_endpoint_instance = Mock(spec_set=WalletEndpoint)
         mock_endpoint_instance.get_character_wallet_balance.return_value = 1234567.89
-        mock_wallet_endpoint.return_value = mock_endpoint_instance
+        cli_mocks.wallet_endpoint.return_value = mock_endpoint_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         args.character_id = '12345'
         
         cmd_wallet_balance(args)
         
         mock_endpoint_instance.get_character_wallet_balance.assert_called_once_with('12345')
-        mock_print.assert_called_with("Wallet balance: 1,234,567.89 ISK")
+        cli_mocks.print.assert_called_with("Wallet balance: 1,234,567.89 ISK")
     
-    @patch('eveonline_api_util.cli.ESIClient')
-    @patch('builtins.print')
-    def test_cmd_server_status(self, mock_print, mock_esi_client):
+    def test_cmd_server_status(self, cli_mocks):
         """Test getting server status."""
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(spec_set=ESIClient)
         mock_client_instance.get_server_status.return_value = {
             'players': 12345,
             'server_version': '1.0.0'
         }
-        mock_esi_client.return_value = mock_client_instance
+        cli_mocks.esi_client.return_value = mock_client_instance
         
-        args = Mock()
+        args = Mock(spec=argparse.Namespace)
         cmd_server_status(args)
         
         mock_client_instance.get_server_status.assert_called_once()
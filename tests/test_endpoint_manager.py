@@ -0,0 +1,24 @@
+"""
+Tests for ESIEndpointManager
+"""
+
+from eveonline_api_util.cache import MemoryCache
+from eveonline_api_util.endpoint_manager import ESIEndpointManager
+
+
+class TestESIEndpointManager:
+    """Test ESIEndpointManager functionality."""
+    
+    def test_client_caches_by_default(self):
+        """Test the manager's client gets the default in-memory response cache."""
+        manager = ESIEndpointManager('client_id', 'client_secret', 'http://localhost/callback')
+        
+        assert isinstance(manager.client.cache, MemoryCache)
+        assert manager.universe.client is manager.client
+    
+    def test_cache_disabled(self):
+        """Test caching can still be turned off explicitly."""
+        manager = ESIEndpointManager('client_id', 'client_secret', 'http://localhost/callback',
+                                     cache=None)
+        
+        assert manager.client.cache is None
@@ -0,0 +1,29 @@
+"""
+Expected request bodies for endpoint write tests
+"""
+
+
+def _compact(**fields):
+    """Drop fields left as None, as the endpoints do for optional values."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def contacts_json(contact_ids, standing, watched=False, label_ids=None):
+    """Body of POST /characters/{character_id}/contacts/."""
+    return _compact(contact_ids=contact_ids, standing=standing, watched=watched,
+                    label_ids=label_ids or None)
+
+
+def fleet_update_json(is_free_move=None, motd=None):
+    """Body of PUT /fleets/{fleet_id}/."""
+    return _compact(is_free_move=is_free_move, motd=motd)
+
+
+def invite_json(character_id, role='squad_member', squad_id=None, wing_id=None):
+    """Body of POST /fleets/{fleet_id}/members/."""
+    return _compact(character_id=character_id, role=role, squad_id=squad_id, wing_id=wing_id)
+
+
+def move_json(role, squad_id=None, wing_id=None):
+    """Body of PUT /fleets/{fleet_id}/members/{member_id}/."""
+    return _compact(role=role, squad_id=squad_id, wing_id=wing_id)
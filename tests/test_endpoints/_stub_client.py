@@ -0,0 +1,55 @@
+"""
+Lightweight ESIClient stand-in for endpoint tests
+"""
+
+
+class StubESIClient:
+    """
+    Records client calls and returns canned results.
+
+    Endpoint classes only call a handful of ESIClient request methods, so a
+    plain recorder is enough and far cheaper than Mock(spec=ESIClient).
+    Register canned responses[(method, path)] for specific requests, set
+    returns[method] for a fixed result, or side_effects[method] for a
+    callable that receives the call's arguments.
+    """
+
+    METHODS = ('get', 'post', 'put', 'delete', 'get_paged')
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {}
+        self.returns = {}
+        self.side_effects = {}
+
+    def _record(self, method, args, kwargs):
+        self.calls.append((method, args, kwargs))
+        if args and (method, args[0]) in self.responses:
+            return self.responses[method, args[0]]
+        side_effect = self.side_effects.get(method)
+        if side_effect is not None:
+            return side_effect(*args, **kwargs)
+        return self.returns.get(method)
+
+    def get(self, *args, **kwargs):
+        return self._record('get', args, kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._record('post', args, kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._record('put', args, kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._record('delete', args, kwargs)
+
+    def get_paged(self, *args, **kwargs):
+        return self._record('get_paged', args, kwargs)
+
+    def assert_called(self, method, *args, **kwargs):
+        """Assert the stub received exactly one call, to method with these arguments."""
+        assert self.calls == [(method, args, kwargs)]
+
+    def call_count(self, method):
+        """Return the number of calls made to method."""
+        return sum(1 for call in self.calls if call[0] == method)
@@ -0,0 +1,86 @@
+"""
+Shared fixtures for endpoint tests
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+import pytest
+
+from eveonline_api_util.endpoints.character import CharacterEndpoint
+from eveonline_api_util.endpoints.fleet import FleetEndpoint
+from eveonline_api_util.endpoints.industry import IndustryEndpoint
+from eveonline_api_util.endpoints.mail import MailEndpoint
+from eveonline_api_util.endpoints.market import MarketEndpoint
+from eveonline_api_util.endpoints.universe import UniverseEndpoint
+from eveonline_api_util.endpoints.wallet import WalletEndpoint
+
+from ._stub_client import StubESIClient
+
+
+@pytest.fixture(scope="session")
+def samples():
+    """ESI response samples from samples.json, keyed by name; must not be mutated."""
+    return json.loads(Path(__file__).with_name('samples.json').read_text())
+
+
+@pytest.fixture
+def stub_client():
+    """Fresh call-recording ESIClient stand-in."""
+    return StubESIClient()
+
+
+@pytest.fixture(scope="session")
+def esi_client_spec():
+    """Build the spec'd ESIClient mock once per test session."""
+    from eveonline_api_util.esi_client import ESIClient
+    return Mock(spec=ESIClient)
+
+
+@pytest.fixture
+def mock_client(esi_client_spec):
+    """Return the shared ESIClient mock with calls and canned results cleared."""
+    esi_client_spec.reset_mock(return_value=True, side_effect=True)
+    return esi_client_spec
+
+
+@pytest.fixture
+def character_endpoint(stub_client):
+    """CharacterEndpoint bound to the stub client."""
+    return CharacterEndpoint(stub_client)
+
+
+@pytest.fixture
+def fleet_endpoint(stub_client):
+    """FleetEndpoint bound to the stub client."""
+    return FleetEndpoint(stub_client)
+
+
+@pytest.fixture
+def industry_endpoint(stub_client):
+    """IndustryEndpoint bound to the stub client."""
+    return IndustryEndpoint(stub_client)
+
+
+@pytest.fixture
+def mail_endpoint(stub_client):
+    """MailEndpoint bound to the stub client."""
+    return MailEndpoint(stub_client)
+
+
+@pytest.fixture
+def market_endpoint(stub_client):
+    """MarketEndpoint bound to the stub client."""
+    return MarketEndpoint(stub_client)
+
+
+@pytest.fixture
+def universe_endpoint(mock_client):
+    """UniverseEndpoint bound to the spec'd mock client."""
+    return UniverseEndpoint(mock_client)
+
+
+@pytest.fixture
+def wallet_endpoint(stub_client):
+    """WalletEndpoint bound to the stub client."""
+    return WalletEndpoint(stub_client)
@@ -2,293 +2,143 @@
 Tests for Fleet endpoint functionality
 """
 
-from unittest.mock import Mock
 import pytest
 
-from eveonline_api_util.endpoints.fleet import FleetEndpoint
-from eveonline_api_util.esi_client import ESIClient
+from ._builders import fleet_update_json, invite_json, move_json
+
+
+# (method, args, path, response sample name)
+GET_CASES = [
+    pytest.param(
+        'get_character_fleet_info', ('98765',),
+        '/characters/98765/fleet/', 'character_fleet_info',
+        id='character_fleet_info'
+    ),
+    pytest.param(
+        'get_fleet_info', (1234567890, '98765'),
+        '/fleets/1234567890/', 'fleet_info',
+        id='fleet_info'
+    ),
+    pytest.param(
+        'get_fleet_members', (1234567890, '98765'),
+        '/fleets/1234567890/members/', 'fleet_members',
+        id='members'
+    ),
+    pytest.param(
+        'get_fleet_wings', (1234567890, '98765'),
+        '/fleets/1234567890/wings/', 'fleet_wings',
+        id='wings'
+    ),
+]
+
+# (method, args, kwargs, HTTP method, path, JSON body or None, response sample name or None)
+WRITE_CASES = [
+    pytest.param(
+        'update_fleet_info', (1234567890, '98765'), {'is_free_move': True, 'motd': 'New MOTD'},
+        'put', '/fleets/1234567890/', fleet_update_json(is_free_move=True, motd='New MOTD'), None,
+        id='update_info_all_params'
+    ),
+    pytest.param(
+        'update_fleet_info', (1234567890, '98765'), {'is_free_move': False},
+        'put', '/fleets/1234567890/', fleet_update_json(is_free_move=False), None,
+        id='update_info_partial'
+    ),
+    pytest.param(
+        'update_fleet_info', (1234567890, '98765'), {},
+        'put', '/fleets/1234567890/', fleet_update_json(), None,
+        id='update_info_empty'
+    ),
+    pytest.param(
+        'invite_to_fleet', (1234567890, '98765', 99999), {},
+        'post', '/fleets/1234567890/members/', invite_json(99999), None,
+        id='invite_minimal'
+    ),
+    pytest.param(
+        'invite_to_fleet', (1234567890, '98765', 99999),
+        {'role': 'squad_commander', 'squad_id': 3, 'wing_id': 2},
+        'post', '/fleets/1234567890/members/',
+        invite_json(99999, role='squad_commander', squad_id=3, wing_id=2), None,
+        id='invite_full_params'
+    ),
+    pytest.param(
+        'kick_from_fleet', (1234567890, '98765', 99999), {},
+        'delete', '/fleets/1234567890/members/99999/', None, None,
+        id='kick'
+    ),
+    pytest.param(
+        'move_fleet_member', (1234567890, '98765', 99999, 'wing_commander'), {},
+        'put', '/fleets/1234567890/members/99999/', move_json('wing_commander'), None,
+        id='move_minimal'
+    ),
+    pytest.param(
+        'move_fleet_member', (1234567890, '98765', 99999, 'squad_commander'),
+        {'squad_id': 5, 'wing_id': 3},
+        'put', '/fleets/1234567890/members/99999/',
+        move_json('squad_commander', squad_id=5, wing_id=3), None,
+        id='move_full_params'
+    ),
+    pytest.param(
+        'create_fleet_wing', (1234567890, '98765'), {},
+        'post', '/fleets/1234567890/wings/', {}, 'fleet_create_wing',
+        id='create_wing'
+    ),
+    pytest.param(
+        'delete_fleet_wing', (1234567890, '98765', 4), {},
+        'delete', '/fleets/1234567890/wings/4/', None, None,
+        id='delete_wing'
+    ),
+    pytest.param(
+        'rename_fleet_wing', (1234567890, '98765', 4, 'New Wing Name'), {},
+        'put', '/fleets/1234567890/wings/4/', {'name': 'New Wing Name'}, None,
+        id='rename_wing'
+    ),
+    pytest.param(
+        'create_fleet_squad', (1234567890, '98765', 4), {},
+        'post', '/fleets/1234567890/wings/4/squads/', {}, 'fleet_create_squad',
+        id='create_squad'
+    ),
+    pytest.param(
+        'delete_fleet_squad', (1234567890, '98765', 4, 6), {},
+        'delete', '/fleets/1234567890/wings/4/squads/6/', None, None,
+        id='delete_squad'
+    ),
+    pytest.param(
+        'rename_fleet_squad', (1234567890, '98765', 4, 6, 'New Squad Name'), {},
+        'put', '/fleets/1234567890/wings/4/squads/6/', {'name': 'New Squad Name'}, None,
+        id='rename_squad'
+    ),
+]
 
 
 class TestFleetEndpoint:
     """Test FleetEndpoint functionality."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_client = Mock(spec=ESIClient)
-        self.endpoint = FleetEndpoint(self.mock_client)
-    
-    def test_init(self):
+    def test_init(self, stub_client, fleet_endpoint):
         """Test FleetEndpoint initialization."""
-        assert self.endpoint.client == self.mock_client
-    
-    def test_get_character_fleet_info(self):
-        """Test getting character's current fleet information."""
-        expected_data = {
-            'fleet_id': 1234567890,
-            'role': 'squad_member',
-            'squad_id': 3,
-            'wing_id': 2
-        }
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_character_fleet_info('98765')
-        
-        self.mock_client.get.assert_called_once_with('/characters/98765/fleet/', character_id='98765')
-        assert result == expected_data
-    
-    def test_get_fleet_info(self):
-        """Test getting fleet information."""
-        expected_data = {
-            'is_free_move': False,
-            'is_registered': False,
-            'is_voice_enabled': False,
-            'motd': 'This is the fleet MOTD'
-        }
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_fleet_info(1234567890, '98765')
-        
-        self.mock_client.get.assert_called_once_with('/fleets/1234567890/', character_id='98765')
-        assert result == expected_data
-    
-    def test_update_fleet_info_all_params(self):
-        """Test updating fleet information with all parameters."""
-        self.endpoint.update_fleet_info(1234567890, '98765', is_free_move=True, motd='New MOTD')
-        
-        expected_json = {
-            'is_free_move': True,
-            'motd': 'New MOTD'
-        }
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_update_fleet_info_partial(self):
-        """Test updating fleet information with partial parameters."""
-        self.endpoint.update_fleet_info(1234567890, '98765', is_free_move=False)
-        
-        expected_json = {
-            'is_free_move': False
-        }
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_update_fleet_info_empty(self):
-        """Test updating fleet information with no parameters."""
-        self.endpoint.update_fleet_info(1234567890, '98765')
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/', 
-            character_id='98765', 
-            json_data={}
-        )
-    
-    def test_get_fleet_members(self):
-        """Test getting fleet members."""
-        expected_data = [
-            {
-                'character_id': 98765,
-                'join_time': '2016-04-29T12:34:56Z',
-                'role': 'squad_member',
-                'role_name': 'Squad Member',
-                'ship_type_id': 33328,
-                'solar_system_id': 30003729,
-                'squad_id': 3,
-                'station_id': 61000180,
-                'takes_fleet_warp': True,
-                'wing_id': 2
-            }
-        ]
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_fleet_members(1234567890, '98765')
-        
-        self.mock_client.get.assert_called_once_with('/fleets/1234567890/members/', character_id='98765')
-        assert result == expected_data
-    
-    def test_invite_to_fleet_minimal(self):
-        """Test inviting character to fleet with minimal parameters."""
-        self.endpoint.invite_to_fleet(1234567890, '98765', 99999)
-        
-        expected_json = {
-            'character_id': 99999,
-            'role': 'squad_member'
-        }
-        
-        self.mock_client.post.assert_called_once_with(
-            '/fleets/1234567890/members/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
+        assert fleet_endpoint.client == stub_client
     
-    def test_invite_to_fleet_full_params(self):
-        """Test inviting character to fleet with all parameters."""
-        self.endpoint.invite_to_fleet(
-            1234567890, '98765', 99999, 
-            role='squad_commander', 
-            squad_id=3, 
-            wing_id=2
-        )
+    @pytest.mark.parametrize("method,args,path,sample", GET_CASES)
+    def test_get_endpoint(self, stub_client, fleet_endpoint, samples, method, args, path, sample):
+        """Test GET wrappers request the right path and return the response data."""
+        data = samples[sample]
+        stub_client.responses['get', path] = data
         
-        expected_json = {
-            'character_id': 99999,
-            'role': 'squad_commander',
-            'squad_id': 3,
-            'wing_id': 2
-        }
-        
-        self.mock_client.post.assert_called_once_with(
-            '/fleets/1234567890/members/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_kick_from_fleet(self):
-        """Test kicking member from fleet."""
-        self.endpoint.kick_from_fleet(1234567890, '98765', 99999)
-        
-        self.mock_client.delete.assert_called_once_with(
-            '/fleets/1234567890/members/99999/', 
-            character_id='98765'
-        )
-    
-    def test_move_fleet_member_minimal(self):
-        """Test moving fleet member with minimal parameters."""
-        self.endpoint.move_fleet_member(1234567890, '98765', 99999, 'wing_commander')
-        
-        expected_json = {
-            'role': 'wing_commander'
-        }
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/members/99999/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_move_fleet_member_full_params(self):
-        """Test moving fleet member with all parameters."""
-        self.endpoint.move_fleet_member(
-            1234567890, '98765', 99999, 
-            'squad_commander', 
-            squad_id=5, 
-            wing_id=3
-        )
-        
-        expected_json = {
-            'role': 'squad_commander',
-            'squad_id': 5,
-            'wing_id': 3
-        }
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/members/99999/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_get_fleet_wings(self):
-        """Test getting fleet wings."""
-        expected_data = [
-            {
-                'id': 2,
-                'name': 'Wing 1',
-                'squads': [
-                    {
-                        'id': 3,
-                        'name': 'Squad 1'
-                    }
-                ]
-            }
-        ]
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_fleet_wings(1234567890, '98765')
-        
-        self.mock_client.get.assert_called_once_with('/fleets/1234567890/wings/', character_id='98765')
-        assert result == expected_data
-    
-    def test_create_fleet_wing(self):
-        """Test creating new fleet wing."""
-        expected_data = {
-            'wing_id': 4
-        }
-        self.mock_client.post.return_value = expected_data
-        
-        result = self.endpoint.create_fleet_wing(1234567890, '98765')
-        
-        self.mock_client.post.assert_called_once_with(
-            '/fleets/1234567890/wings/', 
-            character_id='98765', 
-            json_data={}
-        )
-        assert result == expected_data
-    
-    def test_delete_fleet_wing(self):
-        """Test deleting fleet wing."""
-        self.endpoint.delete_fleet_wing(1234567890, '98765', 4)
-        
-        self.mock_client.delete.assert_called_once_with(
-            '/fleets/1234567890/wings/4/', 
-            character_id='98765'
-        )
-    
-    def test_rename_fleet_wing(self):
-        """Test renaming fleet wing."""
-        self.endpoint.rename_fleet_wing(1234567890, '98765', 4, 'New Wing Name')
-        
-        expected_json = {
-            'name': 'New Wing Name'
-        }
-        
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/wings/4/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
-    
-    def test_create_fleet_squad(self):
-        """Test creating new fleet squad."""
-        expected_data = {
-            'squad_id': 6
-        }
-        self.mock_client.post.return_value = expected_data
-        
-        result = self.endpoint.create_fleet_squad(1234567890, '98765', 4)
-        
-        self.mock_client.post.assert_called_once_with(
-            '/fleets/1234567890/wings/4/squads/', 
-            character_id='98765', 
-            json_data={}
-        )
-        assert result == expected_data
-    
-    def test_delete_fleet_squad(self):
-        """Test deleting fleet squad."""
-        self.endpoint.delete_fleet_squad(1234567890, '98765', 4, 6)
+        result = getattr(fleet_endpoint, method)(*args)
         
-        self.mock_client.delete.assert_called_once_with(
-            '/fleets/1234567890/wings/4/squads/6/', 
-            character_id='98765'
-        )
+        stub_client.assert_called('get', path, character_id='98765')
+        assert result is data
     
-    def test_rename_fleet_squad(self):
-        """Test renaming fleet squad."""
-        self.endpoint.rename_fleet_squad(1234567890, '98765', 4, 6, 'New Squad Name')
+    @pytest.mark.parametrize("method,args,kwargs,http_method,path,json_data,sample", WRITE_CASES)
+    def test_write_endpoint(self, stub_client, fleet_endpoint, samples, method, args, kwargs,
+                            http_method, path, json_data, sample):
+        """Test POST/PUT/DELETE wrappers send the right path and body."""
+        data = samples[sample] if sample else None
+        stub_client.responses[http_method, path] = data
         
-        expected_json = {
-            'name': 'New Squad Name'
-        }
+        result = getattr(fleet_endpoint, method)(*args, **kwargs)
         
-        self.mock_client.put.assert_called_once_with(
-            '/fleets/1234567890/wings/4/squads/6/', 
-            character_id='98765', 
-            json_data=expected_json
-        )
+        if json_data is None:
+            stub_client.assert_called(http_method, path, character_id='98765')
+        else:
+            stub_client.assert_called(http_method, path, character_id='98765', json_data=json_data)
+        assert result is data
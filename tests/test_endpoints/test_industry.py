@@ -0,0 +1,41 @@
+"""
+Tests for Industry endpoint functionality
+"""
+
+import pytest
+
+
+# (method, args, kwargs, path, pre-encoded query string)
+QUERY_CASES = [
+    pytest.param(
+        'get_character_industry_jobs', ('98765',), {},
+        '/characters/98765/industry/jobs/', 'include_completed=false',
+        id='character_jobs'
+    ),
+    pytest.param(
+        'get_character_industry_jobs', ('98765',), {'include_completed': True},
+        '/characters/98765/industry/jobs/', 'include_completed=true',
+        id='character_jobs_completed'
+    ),
+    pytest.param(
+        'get_corporation_industry_jobs', (12345, '98765'), {},
+        '/corporations/12345/industry/jobs/', 'include_completed=false&page=1',
+        id='corporation_jobs'
+    ),
+    pytest.param(
+        'get_corporation_industry_jobs', (12345, '98765'), {'include_completed': True, 'page': 3},
+        '/corporations/12345/industry/jobs/', 'include_completed=true&page=3',
+        id='corporation_jobs_completed'
+    ),
+]
+
+
+class TestIndustryEndpoint:
+    """Test IndustryEndpoint functionality."""
+    
+    @pytest.mark.parametrize("method,args,kwargs,path,query", QUERY_CASES)
+    def test_job_queries(self, stub_client, industry_endpoint, method, args, kwargs, path, query):
+        """Test include_completed is sent as lowercase true/false in a pre-encoded query."""
+        getattr(industry_endpoint, method)(*args, **kwargs)
+        
+        stub_client.assert_called('get', path, character_id='98765', params=query)
@@ -0,0 +1,28 @@
+"""
+Tests for Mail endpoint functionality
+"""
+
+import pytest
+
+
+# (kwargs, pre-encoded query string)
+MAIL_QUERY_CASES = [
+    pytest.param({}, '', id='no_filters'),
+    pytest.param({'labels': [1, 3]}, 'labels=1%2C3', id='labels'),
+    pytest.param({'last_mail_id': 331477591}, 'last_mail_id=331477591', id='last_mail_id'),
+    pytest.param(
+        {'labels': [2], 'last_mail_id': 331477591}, 'labels=2&last_mail_id=331477591',
+        id='labels_and_last_mail_id'
+    ),
+]
+
+
+class TestMailEndpoint:
+    """Test MailEndpoint functionality."""
+    
+    @pytest.mark.parametrize("kwargs,query", MAIL_QUERY_CASES)
+    def test_get_character_mail_query(self, stub_client, mail_endpoint, kwargs, query):
+        """Test mail filters are sent as a pre-encoded query string."""
+        mail_endpoint.get_character_mail('98765', **kwargs)
+        
+        stub_client.assert_called('get', '/characters/98765/mail/', character_id='98765', params=query)
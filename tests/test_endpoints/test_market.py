@@ -0,0 +1,141 @@
+"""
+Tests for Market endpoint functionality
+"""
+
+import asyncio
+from types import MappingProxyType
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from eveonline_api_util.async_client import AsyncESIClient
+from eveonline_api_util.endpoints.market import CHARACTER_ORDER_HISTORY_DTYPE, MarketEndpoint
+
+# Read-only ESI records shared by the tests below
+_HISTORY_RECORDS = (
+    MappingProxyType({
+        'average': 5.25,
+        'date': '2015-05-01',
+        'highest': 5.27,
+        'lowest': 5.11,
+        'order_count': 2267,
+        'volume': 16276782035
+    }),
+    MappingProxyType({
+        'average': 5.30,
+        'date': '2015-05-02',
+        'highest': 5.40,
+        'lowest': 5.20,
+        'order_count': 1000,
+        'volume': 1000
+    }),
+)
+
+_ORDER_RECORDS = (
+    MappingProxyType({
+        'duration': 90,
+        'is_buy_order': False,
+        'issued': '2016-09-03T05:12:25Z',
+        'location_id': 60005599,
+        'min_volume': 1,
+        'order_id': 4623824223,
+        'price': 9.9,
+        'range': 'region',
+        'system_id': 30000053,
+        'type_id': 34,
+        'volume_remain': 1296000,
+        'volume_total': 2000000
+    }),
+)
+
+_ORDER_HISTORY_RECORDS = (
+    MappingProxyType({
+        'duration': 30,
+        'issued': '2016-09-03T05:12:25Z',
+        'location_id': 456,
+        'order_id': 123,
+        'price': 33.3,
+        'range': 'station',
+        'region_id': 123,
+        'state': 'expired',
+        'type_id': 456,
+        'volume_remain': 4422,
+        'volume_total': 123456
+    }),
+)
+
+
+class TestMarketEndpoint:
+    """Test MarketEndpoint functionality."""
+    
+    def test_get_market_history_np(self, stub_client, market_endpoint):
+        """Test getting market history as a structured array."""
+        stub_client.returns['get'] = list(_HISTORY_RECORDS)
+        
+        result = market_endpoint.get_market_history_np(10000002, 34)
+        
+        stub_client.assert_called('get', '/markets/10000002/history/', params={'type_id': 34})
+        assert result.shape == (2,)
+        assert result['date'][0] == '2015-05-01'
+        assert result['volume'].sum() == 16276783035
+        assert result['lowest'].min() == pytest.approx(5.11)
+    
+    def test_get_market_history_np_empty(self, stub_client, market_endpoint):
+        """Test empty market history returns an empty array."""
+        stub_client.returns['get'] = []
+        
+        result = market_endpoint.get_market_history_np(10000002, 34)
+        
+        assert result.shape == (0,)
+        assert 'average' in result.dtype.names
+    
+    def test_get_market_orders_np(self, stub_client, market_endpoint):
+        """Test getting market orders as a structured array."""
+        stub_client.returns['get'] = list(_ORDER_RECORDS)
+        
+        result = market_endpoint.get_market_orders_np(10000002, order_type='sell', type_id=34)
+        
+        stub_client.assert_called(
+            'get', '/markets/10000002/orders/',
+            params='order_type=sell&page=1&type_id=34'
+        )
+        assert result['order_id'][0] == 4623824223
+        assert not result['is_buy_order'][0]
+        assert result['range'][0] == 'region'
+    
+    def test_get_character_orders_history_np_missing_fields(self, stub_client, market_endpoint):
+        """Test optional fields missing from ESI records fall back to defaults."""
+        stub_client.returns['get'] = list(_ORDER_HISTORY_RECORDS)
+        
+        result = market_endpoint.get_character_orders_history_np('98765')
+        
+        assert result['escrow'][0] == 0.0
+        assert not result['is_buy_order'][0]
+        assert result['state'][0] == 'expired'
+    
+    def test_np_variants_async(self):
+        """Test array variants await the response with an async client."""
+        client = Mock(spec=AsyncESIClient)
+        
+        async def get(endpoint, **kwargs):
+            if '/history/' in endpoint:
+                return list(_HISTORY_RECORDS)
+            return list(_ORDER_RECORDS)
+        
+        client.get.side_effect = get
+        endpoint = MarketEndpoint(client)
+        
+        async def scenario():
+            return await asyncio.gather(
+                endpoint.get_market_history_np(10000002, 34),
+                endpoint.get_market_orders_np(10000002, order_type='sell'),
+                endpoint.get_character_orders_history_np('98765'),
+            )
+        
+        history, orders, order_history = asyncio.run(scenario())
+        
+        assert history['volume'].sum() == 16276783035
+        assert orders['order_id'][0] == 4623824223
+        assert order_history.dtype.names == tuple(name for name, _ in CHARACTER_ORDER_HISTORY_DTYPE)
@@ -0,0 +1,40 @@
+"""
+Tests keeping the endpoint test stub in line with ESIClient
+"""
+
+from eveonline_api_util.esi_client import ESIClient
+
+from ._stub_client import StubESIClient
+
+
+class TestStubESIClient:
+    """Test StubESIClient mirrors the ESIClient interface."""
+    
+    def test_methods_exist_on_esi_client(self):
+        """Test every stubbed method is part of the real client interface."""
+        for name in StubESIClient.METHODS:
+            assert callable(getattr(ESIClient, name))
+    
+    def test_records_calls(self):
+        """Test calls are recorded and canned results returned."""
+        stub = StubESIClient()
+        stub.returns['get'] = {'ok': True}
+        stub.side_effects['post'] = lambda endpoint, json_data: json_data
+        
+        assert stub.get('/status/', character_id='1') == {'ok': True}
+        assert stub.post('/names/', json_data=[1]) == [1]
+        assert stub.calls == [
+            ('get', ('/status/',), {'character_id': '1'}),
+            ('post', ('/names/',), {'json_data': [1]}),
+        ]
+        assert stub.call_count('get') == 1
+    
+    def test_responses_by_path(self):
+        """Test canned responses are matched on method and path before returns."""
+        stub = StubESIClient()
+        stub.returns['get'] = 'fallback'
+        stub.responses['get', '/status/'] = {'players': 1}
+        
+        assert stub.get('/status/') == {'players': 1}
+        assert stub.get('/other/') == 'fallback'
+        assert stub.post('/status/') is None
@@ -0,0 +1,133 @@
+"""
+Tests for Universe endpoint functionality
+"""
+
+import asyncio
+from array import array
+from unittest.mock import Mock, call
+
+import pytest
+
+from eveonline_api_util.async_client import AsyncESIClient
+from eveonline_api_util.endpoints.universe import BulkResolver, UniverseEndpoint
+
+
+def _names(ids):
+    """Build a /universe/names/ response for ids."""
+    return [{'id': i, 'name': f'Item {i}', 'category': 'inventory_type'} for i in ids]
+
+
+_COALESCED_NAMES_CALL = call('/universe/names/', json_data=[34, 35, 36],
+                             headers={'Accept-Language': 'en'})
+
+
+async def _post_names(endpoint, json_data, headers):
+    """Async stand-in for client.post on /universe/names/."""
+    return _names(json_data)
+
+
+class TestUniverseEndpoint:
+    """Test UniverseEndpoint functionality."""
+    
+    def test_resolve_many_chunks_requests(self, mock_client, universe_endpoint):
+        """Test IDs are de-duplicated and sent in chunks of 1000."""
+        mock_client.post.side_effect = lambda endpoint, json_data, headers: _names(json_data)
+        ids = list(range(2500)) + [1, 2, 3]
+        
+        result = universe_endpoint.resolve_many(ids)
+        
+        assert len(result) == 2500
+        assert result[42]['name'] == 'Item 42'
+        assert [len(c.kwargs['json_data']) for c in mock_client.post.call_args_list] == [1000, 1000, 500]
+    
+    def test_resolve_many_async(self):
+        """Test chunks are gathered and indexed once awaited with an async client."""
+        client = Mock(spec=AsyncESIClient)
+        client.post.side_effect = _post_names
+        
+        result = asyncio.run(UniverseEndpoint(client).resolve_many(list(range(2500)) + [1, 2, 3]))
+        
+        assert len(result) == 2500
+        assert result[42]['name'] == 'Item 42'
+        assert [len(c.kwargs['json_data']) for c in client.post.call_args_list] == [1000, 1000, 500]
+    
+    def test_resolve_many_async_no_ids(self):
+        """Test an empty ID list still returns an awaitable with an async client."""
+        client = Mock(spec=AsyncESIClient)
+        
+        assert asyncio.run(UniverseEndpoint(client).resolve_many([])) == {}
+        client.post.assert_not_called()
+    
+    @pytest.mark.parametrize("method,path", [
+        pytest.param('get_universe_constellations', '/universe/constellations/', id='constellations'),
+        pytest.param('get_universe_regions', '/universe/regions/', id='regions'),
+        pytest.param('get_universe_systems', '/universe/systems/', id='systems'),
+    ])
+    def test_id_lists_as_array(self, mock_client, universe_endpoint, method, path):
+        """Test as_array fetches a packed array('q') instead of a list."""
+        mock_client.get_id_array.return_value = array('q', [20000001, 20000002])
+        
+        result = getattr(universe_endpoint, method)(as_array=True)
+        
+        mock_client.get_id_array.assert_called_once_with(path)
+        mock_client.get.assert_not_called()
+        assert isinstance(result, array) and result.typecode == 'q'
+        assert list(result) == [20000001, 20000002]
+    
+    def test_bulk_resolver_coalesces_loads(self, mock_client, universe_endpoint):
+        """Test concurrent loads are sent as one request."""
+        mock_client.post.side_effect = _post_names
+        resolver = universe_endpoint.bulk_resolver()
+        
+        async def scenario():
+            results = await asyncio.gather(*[resolver.load(i) for i in (34, 35, 36, 34)])
+            cached = await resolver.load(35)
+            return results, cached
+        
+        results, cached = asyncio.run(scenario())
+        
+        assert [r['id'] for r in results] == [34, 35, 36, 34]
+        assert cached['name'] == 'Item 35'
+        assert mock_client.post.call_args_list == [_COALESCED_NAMES_CALL]
+    
+    def test_bulk_resolver_holds_flush_tasks(self, mock_client, universe_endpoint):
+        """Test flush tasks are referenced while running and released once done."""
+        mock_client.post.side_effect = _post_names
+        resolver = universe_endpoint.bulk_resolver()
+        
+        async def scenario():
+            pending = asyncio.ensure_future(resolver.load(34))
+            await asyncio.sleep(0)
+            resolver._dispatch()
+            running = set(resolver._flush_tasks)
+            await pending
+            await asyncio.sleep(0)
+            return running
+        
+        running = asyncio.run(scenario())
+        
+        assert len(running) == 1
+        assert resolver._flush_tasks == set()
+    
+    def test_bulk_resolver_splits_full_batches(self, mock_client, universe_endpoint):
+        """Test a batch is flushed as soon as it reaches the size limit."""
+        mock_client.post.side_effect = _post_names
+        resolver = BulkResolver(universe_endpoint, batch_size=2)
+        
+        results = asyncio.run(resolver.load_many([1, 2, 3]))
+        
+        assert [r['id'] for r in results] == [1, 2, 3]
+        assert mock_client.post.call_count == 2
+    
+    def test_bulk_resolver_missing_id(self, mock_client, universe_endpoint):
+        """Test IDs missing from the response raise KeyError."""
+        mock_client.post.return_value = _names([1])
+        resolver = universe_endpoint.bulk_resolver()
+        
+        async def scenario():
+            return await asyncio.gather(resolver.load(1), resolver.load(2), return_exceptions=True)
+        
+        found, missing = asyncio.run(scenario())
+        
+        assert found['id'] == 1
+        assert isinstance(missing, KeyError)
@@ -6,211 +6,149 @@ from unittest.mock import Mock
 import pytest
 
 from eveonline_api_util.endpoints.wallet import WalletEndpoint
-from eveonline_api_util.esi_client import ESIClient
+
+
+# (method, args, kwargs, path, query params or None, response sample name)
+GET_CASES = [
+    pytest.param(
+        'get_character_wallet_balance', ('98765',), {},
+        '/characters/98765/wallet/', None, 'wallet_character_balance',
+        id='character_balance'
+    ),
+    pytest.param(
+        'get_character_wallet_journal', ('98765',), {'page': 2},
+        '/characters/98765/wallet/journal/', {'page': 2}, 'wallet_character_journal',
+        id='character_journal'
+    ),
+    pytest.param(
+        'get_character_wallet_journal', ('98765',), {},
+        '/characters/98765/wallet/journal/', {'page': 1}, 'empty_list',
+        id='character_journal_default_page'
+    ),
+    pytest.param(
+        'get_character_wallet_transactions', ('98765',), {'from_id': 123456},
+        '/characters/98765/wallet/transactions/', {'from_id': 123456}, 'wallet_character_transactions',
+        id='character_transactions'
+    ),
+    pytest.param(
+        'get_character_wallet_transactions', ('98765',), {},
+        '/characters/98765/wallet/transactions/', {}, 'empty_list',
+        id='character_transactions_no_from_id'
+    ),
+    pytest.param(
+        'get_corporation_wallets', (12345, '98765'), {},
+        '/corporations/12345/wallets/', None, 'wallet_corporation_wallets',
+        id='corporation_wallets'
+    ),
+    pytest.param(
+        'get_corporation_wallet_journal', (12345, 1, '98765'), {'page': 3},
+        '/corporations/12345/wallets/1/journal/', {'page': 3}, 'wallet_corporation_journal',
+        id='corporation_journal'
+    ),
+    pytest.param(
+        'get_corporation_wallet_journal', (12345, 2, '98765'), {},
+        '/corporations/12345/wallets/2/journal/', {'page': 1}, 'empty_list',
+        id='corporation_journal_default_page'
+    ),
+    pytest.param(
+        'get_corporation_wallet_transactions', (12345, 1, '98765'), {'from_id': 999999},
+        '/corporations/12345/wallets/1/transactions/', {'from_id': 999999}, 'wallet_corporation_transactions',
+        id='corporation_transactions'
+    ),
+    pytest.param(
+        'get_corporation_wallet_transactions', (12345, 3, '98765'), {},
+        '/corporations/12345/wallets/3/transactions/', {}, 'empty_list',
+        id='corporation_transactions_no_from_id'
+    ),
+]
 
 
 class TestWalletEndpoint:
     """Test WalletEndpoint functionality."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_client = Mock(spec=ESIClient)
-        self.endpoint = WalletEndpoint(self.mock_client)
-    
-    def test_init(self):
+    def test_init(self, stub_client, wallet_endpoint):
         """Test WalletEndpoint initialization."""
-        assert self.endpoint.client == self.mock_client
-    
-    def test_get_character_wallet_balance(self):
-        """Test getting character wallet balance."""
-        expected_balance = 1234567.89
-        self.mock_client.get.return_value = expected_balance
-        
-        result = self.endpoint.get_character_wallet_balance('98765')
-        
-        self.mock_client.get.assert_called_once_with('/characters/98765/wallet/', character_id='98765')
-        assert result == expected_balance
-    
-    def test_get_character_wallet_journal(self):
-        """Test getting character wallet journal."""
-        expected_data = [
-            {
-                'amount': 1000000.0,
-                'balance': 500000000.0,
-                'context_id': 4,
-                'context_id_type': 'structure_id',
-                'date': '2018-02-23T14:31:32Z',
-                'description': 'Market escrow',
-                'first_party_id': 2112625428,
-                'id': 89,
-                'reason': '',
-                'ref_type': 'market_escrow',
-                'second_party_id': 1000132
-            }
-        ]
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_character_wallet_journal('98765', page=2)
-        
-        self.mock_client.get.assert_called_once_with(
-            '/characters/98765/wallet/journal/', 
-            character_id='98765', 
-            params={'page': 2}
-        )
-        assert result == expected_data
-    
-    def test_get_character_wallet_journal_default_page(self):
-        """Test getting character wallet journal with default page."""
-        expected_data = []
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_character_wallet_journal('98765')
-        
-        self.mock_client.get.assert_called_once_with(
-            '/characters/98765/wallet/journal/', 
-            character_id='98765', 
-            params={'page': 1}
-        )
-        assert result == expected_data
+        assert wallet_endpoint.client == stub_client
     
-    def test_get_character_wallet_transactions(self):
-        """Test getting character wallet transactions."""
-        expected_data = [
-            {
-                'client_id': 54321,
-                'date': '2016-10-24T09:00:00Z',
-                'is_buy': True,
-                'is_personal': True,
-                'journal_ref_id': 67890,
-                'location_id': 60014719,
-                'quantity': 1,
-                'transaction_id': 1234567890,
-                'type_id': 587,
-                'unit_price': 1.0
-            }
-        ]
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_character_wallet_transactions('98765', from_id=123456)
-        
-        self.mock_client.get.assert_called_once_with(
-            '/characters/98765/wallet/transactions/', 
-            character_id='98765', 
-            params={'from_id': 123456}
-        )
-        assert result == expected_data
+    @pytest.mark.parametrize("method,args,kwargs,path,params,sample", GET_CASES)
+    def test_get_endpoint(self, stub_client, wallet_endpoint, samples, method, args, kwargs,
+                          path, params, sample):
+        """Test GET wrappers request the right path and return the response data."""
+        data = samples[sample]
+        stub_client.responses['get', path] = data
+        
+        result = getattr(wallet_endpoint, method)(*args, **kwargs)
+        
+        if params is None:
+            stub_client.assert_called('get', path, character_id='98765')
+        else:
+            stub_client.assert_called('get', path, character_id='98765', params=params)
+        assert result is data
     
-    def test_get_character_wallet_transactions_no_from_id(self):
-        """Test getting character wallet transactions without from_id."""
-        expected_data = []
-        self.mock_client.get.return_value = expected_data
+    def test_get_character_wallet_journal_fetch_all(self, stub_client, wallet_endpoint):
+        """Test fetching every wallet journal page."""
+        stub_client.returns['get_paged'] = [{'id': 1}, {'id': 2}]
         
-        result = self.endpoint.get_character_wallet_transactions('98765')
+        result = wallet_endpoint.get_character_wallet_journal('98765', fetch_all=True)
         
-        self.mock_client.get.assert_called_once_with(
-            '/characters/98765/wallet/transactions/', 
-            character_id='98765', 
-            params={}
+        stub_client.assert_called(
+            'get_paged', '/characters/98765/wallet/journal/', character_id='98765'
         )
-        assert result == expected_data
+        assert result == [{'id': 1}, {'id': 2}]
     
-    def test_get_corporation_wallets(self):
-        """Test getting corporation wallet information."""
-        expected_data = [
-            {
-                'balance': 123456.78,
-                'division': 1
-            },
-            {
-                'balance': 999999.99,
-                'division': 2
-            }
+    def test_journal_to_frame(self):
+        """Test journal entries are converted to columns and summed per ref_type."""
+        np = pytest.importorskip('numpy')
+        entries = [
+            {'id': 1, 'amount': 100.0, 'balance': 100.0, 'ref_type': 'bounty_prizes'},
+            {'id': 2, 'amount': -40.0, 'balance': 60.0, 'ref_type': 'market_escrow'},
+            {'id': 3, 'amount': 25.0, 'balance': 85.0, 'ref_type': 'bounty_prizes'},
+            {'id': 4, 'balance': 85.0, 'ref_type': 'player_donation'},
         ]
-        self.mock_client.get.return_value = expected_data
         
-        result = self.endpoint.get_corporation_wallets(12345, '98765')
+        frame = WalletEndpoint.journal_to_frame(entries)
+        totals = WalletEndpoint.sum_by_ref_type(frame['amount'], frame['ref_type_code'],
+                                                len(frame['ref_types']))
         
-        self.mock_client.get.assert_called_once_with('/corporations/12345/wallets/', character_id='98765')
-        assert result == expected_data
+        assert frame['id'].dtype == np.int64
+        assert list(frame['ref_types']) == ['bounty_prizes', 'market_escrow', 'player_donation']
+        assert list(frame['ref_type_code']) == [0, 1, 0, 2]
+        assert totals.tolist() == [125.0, -40.0, 0.0]
+        assert len(WalletEndpoint.journal_to_frame([])['amount']) == 0
     
-    def test_get_corporation_wallet_journal(self):
-        """Test getting corporation wallet journal."""
-        expected_data = [
-            {
-                'amount': 10000.0,
-                'balance': 500000.0,
-                'context_id': 4,
-                'context_id_type': 'contract_id',
-                'date': '2018-02-23T14:31:32Z',
-                'description': 'Contract reward',
-                'first_party_id': 2112625428,
-                'id': 123,
-                'reason': '',
-                'ref_type': 'contract_reward',
-                'second_party_id': 1000132
-            }
+    def test_get_character_wallet_journal_interns_ref_type(self, stub_client, wallet_endpoint):
+        """Test repeated ref_type strings share a single object."""
+        stub_client.returns['get'] = [
+            {'id': 1, 'ref_type': ''.join(['market_', 'escrow'])},
+            {'id': 2, 'ref_type': ''.join(['market_', 'escrow'])},
         ]
-        self.mock_client.get.return_value = expected_data
         
-        result = self.endpoint.get_corporation_wallet_journal(12345, 1, '98765', page=3)
+        result = wallet_endpoint.get_character_wallet_journal('98765')
         
-        self.mock_client.get.assert_called_once_with(
-            '/corporations/12345/wallets/1/journal/', 
-            character_id='98765', 
-            params={'page': 3}
-        )
-        assert result == expected_data
+        assert result[0]['ref_type'] is result[1]['ref_type']
     
-    def test_get_corporation_wallet_journal_default_page(self):
-        """Test getting corporation wallet journal with default page."""    
-        expected_data = []
-        self.mock_client.get.return_value = expected_data
+    def test_fetch_all_corporation_wallets(self, stub_client, wallet_endpoint):
+        """Test every division's journal is fetched in full."""
+        stub_client.side_effects['get_paged'] = lambda endpoint, character_id: [{'endpoint': endpoint}]
         
-        result = self.endpoint.get_corporation_wallet_journal(12345, 2, '98765')
+        result = wallet_endpoint.fetch_all_corporation_wallets(98000001, '98765')
         
-        self.mock_client.get.assert_called_once_with(
-            '/corporations/12345/wallets/2/journal/', 
-            character_id='98765', 
-            params={'page': 1}
-        )
-        assert result == expected_data
+        assert sorted(result) == list(range(1, 8))
+        assert result[3] == [{'endpoint': '/corporations/98000001/wallets/3/journal/'}]
+        assert stub_client.call_count('get_paged') == 7
     
-    def test_get_corporation_wallet_transactions(self):
-        """Test getting corporation wallet transactions."""
-        expected_data = [
-            {
-                'client_id': 54321,
-                'date': '2016-10-24T09:00:00Z',
-                'is_buy': False,
-                'journal_ref_id': 67890,
-                'location_id': 60014719,
-                'quantity': 10,
-                'transaction_id': 1234567891,
-                'type_id': 587,
-                'unit_price': 50.0
-            }
-        ]
-        self.mock_client.get.return_value = expected_data
-        
-        result = self.endpoint.get_corporation_wallet_transactions(12345, 1, '98765', from_id=999999)
+    def test_fetch_all_corporation_wallets_async(self):
+        """Test divisions are gathered concurrently with an async client."""
+        import asyncio
+        from eveonline_api_util.async_client import AsyncESIClient
         
-        self.mock_client.get.assert_called_once_with(
-            '/corporations/12345/wallets/1/transactions/', 
-            character_id='98765', 
-            params={'from_id': 999999}
-        )
-        assert result == expected_data
-    
-    def test_get_corporation_wallet_transactions_no_from_id(self):
-        """Test getting corporation wallet transactions without from_id."""
-        expected_data = []
-        self.mock_client.get.return_value = expected_data
+        client = Mock(spec=AsyncESIClient)
+        client.get_paged.side_effect = lambda endpoint, character_id: [{'endpoint': endpoint}]
+        endpoint = WalletEndpoint(client)
         
-        result = self.endpoint.get_corporation_wallet_transactions(12345, 3, '98765')
+        result = asyncio.run(endpoint.fetch_all_corporation_wallets(98000001, '98765', divisions=[1, 2]))
         
-        self.mock_client.get.assert_called_once_with(
-            '/corporations/12345/wallets/3/transactions/', 
-            character_id='98765', 
-            params={}
-        )
-        assert result == expected_data
+        assert result == {
+            1: [{'endpoint': '/corporations/98000001/wallets/1/journal/'}],
+            2: [{'endpoint': '/corporations/98000001/wallets/2/journal/'}],
+        }
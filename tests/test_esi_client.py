@@ -3,7 +3,15 @@ Tests for ESI Client functionality
 """
 
 from unittest.mock import Mock, patch, MagicMock
+import gzip
 import json
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import formatdate
 
 import pytest
 import requests
@@ -11,272 +19,307 @@ import responses
 
 from eveonline_api_util.esi_client import (
     ESIClient, ESIException, ESIAuthenticationError, 
-    ESIRateLimitError, ESIServerError
+    ESIRateLimitError, ESIServerError, language_headers, ACCEPT_ENCODING
 )
-from eveonline_api_util.auth import EVEAuth
+from eveonline_api_util.cache import MemoryCache, SqliteCache
+
+
+class FakeAuth:
+    """Minimal EVEAuth stand-in exposing the one method ESIClient calls."""
+    
+    def __init__(self):
+        self.get_valid_token = Mock(return_value='test_token')
+
+
+def _response(status, body=b'', headers=None):
+    """Build a requests.Response without going through a transport."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    return response
+
+
+@pytest.fixture
+def rsps():
+    """Intercept requests made through the requests library."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def auth():
+    """Fake authenticator returning 'test_token' for any character."""
+    return FakeAuth()
+
+
+@pytest.fixture
+def client(auth):
+    """ESIClient wired to the fake authenticator."""
+    return ESIClient(auth=auth)
 
 
 class TestESIClient:
     """Test ESIClient functionality."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_auth = Mock(spec=EVEAuth)
-        self.client = ESIClient(auth=self.mock_auth)
-    
     def test_init_without_auth(self):
         """Test ESIClient initialization without auth."""
         client = ESIClient()
         assert client.auth is None
         assert client.timeout == 30
-        assert 'User-Agent' in client.session.headers
+        assert client._prepare_headers()['User-Agent'] == ESIClient.DEFAULT_USER_AGENT
     
-    def test_init_with_custom_params(self):
+    def test_init_with_custom_params(self, auth):
         """Test ESIClient initialization with custom parameters."""
         client = ESIClient(
-            auth=self.mock_auth,
+            auth=auth,
             user_agent='Custom-Agent/1.0',
             timeout=60,
             max_retries=5
         )
         
-        assert client.auth == self.mock_auth
+        assert client.auth == auth
         assert client.timeout == 60
-        assert client.session.headers['User-Agent'] == 'Custom-Agent/1.0'
+        assert client._prepare_headers()['User-Agent'] == 'Custom-Agent/1.0'
     
-    def test_build_url(self):
+    def test_init_connection_pool(self):
+        """Test the HTTPS adapter is mounted with a pool sized for concurrent use."""
+        client = ESIClient(pool_connections=8, pool_maxsize=16)
+        adapter = client.session.get_adapter('https://esi.evetech.net/latest/status/')
+        
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 16
+        assert adapter._pool_block is False
+        assert client.session.headers == dict(client._prepare_headers())
+        assert client._prepare_headers()['Accept-Encoding'] == ACCEPT_ENCODING
+    
+    def test_init_pool_sizing(self, client):
+        """Test the default pool keeps up to 64 connections to ESI."""
+        adapter = client.session.get_adapter('https://esi.evetech.net/')
+        
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+        assert adapter.poolmanager.connection_pool_kw['block'] is False
+        assert not adapter.max_retries.status_forcelist
+    
+    def test_init_accept_encoding(self):
+        """Test compressed responses are requested, with Brotli only when it can be decoded."""
+        encodings = ACCEPT_ENCODING.split(', ')
+        
+        assert encodings[0] == 'gzip'
+        assert set(encodings) <= {'gzip', 'br'}
+    
+    def test_session_created_lazily(self):
+        """Test the requests session is only built on first use and then reused."""
+        client = ESIClient()
+        assert client._session is None
+        
+        session = client.session
+        assert client.session is session
+    
+    def test_build_url(self, client):
         """Test URL building."""
         # Test with leading slash
-        url = self.client._build_url('/characters/12345/')
+        url = client._build_url('/characters/12345/')
         assert url == 'https://esi.evetech.net/latest/characters/12345/'
         
         # Test without leading slash
-        url = self.client._build_url('characters/12345/')
+        url = client._build_url('characters/12345/')
         assert url == 'https://esi.evetech.net/latest/characters/12345/'
         
         # Test with specific version
-        url = self.client._build_url('/status/', version='v1')
+        url = client._build_url('/status/', version='v1')
         assert url == 'https://esi.evetech.net/v1/status/'
     
-    def test_prepare_headers_no_auth(self):
+    def test_build_url_is_cached(self, client):
+        """Test version prefixes are formatted once and reused."""
+        client._build_url('/status/', version='v2')
+        prefix = client._version_prefixes['v2']
+        
+        client._build_url('/characters/12345/', version='v2')
+        
+        assert client._version_prefixes['v2'] is prefix
+    
+    def test_prepare_headers_no_auth(self, client):
         """Test header preparation without authentication."""
-        headers = self.client._prepare_headers()
+        headers = client._prepare_headers()
         
         expected = {
+            'User-Agent': ESIClient.DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
         assert headers == expected
+        assert headers is not ESIClient.DEFAULT_HEADERS
+        assert client._prepare_headers() is headers
+        with pytest.raises(TypeError):
+            headers['Authorization'] = 'Bearer token'
+    
+    def test_language_headers_shared(self):
+        """Test Accept-Language header dicts are built once per language."""
+        assert language_headers('de') == {'Accept-Language': 'de'}
+        assert language_headers('de') is language_headers('de')
     
-    def test_prepare_headers_with_auth(self):
+    def test_prepare_headers_with_auth(self, client, auth):
         """Test header preparation with authentication."""
-        self.mock_auth.get_valid_token.return_value = 'test_token'
+        auth.get_valid_token.return_value = 'test_token'
         
-        headers = self.client._prepare_headers(character_id='12345')
+        headers = client._prepare_headers(character_id='12345')
         
         expected = {
+            'User-Agent': ESIClient.DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Accept': 'application/json',
             'Content-Type': 'application/json',
             'Authorization': 'Bearer test_token'
         }
         assert headers == expected
-        self.mock_auth.get_valid_token.assert_called_once_with('12345')
+        auth.get_valid_token.assert_called_once_with('12345')
     
-    def test_prepare_headers_auth_failed(self):
+    def test_prepare_headers_reuses_token(self, client, auth):
+        """Test the Authorization header is cached per character until its TTL passes."""
+        auth.get_valid_token.side_effect = ['token_a', 'token_b']
+        
+        first = client._prepare_headers(character_id='12345')
+        second = client._prepare_headers(character_id='12345')
+        
+        assert first['Authorization'] == second['Authorization'] == 'Bearer token_a'
+        assert auth.get_valid_token.call_count == 1
+        
+        with patch('eveonline_api_util.esi_client.time.monotonic',
+                   return_value=time.monotonic() + ESIClient.TOKEN_CACHE_TTL + 1):
+            third = client._prepare_headers(character_id='12345')
+        
+        assert third['Authorization'] == 'Bearer token_b'
+    
+    def test_prepare_headers_auth_failed(self, client, auth):
         """Test header preparation when authentication fails."""
-        self.mock_auth.get_valid_token.return_value = None
+        auth.get_valid_token.return_value = None
         
         with pytest.raises(ESIAuthenticationError):
-            self.client._prepare_headers(character_id='12345')
+            client._prepare_headers(character_id='12345')
     
-    def test_prepare_headers_additional(self):
+    def test_prepare_headers_additional(self, client):
         """Test header preparation with additional headers."""
         additional = {'X-Custom-Header': 'test_value'}
-        headers = self.client._prepare_headers(additional_headers=additional)
+        headers = client._prepare_headers(additional_headers=additional)
         
         assert headers['X-Custom-Header'] == 'test_value'
         assert headers['Accept'] == 'application/json'
     
-    @responses.activate
-    def test_handle_response_success_json(self):
-        """Test successful JSON response handling."""
-        test_data = {'test': 'data'}
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            json=test_data,
-            status=200
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        result = self.client._handle_response(response)
-        
-        assert result == test_data
-    
-    @responses.activate
-    def test_handle_response_success_no_content(self):
-        """Test successful response with no content."""
-        responses.add(
-            responses.DELETE,
-            'https://esi.evetech.net/latest/test/',
-            status=204
-        )
-        
-        response = requests.delete('https://esi.evetech.net/latest/test/')
-        result = self.client._handle_response(response)
-        
-        assert result is None
+    @pytest.mark.parametrize("body,expected", [
+        pytest.param(b'{"test": "data"}', {'test': 'data'}, id='json'),
+        pytest.param(b'not json', 'not json', id='invalid_json'),
+    ])
+    def test_handle_response_success(self, client, body, expected):
+        """Test 200 bodies are parsed as JSON, falling back to text."""
+        assert client._handle_response(_response(200, body)) == expected
     
-    @responses.activate
-    def test_handle_response_not_modified(self):
-        """Test 304 Not Modified response."""
-        responses.add(
+    def test_handle_response_gzip(self, client, rsps):
+        """Test gzip-encoded bodies are decoded transparently before parsing."""
+        rsps.add(
             responses.GET,
             'https://esi.evetech.net/latest/test/',
-            status=304
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        result = self.client._handle_response(response)
-        
-        assert result is None
-    
-    @responses.activate
-    def test_handle_response_bad_request(self):
-        """Test 400 Bad Request response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            body='Bad request',
-            status=400
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIException, match='Bad request'):
-            self.client._handle_response(response)
-    
-    @responses.activate
-    def test_handle_response_unauthorized(self):
-        """Test 401 Unauthorized response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            status=401
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIAuthenticationError):
-            self.client._handle_response(response)
-    
-    @responses.activate
-    def test_handle_response_forbidden(self):
-        """Test 403 Forbidden response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            body='Forbidden',
-            status=403
+            body=gzip.compress(b'{"test": "data"}'),
+            headers={'Content-Encoding': 'gzip'},
+            content_type='application/json',
+            status=200
         )
         
         response = requests.get('https://esi.evetech.net/latest/test/')
         
-        with pytest.raises(ESIException, match='Forbidden'):
-            self.client._handle_response(response)
+        assert client._handle_response(response) == {'test': 'data'}
     
-    @responses.activate
-    def test_handle_response_not_found(self):
-        """Test 404 Not Found response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            status=404
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIException, match='Not found'):
-            self.client._handle_response(response)
+    def test_handle_response_uses_fast_loads(self, monkeypatch, client):
+        """Test bodies are decoded from raw bytes with the module's JSON loader."""
+        import eveonline_api_util.esi_client as esi_client
+        loads = Mock(return_value={'test': 'data'})
+        monkeypatch.setattr(esi_client, '_loads', loads)
+        
+        assert client._handle_response(_response(200, b'{"test": "data"}')) == {'test': 'data'}
+        loads.assert_called_once_with(b'{"test": "data"}')
     
-    @responses.activate
-    def test_handle_response_error_limit(self):
-        """Test 420 Error Limit response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            status=420
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIRateLimitError):
-            self.client._handle_response(response)
+    @pytest.mark.parametrize("status,body,expected", [
+        pytest.param(200, b'[1, 2]', [1, 2], id='ok'),
+        pytest.param(200, b'', None, id='empty'),
+        pytest.param(204, b'', None, id='no_content'),
+        pytest.param(304, b'', None, id='not_modified'),
+    ])
+    def test_handle_response_skips_text_decode(self, status, body, expected, client):
+        """Test successful bodies are parsed without decoding response.text."""
+        response = _response(status, body)
+        
+        with patch.object(requests.Response, 'text',
+                          new_callable=lambda: property(Mock(side_effect=AssertionError('text decoded')))):
+            assert client._handle_response(response) == expected
     
-    @responses.activate
-    def test_handle_response_rate_limit(self):
-        """Test 429 Rate Limit response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            status=429
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIRateLimitError):
-            self.client._handle_response(response)
+    @pytest.mark.parametrize("status,body,headers,exc,match,retry_after", [
+        pytest.param(400, b'Bad request', {}, ESIException, 'Bad request', None, id='bad_request'),
+        pytest.param(401, b'', {}, ESIAuthenticationError, None, None, id='unauthorized'),
+        pytest.param(403, b'Forbidden', {}, ESIException, 'Forbidden', None, id='forbidden'),
+        pytest.param(404, b'', {}, ESIException, 'Not found', None, id='not_found'),
+        pytest.param(420, b'', {'X-ESI-Error-Limit-Reset': '12'}, ESIRateLimitError, None, 12.0,
+                     id='error_limit'),
+        pytest.param(429, b'', {'Retry-After': '5'}, ESIRateLimitError, None, 5.0, id='rate_limit'),
+        pytest.param(500, b'Internal Server Error', {}, ESIServerError, None, None, id='server_error'),
+        pytest.param(418, b"I'm a teapot", {}, ESIException, 'Unexpected status code 418', None,
+                     id='unexpected_status'),
+    ])
+    def test_handle_response_errors(self, client, status, body, headers, exc, match, retry_after):
+        """Test error status codes raise the matching exception."""
+        with pytest.raises(exc, match=match) as exc_info:
+            client._handle_response(_response(status, body, headers))
+        
+        if retry_after is not None:
+            assert exc_info.value.retry_after == retry_after
     
-    @responses.activate
-    def test_handle_response_server_error(self):
-        """Test 500 Server Error response."""
-        responses.add(
-            responses.GET,
-            'https://esi.evetech.net/latest/test/',
-            body='Internal Server Error',
-            status=500
-        )
-        
-        response = requests.get('https://esi.evetech.net/latest/test/')
-        
-        with pytest.raises(ESIServerError):
-            self.client._handle_response(response)
-    
-    @responses.activate
-    def test_request_success(self):
+    def test_request_success(self, client, rsps):
         """Test successful request."""
         test_data = {'test': 'data'}
-        responses.add(
+        rsps.add(
             responses.GET,
             'https://esi.evetech.net/latest/test/',
             json=test_data,
             status=200
         )
         
-        result = self.client.request('GET', '/test/')
+        result = client.request('GET', '/test/')
         assert result == test_data
     
-    @responses.activate
-    def test_request_with_auth(self):
+    def test_request_with_auth(self, client, auth, rsps):
         """Test authenticated request."""
-        self.mock_auth.get_valid_token.return_value = 'test_token'
+        auth.get_valid_token.return_value = 'test_token'
         test_data = {'authenticated': 'data'}
         
         def request_callback(request):
             assert request.headers['Authorization'] == 'Bearer test_token'
             return (200, {}, json.dumps(test_data))
         
-        responses.add_callback(
+        rsps.add_callback(
             responses.GET,
             'https://esi.evetech.net/latest/test/',
             callback=request_callback
         )
         
-        result = self.client.request('GET', '/test/', character_id='12345')
+        result = client.request('GET', '/test/', character_id='12345')
         assert result == test_data
     
-    @responses.activate
-    def test_request_with_params(self):
+    def test_request_unauthorized_evicts_token(self, client, auth, rsps):
+        """Test a 401 drops the cached Authorization header so the next call looks it up again."""
+        auth.get_valid_token.side_effect = ['revoked_token', 'fresh_token']
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', status=401)
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', json={'ok': True})
+        
+        with pytest.raises(ESIAuthenticationError):
+            client.request('GET', '/test/', character_id='12345')
+        result = client.request('GET', '/test/', character_id='12345')
+        
+        assert result == {'ok': True}
+        assert auth.get_valid_token.call_count == 2
+        assert rsps.calls[1].request.headers['Authorization'] == 'Bearer fresh_token'
+    
+    def test_request_with_params(self, client, rsps):
         """Test request with parameters."""
         test_data = {'test': 'data'}
         
@@ -285,133 +328,532 @@ class TestESIClient:
             assert 'custom_param=value' in request.url
             return (200, {}, json.dumps(test_data))
         
-        responses.add_callback(
+        rsps.add_callback(
             responses.GET,
             'https://esi.evetech.net/latest/test/',
             callback=request_callback
         )
         
-        result = self.client.request('GET', '/test/', params={'custom_param': 'value'})
+        result = client.request('GET', '/test/', params={'custom_param': 'value'})
         assert result == test_data
     
-    @responses.activate
-    def test_request_post_with_json(self):
+    def test_request_post_with_json(self, client, rsps):
         """Test POST request with JSON data."""
         test_data = {'result': 'success'}
         post_data = {'input': 'data'}
         
         def request_callback(request):
+            assert isinstance(request.body, bytes)
             assert json.loads(request.body) == post_data
+            assert request.headers['Content-Type'] == 'application/json'
             return (200, {}, json.dumps(test_data))
         
-        responses.add_callback(
+        rsps.add_callback(
             responses.POST,
             'https://esi.evetech.net/latest/test/',
             callback=request_callback
         )
         
-        result = self.client.request('POST', '/test/', json_data=post_data)
+        result = client.request('POST', '/test/', json_data=post_data)
         assert result == test_data
     
-    def test_request_timeout(self):
+    def test_request_timeout(self, client):
         """Test request timeout handling."""
-        with patch.object(self.client.session, 'request') as mock_request:
+        with patch.object(client.session, 'request') as mock_request:
             mock_request.side_effect = requests.exceptions.Timeout()
             
             with pytest.raises(ESIException, match='Request timeout'):
-                self.client.request('GET', '/test/')
+                client.request('GET', '/test/')
     
-    def test_request_connection_error(self):
+    def test_request_connection_error(self, client):
         """Test connection error handling."""
-        with patch.object(self.client.session, 'request') as mock_request:
+        with patch.object(client.session, 'request') as mock_request:
             mock_request.side_effect = requests.exceptions.ConnectionError()
             
             with pytest.raises(ESIException, match='Connection error'):
-                self.client.request('GET', '/test/')
+                client.request('GET', '/test/')
     
-    @responses.activate
-    def test_get_method(self):
+    def test_get_method(self, client, rsps):
         """Test GET convenience method."""
         test_data = {'test': 'data'}
-        responses.add(
+        rsps.add(
             responses.GET,
             'https://esi.evetech.net/latest/test/',
             json=test_data,
             status=200
         )
         
-        result = self.client.get('/test/')
+        result = client.get('/test/')
         assert result == test_data
     
-    @responses.activate
-    def test_post_method(self):
+    def test_post_method(self, client, rsps):
         """Test POST convenience method."""
         test_data = {'result': 'success'}
-        responses.add(
+        rsps.add(
             responses.POST,
             'https://esi.evetech.net/latest/test/',
             json=test_data,
             status=200
         )
         
-        result = self.client.post('/test/', json_data={'input': 'data'})
+        result = client.post('/test/', json_data={'input': 'data'})
         assert result == test_data
     
-    @responses.activate
-    def test_put_method(self):
+    def test_put_method(self, client, rsps):
         """Test PUT convenience method."""
-        responses.add(
+        rsps.add(
             responses.PUT,
             'https://esi.evetech.net/latest/test/',
             status=204
         )
         
-        result = self.client.put('/test/', json_data={'update': 'data'})
+        result = client.put('/test/', json_data={'update': 'data'})
         assert result is None
     
-    @responses.activate
-    def test_delete_method(self):
+    def test_delete_method(self, client, rsps):
         """Test DELETE convenience method."""
-        responses.add(
+        rsps.add(
             responses.DELETE,
             'https://esi.evetech.net/latest/test/',
             status=204
         )
         
-        result = self.client.delete('/test/')
+        result = client.delete('/test/')
         assert result is None
     
-    @responses.activate
-    def test_get_server_status(self):
+    def test_get_server_status(self, client, rsps):
         """Test server status endpoint."""
         status_data = {
             'players': 12345,
             'server_version': '1.0.0',
             'start_time': '2023-01-01T00:00:00Z'
         }
-        responses.add(
+        rsps.add(
             responses.GET,
             'https://esi.evetech.net/latest/status/',
             json=status_data,
             status=200
         )
         
-        result = self.client.get_server_status()
+        result = client.get_server_status()
         assert result == status_data
     
-    @responses.activate
-    def test_get_universe_types(self):
+    def test_get_universe_types(self, client, rsps):
         """Test universe types endpoint."""
         type_data = [
             {'id': 34, 'name': 'Tritanium'},
             {'id': 35, 'name': 'Pyerite'}
         ]
-        responses.add(
+        rsps.add(
             responses.POST,
             'https://esi.evetech.net/latest/universe/names/',
             json=type_data,
             status=200
         )
         
-        result = self.client.get_universe_types([34, 35])
+        result = client.get_universe_types([34, 35])
         assert result == type_data
+    
+    def test_get_universe_types_single_batch_empty(self, client, rsps):
+        """Test a single batch with no response body still returns a list."""
+        rsps.add(responses.POST, 'https://esi.evetech.net/latest/universe/names/', status=204)
+        
+        assert client.get_universe_types([34]) == []
+        assert len(rsps.calls) == 1
+    
+    def test_get_universe_types_batches(self, client, rsps):
+        """Test long ID lists are split into NAMES_BATCH_SIZE requests."""
+        rsps.add_callback(
+            responses.POST,
+            'https://esi.evetech.net/latest/universe/names/',
+            callback=lambda request: (200, {}, json.dumps(
+                [{'id': i, 'name': f'Item {i}'} for i in json.loads(request.body)]
+            ))
+        )
+        
+        result = client.get_universe_types(list(range(2500)))
+        
+        assert [r['id'] for r in result] == list(range(2500))
+        assert sorted(len(json.loads(c.request.body)) for c in rsps.calls) == [500, 1000, 1000]
+    
+    def test_iter_universe_types_streams(self, client, rsps):
+        """Test batches are only posted as the iterator is consumed."""
+        rsps.add_callback(
+            responses.POST,
+            'https://esi.evetech.net/latest/universe/names/',
+            callback=lambda request: (200, {}, json.dumps(
+                [{'id': i} for i in json.loads(request.body)]
+            ))
+        )
+        
+        types = client.iter_universe_types(list(range(2500)))
+        assert len(rsps.calls) == 0
+        
+        assert next(types) == {'id': 0}
+        assert len(rsps.calls) == 1
+        
+        assert [r['id'] for r in types] == list(range(1, 2500))
+        assert len(rsps.calls) == 3
+    
+    def test_get_single_flight(self, rsps):
+        """Test concurrent identical GETs share a single request."""
+        client = ESIClient(cache=None)
+        started, release = threading.Event(), threading.Event()
+        waiting = []
+        
+        class CountingFuture(Future):
+            def result(self, timeout=None):
+                waiting.append(self)
+                return super().result(timeout)
+        
+        def status(request):
+            started.set()
+            release.wait(5)
+            return 200, {}, json.dumps({'players': 1})
+        
+        rsps.add_callback(responses.GET, 'https://esi.evetech.net/latest/status/', callback=status)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get('/status/')))
+                   for _ in range(5)]
+        
+        with patch('eveonline_api_util.esi_client.Future', CountingFuture):
+            threads[0].start()
+            assert started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            deadline = time.monotonic() + 5
+            while len(waiting) < 4 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        
+        assert len(rsps.calls) == 1
+        assert results == [{'players': 1}] * 5
+        assert client._inflight == {}
+    
+    def test_cache_serves_fresh_response(self, rsps):
+        """Test fresh cached responses skip the network."""
+        client = ESIClient(cache=MemoryCache())
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/industry/systems/',
+            json=[{'solar_system_id': 30000142}],
+            status=200,
+            headers={'Cache-Control': 'public, max-age=3600', 'ETag': '"abc"'}
+        )
+        
+        first = client.get('/industry/systems/')
+        second = client.get('/industry/systems/')
+        
+        assert first == second == [{'solar_system_id': 30000142}]
+        assert len(rsps.calls) == 1
+    
+    def test_cache_revalidates_with_etag(self, rsps):
+        """Test expired cache entries are revalidated with If-None-Match by default."""
+        client = ESIClient()
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/markets/prices/',
+            json=[{'type_id': 34, 'average_price': 5.0}],
+            status=200,
+            headers={'ETag': '"v1"'}
+        )
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/markets/prices/',
+            status=304
+        )
+        
+        first = client.get('/markets/prices/')
+        second = client.get('/markets/prices/')
+        
+        assert second == first
+        assert rsps.calls[1].request.headers['If-None-Match'] == '"v1"'
+    
+    def test_cache_disabled(self, rsps):
+        """Test caching can be turned off."""
+        client = ESIClient(cache=None)
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/markets/prices/',
+            json=[],
+            status=200,
+            headers={'Cache-Control': 'max-age=3600', 'ETag': '"v1"'}
+        )
+        
+        client.get('/markets/prices/')
+        client.get('/markets/prices/')
+        
+        assert client.cache is None
+        assert len(rsps.calls) == 2
+        assert 'If-None-Match' not in rsps.calls[1].request.headers
+    
+    def test_cache_skips_authenticated_requests(self, auth, rsps):
+        """Test authenticated GETs are never cached."""
+        auth.get_valid_token.return_value = 'test_token'
+        client = ESIClient(auth=auth, cache=MemoryCache())
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/characters/12345/wallet/',
+            json=100.0,
+            status=200,
+            headers={'Cache-Control': 'max-age=120'}
+        )
+        
+        client.get('/characters/12345/wallet/', character_id='12345')
+        client.get('/characters/12345/wallet/', character_id='12345')
+        
+        assert len(rsps.calls) == 2
+    
+    def test_sqlite_cache_shared_between_clients(self, tmp_path, rsps):
+        """Test a second client reuses entries written by the first."""
+        path = str(tmp_path / 'esi_cache.sqlite3')
+        rsps.add(
+            responses.GET,
+            'https://esi.evetech.net/latest/sovereignty/map/',
+            json=[{'system_id': 30000001}],
+            status=200,
+            headers={'Cache-Control': 'max-age=3600'}
+        )
+        
+        ESIClient(cache=SqliteCache(path)).get('/sovereignty/map/')
+        result = ESIClient(cache=SqliteCache(path)).get('/sovereignty/map/')
+        
+        assert result == [{'system_id': 30000001}]
+        assert len(rsps.calls) == 1
+    
+    def test_static_cache_routes_universe_endpoints(self, tmp_path, rsps):
+        """Test static universe data goes to static_cache and other data to the response cache."""
+        static = SqliteCache(str(tmp_path / 'static.sqlite3'))
+        client = ESIClient(cache=MemoryCache(), static_cache=static)
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/universe/races/',
+                 json=[{'race_id': 1}], headers={'Cache-Control': 'max-age=3600'})
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/markets/prices/',
+                 json=[], headers={'Cache-Control': 'max-age=3600'})
+        
+        client.get('/universe/races/')
+        client.get('/markets/prices/')
+        
+        assert len(client.cache) == 1
+        assert ESIClient(cache=None, static_cache=static).get('/universe/races/') == [{'race_id': 1}]
+        assert len(rsps.calls) == 2
+    
+    def test_close_closes_owned_static_cache(self, tmp_path, monkeypatch):
+        """Test close() closes a static cache the client opened but not a caller-supplied one."""
+        monkeypatch.setattr(ESIClient, 'STATIC_CACHE_PATH', str(tmp_path / 'static.sqlite3'))
+        owned = ESIClient(static_cache=True)
+        supplied = SqliteCache(str(tmp_path / 'supplied.sqlite3'))
+        
+        owned.close()
+        ESIClient(static_cache=supplied).close()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            owned.static_cache.get('key')
+        assert supplied.get('key') is None
+        supplied.close()
+    
+    def test_request_with_query_string_params(self, client, rsps):
+        """Test request with a pre-encoded query string."""
+        def request_callback(request):
+            assert request.url.endswith('/test/?datasource=tranquility&include_completed=false&page=2')
+            return (200, {}, json.dumps([]))
+        
+        rsps.add_callback(
+            responses.GET,
+            'https://esi.evetech.net/latest/test/',
+            callback=request_callback
+        )
+        
+        assert client.request('GET', '/test/', params='include_completed=false&page=2') == []
+    
+    @patch('eveonline_api_util.esi_client.time.sleep')
+    def test_request_retries_with_backoff(self, mock_sleep, client, rsps):
+        """Test throttled responses are retried with exponential backoff."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', status=503)
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', status=504)
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', json={'ok': True}, status=200)
+        
+        with patch('eveonline_api_util.esi_client.random.random', return_value=0.0):
+            result = client.get('/test/')
+        
+        assert result == {'ok': True}
+        assert len(rsps.calls) == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+    
+    @patch('eveonline_api_util.esi_client.time.sleep')
+    def test_request_honors_retry_after(self, mock_sleep, client, rsps):
+        """Test Retry-After overrides the computed backoff."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/',
+                 status=429, headers={'Retry-After': '7'})
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', json=[], status=200)
+        
+        with patch('eveonline_api_util.esi_client.random.random', return_value=0.5):
+            client.get('/test/')
+        
+        mock_sleep.assert_called_once_with(7.5)
+    
+    @pytest.mark.parametrize("retry_after,expected", [
+        pytest.param('7', 7.0, id='seconds'),
+        pytest.param('86400', ESIClient.MAX_BACKOFF, id='capped'),
+        pytest.param('-5', 0.0, id='negative'),
+        pytest.param(formatdate(1700000030, usegmt=True), 30.0, id='http_date'),
+        pytest.param('soon', 2.0, id='unparsable'),
+    ])
+    def test_retry_delay_from_retry_after(self, client, retry_after, expected):
+        """Test Retry-After seconds and HTTP dates are honored and capped at MAX_BACKOFF."""
+        response = _response(429, headers={'Retry-After': retry_after})
+        
+        with patch('eveonline_api_util.esi_client.random.random', return_value=0.0), \
+                patch('eveonline_api_util.esi_client.time.time', return_value=1700000000.0):
+            delay = client._retry_delay(response, attempt=1)
+        
+        assert delay == expected
+    
+    @patch('eveonline_api_util.esi_client.time.sleep')
+    def test_request_gives_up_after_max_retries(self, mock_sleep, rsps):
+        """Test the last error response is raised once retries are exhausted."""
+        client = ESIClient(max_retries=2)
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', status=502)
+        
+        with pytest.raises(ESIServerError):
+            client.get('/test/')
+        
+        assert len(rsps.calls) == 3
+        assert mock_sleep.call_count == 2
+    
+    @patch('eveonline_api_util.esi_client.time.sleep')
+    def test_request_returns_without_sleeping_below_error_floor(self, mock_sleep, client, rsps):
+        """Test a completed response is returned at once; only the next send is held back."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/test/', json={}, status=200,
+                 headers={'X-ESI-Error-Limit-Remain': '19', 'X-ESI-Error-Limit-Reset': '12'})
+        
+        assert client.get('/test/') == {}
+        
+        mock_sleep.assert_not_called()
+        assert 11 < client._error_budget_delay() <= 12
+    
+    def test_error_budget_at_floor_not_throttled(self, client):
+        """Test requests are only held back once fewer than ERROR_LIMIT_FLOOR errors remain."""
+        client._record_error_limit(_response(200, headers={
+            'X-ESI-Error-Limit-Remain': str(ESIClient.ERROR_LIMIT_FLOOR),
+            'X-ESI-Error-Limit-Reset': '30'}))
+        
+        assert client._error_budget_delay() == 0
+    
+    def test_get_paged_fetches_all_pages(self, client, rsps):
+        """Test get_paged reads X-Pages and concatenates every page in order."""
+        url = 'https://esi.evetech.net/latest/universe/types/'
+        for page in (1, 2, 3):
+            rsps.add(responses.GET, url, json=[page * 10, page * 10 + 1],
+                     headers={'X-Pages': '3'},
+                     match=[responses.matchers.query_param_matcher(
+                         {'datasource': 'tranquility', 'page': str(page)})])
+        
+        result = client.get_paged('/universe/types/', params={'page': 5})
+        
+        assert result == [10, 11, 20, 21, 30, 31]
+        assert len(rsps.calls) == 3
+    
+    def test_get_paged_single_page(self, client, rsps):
+        """Test get_paged makes one request when X-Pages is absent."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/universe/groups/', json=[1, 2])
+        
+        assert client.get_paged('/universe/groups/') == [1, 2]
+        assert len(rsps.calls) == 1
+    
+    def test_get_id_array(self, client, rsps):
+        """Test list-of-int endpoints can be returned as a packed int64 array."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/universe/systems/',
+                 json=[30000142, 30002187])
+        
+        ids = client.get_id_array('/universe/systems/')
+        
+        assert ids.typecode == 'q'
+        assert list(ids) == [30000142, 30002187]
+    
+    @pytest.mark.parametrize('simdjson_module', [None, 'installed'])
+    def test_parse_id_array(self, simdjson_module):
+        """Test ID arrays parse the same with and without pysimdjson."""
+        if simdjson_module is None:
+            with patch.dict(sys.modules, {'simdjson': None}):
+                ids = ESIClient._parse_id_array(b'[1, 2, 3]')
+        else:
+            pytest.importorskip('simdjson')
+            ids = ESIClient._parse_id_array(b'[1, 2, 3]')
+        
+        assert list(ids) == [1, 2, 3]
+        assert list(ESIClient._parse_id_array(b'')) == []
+    
+    def test_httpx_transport(self):
+        """Test requests are sent through httpx when the HTTP/2 transport is selected."""
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={'players': 1}, headers={'X-Pages': '1'})
+        
+        client = ESIClient(transport='httpx', cache=None)
+        assert client.transport == 'httpx'
+        client._httpx_client = httpx.Client(transport=httpx.MockTransport(handler))
+        
+        assert client.get('/status/') == {'players': 1}
+        assert str(seen[0].url) == 'https://esi.evetech.net/latest/status/?datasource=tranquility'
+        client.close()
+    
+    def test_httpx_transport_pool(self):
+        """Test the httpx transport negotiates HTTP/2 over one shared, bounded pool."""
+        pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        client = ESIClient(transport='httpx', pool_maxsize=16)
+        pool = client._httpx_client._transport._pool
+        
+        assert pool._http2 is True
+        assert pool._max_connections == 16
+        assert pool._max_keepalive_connections == 16
+        client.close()
+    
+    def test_unsupported_transport(self):
+        """Test unknown transports are rejected."""
+        with pytest.raises(ValueError):
+            ESIClient(transport='carrier-pigeon')
+    
+    @patch('eveonline_api_util.esi_client.time.sleep')
+    def test_request_waits_for_exhausted_error_budget(self, mock_sleep, client, rsps):
+        """Test later requests are held back while the error budget is nearly spent."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/first/', json={}, status=200,
+                 headers={'X-ESI-Error-Limit-Remain': '3', 'X-ESI-Error-Limit-Reset': '30'})
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/second/', json={}, status=200,
+                 headers={'X-ESI-Error-Limit-Remain': '100', 'X-ESI-Error-Limit-Reset': '30'})
+        
+        client.get('/first/')
+        client.get('/second/')
+        
+        # The first response is returned at once; the second request waits before sending
+        assert mock_sleep.call_count == 1
+        assert 29 < mock_sleep.call_args.args[0] <= 30
+        assert client._error_budget_delay() == 0
+    
+    def test_request_sends_full_headers(self, rsps):
+        """Test unauthenticated requests send the client headers from the session defaults."""
+        rsps.add(responses.GET, 'https://esi.evetech.net/latest/status/', json={})
+        client = ESIClient(user_agent='Custom-Agent/1.0', cache=None)
+        
+        with patch.object(client.session, 'request', wraps=client.session.request) as spy:
+            client.get('/status/')
+        
+        assert spy.call_args.kwargs['headers'] is None
+        sent = rsps.calls[0].request.headers
+        assert sent['User-Agent'] == 'Custom-Agent/1.0'
+        assert sent['Accept'] == 'application/json'
+        assert sent['Accept-Encoding'] == ACCEPT_ENCODING
+    
+    def test_package_import_skips_optional_transports(self):
+        """Test importing the package does not load aiohttp, httpx or simdjson."""
+        code = ("import sys, eveonline_api_util; "
+                "print(sorted(m for m in ('aiohttp', 'httpx', 'simdjson') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == '[]'